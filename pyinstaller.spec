@@ -48,6 +48,11 @@ a = Analysis(
         'annotated_types',
         # DuckDB
         'duckdb',
+        # IDE launcher generators (imported lazily by drspec.core.ide)
+        'drspec.core.ide.cursor',
+        'drspec.core.ide.claude_code',
+        'drspec.core.ide.github_copilot',
+        'drspec.core.ide.codex',
         # Standard library modules that may be missed
         'typing_extensions',
     ],
@@ -2,7 +2,11 @@
 
 from __future__ import annotations
 
+import multiprocessing
+
 from drspec.cli.app import app
 
 if __name__ == "__main__":
+    # Needed for parallel scans in PyInstaller-frozen executables
+    multiprocessing.freeze_support()
     app()
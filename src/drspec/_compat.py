@@ -0,0 +1,12 @@
+"""Compatibility helpers for the supported Python versions.
+
+This module is internal to drspec; nothing here is part of the public API.
+"""
+
+from __future__ import annotations
+
+import sys
+
+# dataclass(slots=True) needs Python 3.10+; older versions keep __dict__.
+# Usage: @dataclass(**DATACLASS_SLOTS)
+DATACLASS_SLOTS: dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
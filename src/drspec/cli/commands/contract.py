@@ -17,12 +17,15 @@ from drspec.db import (
     get_connection,
     get_contract,
     insert_contract,
+    insert_dependencies,
     insert_reasoning_trace,
-    list_artifacts,
+    insert_reasoning_traces,
+    list_artifact_names,
     update_artifact_status,
 )
 from drspec.db.queries import (
     calculate_confidence_with_findings,
+    get_vision_finding_penalties,
     get_vision_findings,
 )
 
@@ -56,20 +59,20 @@ def find_similar_functions(
         func_name = function_id
 
     # Search for functions with matching name
-    artifacts = list_artifacts(conn, limit=500)
-    for artifact in artifacts:
-        if func_name.lower() in artifact.function_name.lower():
-            suggestions.append(artifact.function_id)
+    artifacts = list_artifact_names(conn, limit=500)
+    for artifact_id, artifact_name, _ in artifacts:
+        if func_name.lower() in artifact_name.lower():
+            suggestions.append(artifact_id)
             if len(suggestions) >= limit:
                 break
 
     # If we didn't find enough, also look for partial path matches
     if len(suggestions) < limit and "::" in function_id:
         filepath, _ = function_id.split("::", 1)
-        for artifact in artifacts:
-            if artifact.function_id not in suggestions:
-                if filepath.lower() in artifact.file_path.lower():
-                    suggestions.append(artifact.function_id)
+        for artifact_id, _, artifact_path in artifacts:
+            if artifact_id not in suggestions:
+                if filepath.lower() in artifact_path.lower():
+                    suggestions.append(artifact_id)
                     if len(suggestions) >= limit:
                         break
 
@@ -414,11 +417,7 @@ def save(
             )
 
         # Restore reasoning traces
-        for rt_row in reasoning_traces_rows:
-            conn.execute(
-                "INSERT INTO reasoning_traces (function_id, agent, trace_json, created_at) VALUES (?, ?, ?, ?)",
-                [function_id, rt_row[0], rt_row[1], rt_row[2]]
-            )
+        insert_reasoning_traces(conn, [(function_id, *rt_row) for rt_row in reasoning_traces_rows])
 
         # Restore vision findings
         for vf_row in vision_findings_rows:
@@ -432,16 +431,11 @@ def save(
             )
 
         # Restore dependencies
-        for dep_row in deps_as_caller:
-            conn.execute(
-                "INSERT INTO dependencies (caller_id, callee_id, created_at) VALUES (?, ?, ?)",
-                [function_id, dep_row[0], dep_row[1]]
-            )
-        for dep_row in deps_as_callee:
-            conn.execute(
-                "INSERT INTO dependencies (caller_id, callee_id, created_at) VALUES (?, ?, ?)",
-                [dep_row[0], function_id, dep_row[1]]
-            )
+        insert_dependencies(
+            conn,
+            [(function_id, callee_id, created_at) for callee_id, created_at in deps_as_caller]
+            + [(caller_id, function_id, created_at) for caller_id, created_at in deps_as_callee],
+        )
 
         # Store reasoning trace if provided
         if trace:
@@ -610,6 +604,9 @@ def list_contracts(
 
         rows = conn.execute(query_sql, params).fetchall()
 
+        # Unresolved vision finding penalties for the whole page in one query
+        penalties = get_vision_finding_penalties(conn, [row[0] for row in rows])
+
         # Build contract summaries
         contracts = []
         for row in rows:
@@ -631,10 +628,9 @@ def list_contracts(
             else:
                 base_confidence = int(raw_confidence * 100)  # Convert 0.0-1.0 to 0-100
 
-            # Get vision findings for this function and calculate adjusted confidence
-            findings = get_vision_findings(conn, func_id)
-            adjusted_confidence = calculate_confidence_with_findings(base_confidence, findings)
-            active_findings = sum(1 for f in findings if f.status == "NEW")
+            # Adjust confidence for this function's unresolved vision findings
+            penalty, active_findings = penalties.get(func_id, (0, 0))
+            adjusted_confidence = max(0, base_confidence - penalty)
             vision_penalty = base_confidence - adjusted_confidence
 
             contracts.append({
@@ -14,7 +14,7 @@ from drspec.db import (
     get_callees,
     get_callers,
     get_connection,
-    list_artifacts,
+    list_artifact_names,
 )
 
 app = typer.Typer(
@@ -146,15 +146,15 @@ def _find_similar_functions(conn: Any, function_id: str, limit: int = 5) -> list
         func_name = function_id
 
     # Get all artifacts and find similar names
-    artifacts = list_artifacts(conn, limit=1000)
+    artifacts = list_artifact_names(conn, limit=1000)
 
     # Simple substring matching
     similar = []
-    for artifact in artifacts:
-        if func_name.lower() in artifact.function_name.lower():
-            similar.append(artifact.function_id)
-        elif artifact.function_name.lower() in func_name.lower():
-            similar.append(artifact.function_id)
+    for artifact_id, artifact_name, _ in artifacts:
+        if func_name.lower() in artifact_name.lower():
+            similar.append(artifact_id)
+        elif artifact_name.lower() in func_name.lower():
+            similar.append(artifact_id)
 
     return similar[:limit]
 
@@ -201,8 +201,7 @@ def setup_ide_integrations(
     Returns:
         Dictionary with IDE integration results.
     """
-    from drspec.core.ide import IDE_REGISTRY
-    from drspec.core.ide.codex import CodexSetup
+    from drspec.core.ide import get_ide_setup_class
 
     results = {}
 
@@ -210,9 +209,11 @@ def setup_ide_integrations(
         if ide_name in selected_ides:
             # Special handling for Codex global install
             if ide_name == "codex":
+                from drspec.core.ide.codex import CodexSetup
+
                 setup = CodexSetup(global_install=codex_global)
             else:
-                setup_class = IDE_REGISTRY.get(ide_name)
+                setup_class = get_ide_setup_class(ide_name)
                 if setup_class is None:
                     results[ide_name] = {"enabled": False, "error": "Unknown IDE"}
                     continue
@@ -3,19 +3,19 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
 import typer
 
 from drspec.cli.output import ErrorCode, error_response, output, success_response
 from drspec.core import (
+    ScannedFunction,
     Scanner,
     compute_hash,
 )
 from drspec.db import (
-    get_artifact,
     get_connection,
-    insert_artifact,
+    insert_artifacts_bulk,
     queue_push,
 )
 
@@ -25,6 +25,9 @@ app = typer.Typer(
     no_args_is_help=False,
 )
 
+# Scanned functions buffered before each batched artifact write
+_STORE_BATCH_SIZE = 500
+
 
 @app.callback(invoke_without_command=True)
 def scan_command(
@@ -43,6 +46,13 @@ def scan_command(
         "--queue/--no-queue",
         help="Add changed/new functions to the processing queue",
     ),
+    jobs: int = typer.Option(
+        1,
+        "--jobs",
+        "-j",
+        min=0,
+        help="Parallel parser processes for directory scans (0 = one per CPU)",
+    ),
 ) -> None:
     """Scan source files and add functions to the artifacts table.
 
@@ -55,6 +65,7 @@ def scan_command(
         drspec scan ./src              # Scan specific directory
         drspec scan ./src/module.py    # Scan single file
         drspec scan --no-queue         # Scan without queueing
+        drspec scan -j 0               # Parse with one process per CPU
     """
     # Get CLI context
     cli_ctx = ctx.obj or {}
@@ -108,48 +119,28 @@ def scan_command(
 
         # Track statistics
         files_scanned = 0
-        functions_found = 0
-        functions_new = 0
-        functions_changed = 0
-        functions_unchanged = 0
+        counts = {"new": 0, "changed": 0, "unchanged": 0}
         errors: list[dict] = []
 
+        pending: list[ScannedFunction] = []
+
+        def store(func: ScannedFunction) -> None:
+            pending.append(func)
+            if len(pending) >= _STORE_BATCH_SIZE:
+                flush()
+
+        def flush() -> None:
+            for outcome in _store_functions(conn, pending, queue_new):
+                counts[outcome] += 1
+            pending.clear()
+
         # Scan path
         if scan_path.is_file():
             # Scan single file
             result = scanner.scan_file(str(scan_path))
             if result:
                 files_scanned = 1
-                for func in result.functions:
-                    functions_found += 1
-                    code_hash = compute_hash(func.body, func.language)
-                    # Check if artifact exists before inserting
-                    existing = get_artifact(conn, func.function_id)
-                    is_new = existing is None
-                    changed = insert_artifact(
-                        conn,
-                        function_id=func.function_id,
-                        file_path=func.file_path,
-                        function_name=func.name,
-                        signature=func.signature,
-                        body=func.body,
-                        code_hash=code_hash,
-                        language=func.language,
-                        start_line=func.start_line,
-                        end_line=func.end_line,
-                        parent=func.parent,
-                    )
-                    if changed:
-                        if is_new:
-                            functions_new += 1
-                            if queue_new:
-                                queue_push(conn, func.function_id, reason="NEW")
-                        else:
-                            functions_changed += 1
-                            if queue_new:
-                                queue_push(conn, func.function_id, reason="HASH_MISMATCH")
-                    else:
-                        functions_unchanged += 1
+                pending.extend(result.functions)
                 for err in result.errors:
                     errors.append({
                         "file": str(scan_path),
@@ -157,44 +148,15 @@ def scan_command(
                         "message": err.message,
                     })
         else:
-            # Scan directory
-            result = scanner.scan_directory(
+            # Scan directory, buffering functions for batched writes as files are parsed
+            result = scanner.scan_directory_streaming(
                 str(scan_path),
+                store,
                 recursive=recursive,
+                max_workers=jobs or None,
             )
             files_scanned = result.files_scanned
 
-            for func in result.functions:
-                functions_found += 1
-                code_hash = compute_hash(func.body, func.language)
-                # Check if artifact exists before inserting
-                existing = get_artifact(conn, func.function_id)
-                is_new = existing is None
-                changed = insert_artifact(
-                    conn,
-                    function_id=func.function_id,
-                    file_path=func.file_path,
-                    function_name=func.name,
-                    signature=func.signature,
-                    body=func.body,
-                    code_hash=code_hash,
-                    language=func.language,
-                    start_line=func.start_line,
-                    end_line=func.end_line,
-                    parent=func.parent,
-                )
-                if changed:
-                    if is_new:
-                        functions_new += 1
-                        if queue_new:
-                            queue_push(conn, func.function_id, reason="NEW")
-                    else:
-                        functions_changed += 1
-                        if queue_new:
-                            queue_push(conn, func.function_id, reason="HASH_MISMATCH")
-                else:
-                    functions_unchanged += 1
-
             for err in result.errors:
                 # result.errors is list[tuple[str, str]] - (file_path, error_message)
                 if isinstance(err, tuple) and len(err) >= 2:
@@ -208,6 +170,14 @@ def scan_command(
                         "message": str(err),
                     })
 
+        # Store any functions still buffered
+        flush()
+
+        functions_new = counts["new"]
+        functions_changed = counts["changed"]
+        functions_unchanged = counts["unchanged"]
+        functions_found = functions_new + functions_changed + functions_unchanged
+
         # Build response
         data = {
             "message": f"Scanned {files_scanned} file(s), found {functions_found} function(s)",
@@ -238,3 +208,45 @@ def scan_command(
         raise typer.Exit(1)
     finally:
         conn.close()
+
+
+def _store_functions(
+    conn: Any,
+    funcs: list[ScannedFunction],
+    queue_new: bool,
+) -> list[str]:
+    """Insert or update a batch of scanned functions and queue them if needed.
+
+    Args:
+        conn: Database connection.
+        funcs: Scanned functions to store.
+        queue_new: If True, queue new and changed functions.
+
+    Returns:
+        "new", "changed" or "unchanged" for each function, in order.
+    """
+    outcomes = insert_artifacts_bulk(
+        conn,
+        (
+            (
+                func.function_id,
+                func.file_path,
+                func.name,
+                func.signature,
+                func.body,
+                compute_hash(func.body, func.language),
+                func.language,
+                func.start_line,
+                func.end_line,
+                func.parent,
+            )
+            for func in funcs
+        ),
+    )
+    if queue_new:
+        for func, outcome in zip(funcs, outcomes):
+            if outcome == "new":
+                queue_push(conn, func.function_id, reason="NEW")
+            elif outcome == "changed":
+                queue_push(conn, func.function_id, reason="HASH_MISMATCH")
+    return outcomes
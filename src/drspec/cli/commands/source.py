@@ -9,7 +9,7 @@ import typer
 from drspec.cli.output import ErrorCode, error_response, output, success_response
 from drspec.cli.validators import validate_function_id
 from drspec.core.hints import extract_hints_simple
-from drspec.db import get_artifact, get_connection, list_artifacts
+from drspec.db import get_artifact, get_connection, list_artifact_names
 
 app = typer.Typer(
     name="source",
@@ -41,20 +41,20 @@ def find_similar_functions(
         func_name = function_id
 
     # Search for functions with matching name
-    artifacts = list_artifacts(conn, limit=500)
-    for artifact in artifacts:
-        if func_name.lower() in artifact.function_name.lower():
-            suggestions.append(artifact.function_id)
+    artifacts = list_artifact_names(conn, limit=500)
+    for artifact_id, artifact_name, _ in artifacts:
+        if func_name.lower() in artifact_name.lower():
+            suggestions.append(artifact_id)
             if len(suggestions) >= limit:
                 break
 
     # If we didn't find enough, also look for partial path matches
     if len(suggestions) < limit and "::" in function_id:
         filepath, _ = function_id.split("::", 1)
-        for artifact in artifacts:
-            if artifact.function_id not in suggestions:
-                if filepath.lower() in artifact.file_path.lower():
-                    suggestions.append(artifact.function_id)
+        for artifact_id, _, artifact_path in artifacts:
+            if artifact_id not in suggestions:
+                if filepath.lower() in artifact_path.lower():
+                    suggestions.append(artifact_id)
                     if len(suggestions) >= limit:
                         break
 
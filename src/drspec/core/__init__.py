@@ -28,7 +28,10 @@ from drspec.core.status import (
     mark_pending,
     get_file_status_summary,
     get_language_status_summary,
+    get_all_file_status_summaries,
+    get_all_language_status_summaries,
     bulk_update_status,
+    bulk_update_statuses,
     reset_stale_to_pending,
     reset_broken_to_pending,
 )
@@ -79,7 +82,10 @@ __all__ = [
     "mark_pending",
     "get_file_status_summary",
     "get_language_status_summary",
+    "get_all_file_status_summaries",
+    "get_all_language_status_summaries",
     "bulk_update_status",
+    "bulk_update_statuses",
     "reset_stale_to_pending",
     "reset_broken_to_pending",
     # Hints
@@ -8,7 +8,6 @@ ensuring that semantically identical code produces the same hash.
 from __future__ import annotations
 
 import hashlib
-import re
 from typing import Callable
 
 
@@ -53,23 +52,17 @@ def normalize_code(body: str, language: str) -> str:
     # 1. Remove comments
     code = remove_comments(body)
 
-    # 2. Split into lines
-    lines = code.split("\n")
-
-    # 3. Strip whitespace from each line and collapse internal whitespace
+    # 2-4. Strip each line, collapse internal whitespace, drop empty lines.
+    # str.split() with no arguments splits on runs of Unicode whitespace and
+    # discards empty fields, matching strip() + re.sub(r"\s+", " ") exactly.
     normalized_lines = []
-    for line in lines:
-        # Strip leading/trailing whitespace
-        stripped = line.strip()
-        # Collapse multiple whitespace to single space
-        stripped = re.sub(r"\s+", " ", stripped)
-        normalized_lines.append(stripped)
-
-    # 4. Remove empty lines
-    non_empty_lines = [line for line in normalized_lines if line]
+    for line in code.split("\n"):
+        collapsed = " ".join(line.split())
+        if collapsed:
+            normalized_lines.append(collapsed)
 
     # 5. Join with single newline
-    return "\n".join(non_empty_lines)
+    return "\n".join(normalized_lines)
 
 
 def _get_comment_remover(language: str) -> Callable[[str], str]:
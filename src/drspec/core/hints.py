@@ -67,42 +67,35 @@ PYTHON_PATTERNS = [
     ),
 ]
 
+# C-family comment patterns, compiled once and shared by JS and C++
+# Single-line comment: // @invariant: text
+_LINE_COMMENT_PATTERN = re.compile(
+    rf"//\s*@({_HINT_TYPES})[:\s]+(.+?)(?:\n|$)",
+    re.IGNORECASE,
+)
+# Block comment: /* @invariant: text */
+_BLOCK_COMMENT_PATTERN = re.compile(
+    rf"/\*\s*@({_HINT_TYPES})[:\s]+(.+?)\s*\*/",
+    re.IGNORECASE,
+)
+# JSDoc / Doxygen style: * @invariant text
+_DOC_COMMENT_PATTERN = re.compile(
+    rf"\*\s*@({_HINT_TYPES})[:\s]+(.+?)(?:\n|$)",
+    re.IGNORECASE,
+)
+
 # JavaScript/TypeScript patterns
 JS_PATTERNS = [
-    # Single-line comment: // @invariant: text
-    re.compile(
-        rf"//\s*@({_HINT_TYPES})[:\s]+(.+?)(?:\n|$)",
-        re.IGNORECASE,
-    ),
-    # Block comment: /* @invariant: text */
-    re.compile(
-        rf"/\*\s*@({_HINT_TYPES})[:\s]+(.+?)\s*\*/",
-        re.IGNORECASE,
-    ),
-    # JSDoc style: * @invariant text
-    re.compile(
-        rf"\*\s*@({_HINT_TYPES})[:\s]+(.+?)(?:\n|$)",
-        re.IGNORECASE,
-    ),
+    _LINE_COMMENT_PATTERN,
+    _BLOCK_COMMENT_PATTERN,
+    _DOC_COMMENT_PATTERN,
 ]
 
-# C++ patterns (same as JS plus some variations)
+# C++ patterns (same comment syntax as JS)
 CPP_PATTERNS = [
-    # Single-line comment: // @invariant: text
-    re.compile(
-        rf"//\s*@({_HINT_TYPES})[:\s]+(.+?)(?:\n|$)",
-        re.IGNORECASE,
-    ),
-    # Block comment: /* @invariant: text */
-    re.compile(
-        rf"/\*\s*@({_HINT_TYPES})[:\s]+(.+?)\s*\*/",
-        re.IGNORECASE,
-    ),
-    # Doxygen style: * @invariant text
-    re.compile(
-        rf"\*\s*@({_HINT_TYPES})[:\s]+(.+?)(?:\n|$)",
-        re.IGNORECASE,
-    ),
+    _LINE_COMMENT_PATTERN,
+    _BLOCK_COMMENT_PATTERN,
+    _DOC_COMMENT_PATTERN,
 ]
 
 # Language to pattern mapping
@@ -114,6 +107,9 @@ LANGUAGE_PATTERNS = {
     "c": CPP_PATTERNS,
 }
 
+# Patterns used when no language is specified
+_ALL_PATTERNS = PYTHON_PATTERNS + JS_PATTERNS
+
 
 def _normalize_hint_type(type_str: str) -> HintType:
     """Normalize hint type string to HintType enum.
@@ -164,7 +160,7 @@ def extract_hints(
         patterns = LANGUAGE_PATTERNS[language.lower()]
     else:
         # Use all patterns when language not specified
-        patterns = PYTHON_PATTERNS + JS_PATTERNS
+        patterns = _ALL_PATTERNS
 
     for i, line in enumerate(lines):
         line_num = start_line + i
@@ -1,23 +1,64 @@
-"""IDE integration module for DrSpec launcher generation."""
+"""IDE integration module for DrSpec launcher generation.
+
+IDE-specific setup classes are imported lazily on first access so that
+commands which only touch one IDE (or none) do not load every generator.
+"""
 
 from __future__ import annotations
 
-from typing import Dict, Type
+import importlib
+from typing import Any, Dict, Optional, Type
 
 from drspec.core.ide.base import BaseIdeSetup, AGENT_METADATA
-from drspec.core.ide.cursor import CursorSetup
-from drspec.core.ide.claude_code import ClaudeCodeSetup
-from drspec.core.ide.github_copilot import GitHubCopilotSetup
-from drspec.core.ide.codex import CodexSetup
-
-# Registry of available IDE setups
-IDE_REGISTRY: Dict[str, Type[BaseIdeSetup]] = {
-    "cursor": CursorSetup,
-    "claude-code": ClaudeCodeSetup,
-    "github-copilot": GitHubCopilotSetup,
-    "codex": CodexSetup,
+
+# IDE identifier -> (submodule, class name)
+_IDE_MODULES: Dict[str, tuple[str, str]] = {
+    "cursor": ("cursor", "CursorSetup"),
+    "claude-code": ("claude_code", "ClaudeCodeSetup"),
+    "github-copilot": ("github_copilot", "GitHubCopilotSetup"),
+    "codex": ("codex", "CodexSetup"),
 }
 
+# Class name -> submodule, for module-level attribute access
+_CLASS_MODULES: Dict[str, str] = {cls: mod for mod, cls in _IDE_MODULES.values()}
+
+
+def _load_class(module_name: str, class_name: str) -> Type[BaseIdeSetup]:
+    module = importlib.import_module(f"{__name__}.{module_name}")
+    return getattr(module, class_name)
+
+
+def get_ide_setup_class(ide_name: str) -> Optional[Type[BaseIdeSetup]]:
+    """Get the setup class for an IDE, importing only its module.
+
+    Args:
+        ide_name: IDE identifier (e.g., "cursor", "claude-code").
+
+    Returns:
+        Setup class, or None if the IDE is unknown.
+    """
+    entry = _IDE_MODULES.get(ide_name)
+    if entry is None:
+        return None
+    return _load_class(*entry)
+
+
+def __getattr__(name: str) -> Any:
+    if name in _CLASS_MODULES:
+        value = _load_class(_CLASS_MODULES[name], name)
+    elif name == "IDE_REGISTRY":
+        # Registry of available IDE setups
+        value = {ide: _load_class(*entry) for ide, entry in _IDE_MODULES.items()}
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(list(globals()) + list(_CLASS_MODULES) + ["IDE_REGISTRY"])
+
+
 __all__ = [
     "BaseIdeSetup",
     "AGENT_METADATA",
@@ -26,4 +67,5 @@ __all__ = [
     "GitHubCopilotSetup",
     "CodexSetup",
     "IDE_REGISTRY",
+    "get_ide_setup_class",
 ]
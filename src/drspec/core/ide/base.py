@@ -4,10 +4,10 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import TypedDict
+from typing import NamedTuple
 
 
-class AgentMetadata(TypedDict):
+class AgentMetadata(NamedTuple):
     """Metadata for an agent used in launcher generation."""
 
     name: str  # e.g., "librarian"
@@ -19,48 +19,48 @@ class AgentMetadata(TypedDict):
 
 # Agent metadata for all DrSpec agents
 AGENT_METADATA: list[AgentMetadata] = [
-    {
-        "name": "librarian",
-        "file": "librarian.md",
-        "display_name": "Librarian",
-        "persona": "Iris",
-        "description": "Codebase Navigator and Context Provider",
-    },
-    {
-        "name": "proposer",
-        "file": "proposer.md",
-        "display_name": "Proposer",
-        "persona": "Marcus",
-        "description": "Contract Proposer in the Architect Council",
-    },
-    {
-        "name": "critic",
-        "file": "critic.md",
-        "display_name": "Critic",
-        "persona": "Diana",
-        "description": "Contract Critic in the Architect Council",
-    },
-    {
-        "name": "judge",
-        "file": "judge.md",
-        "display_name": "Judge",
-        "persona": "Solomon",
-        "description": "Final Arbiter in the Architect Council",
-    },
-    {
-        "name": "debugger",
-        "file": "debugger.md",
-        "display_name": "Debugger",
-        "persona": "Sherlock",
-        "description": "Root Cause Investigator",
-    },
-    {
-        "name": "vision-analyst",
-        "file": "vision_analyst.md",
-        "display_name": "Vision Analyst",
-        "persona": "Aurora",
-        "description": "Visual Pattern Detector",
-    },
+    AgentMetadata(
+        name="librarian",
+        file="librarian.md",
+        display_name="Librarian",
+        persona="Iris",
+        description="Codebase Navigator and Context Provider",
+    ),
+    AgentMetadata(
+        name="proposer",
+        file="proposer.md",
+        display_name="Proposer",
+        persona="Marcus",
+        description="Contract Proposer in the Architect Council",
+    ),
+    AgentMetadata(
+        name="critic",
+        file="critic.md",
+        display_name="Critic",
+        persona="Diana",
+        description="Contract Critic in the Architect Council",
+    ),
+    AgentMetadata(
+        name="judge",
+        file="judge.md",
+        display_name="Judge",
+        persona="Solomon",
+        description="Final Arbiter in the Architect Council",
+    ),
+    AgentMetadata(
+        name="debugger",
+        file="debugger.md",
+        display_name="Debugger",
+        persona="Sherlock",
+        description="Root Cause Investigator",
+    ),
+    AgentMetadata(
+        name="vision-analyst",
+        file="vision_analyst.md",
+        display_name="Vision Analyst",
+        persona="Aurora",
+        description="Visual Pattern Detector",
+    ),
 ]
 
 # Common activation template used by all IDEs
@@ -78,6 +78,10 @@ ACTIVATION_TEMPLATE = """You must fully embody this agent's persona and follow a
 class BaseIdeSetup(ABC):
     """Base class for IDE-specific launcher generators."""
 
+    # File extension for launcher files, including the dot (e.g., ".mdc").
+    # Read it through get_file_extension() so overrides of that hook apply.
+    FILE_EXTENSION: str = ".md"
+
     def __init__(self, name: str, display_name: str):
         """Initialize IDE setup.
 
@@ -105,32 +109,31 @@ class BaseIdeSetup(ABC):
         """Generate launcher content for an agent.
 
         Args:
-            agent: Agent metadata dictionary.
+            agent: Agent metadata.
 
         Returns:
             Launcher file content as string.
         """
         pass
 
-    @abstractmethod
     def get_file_extension(self) -> str:
         """Get file extension for launcher files.
 
         Returns:
             File extension including the dot (e.g., ".mdc").
         """
-        pass
+        return self.FILE_EXTENSION
 
     def get_filename(self, agent: AgentMetadata) -> str:
         """Get filename for agent launcher.
 
         Args:
-            agent: Agent metadata dictionary.
+            agent: Agent metadata.
 
         Returns:
             Filename for the launcher.
         """
-        return f"{agent['name']}{self.get_file_extension()}"
+        return f"{agent.name}{self.get_file_extension()}"
 
     def setup(self, project_dir: Path, agents: list[AgentMetadata] | None = None) -> list[str]:
         """Generate all launcher files.
@@ -148,19 +151,21 @@ class BaseIdeSetup(ABC):
         output_dir = self.get_output_dir(project_dir)
         output_dir.mkdir(parents=True, exist_ok=True)
 
+        # Resolve the reported directory once: relative to project_dir when
+        # possible, absolute otherwise (e.g., Codex global install)
+        try:
+            report_dir = output_dir.relative_to(project_dir)
+        except ValueError:
+            report_dir = output_dir
+
         created = []
         for agent in agents:
             content = self.generate_launcher(agent)
             filename = self.get_filename(agent)
             filepath = output_dir / filename
-            filepath.write_text(content)
-            # Return path relative to project_dir
-            try:
-                rel_path = filepath.relative_to(project_dir)
-                created.append(str(rel_path))
-            except ValueError:
-                # If not relative (e.g., Codex global), use absolute
-                created.append(str(filepath))
+            # Encode explicitly so launchers are UTF-8 regardless of locale
+            filepath.write_bytes(content.encode("utf-8"))
+            created.append(str(report_dir / filename))
 
         return created
 
@@ -174,13 +179,15 @@ class BaseIdeSetup(ABC):
             Count of files removed.
         """
         output_dir = self.get_output_dir(project_dir)
-        if not output_dir.exists():
+        try:
+            files = list(output_dir.iterdir())
+        except FileNotFoundError:
             return 0
 
         count = 0
         ext = self.get_file_extension()
-        for file in output_dir.iterdir():
-            if file.is_file() and file.name.endswith(ext):
+        for file in files:
+            if file.name.endswith(ext) and file.is_file():
                 file.unlink()
                 count += 1
 
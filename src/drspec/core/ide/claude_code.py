@@ -13,6 +13,8 @@ class ClaudeCodeSetup(BaseIdeSetup):
     Creates `.claude/commands/drspec/*.md` files for Claude Code CLI.
     """
 
+    FILE_EXTENSION = ".md"
+
     def __init__(self) -> None:
         """Initialize Claude Code setup."""
         super().__init__("claude-code", "Claude Code")
@@ -28,28 +30,20 @@ class ClaudeCodeSetup(BaseIdeSetup):
         """
         return project_dir / ".claude" / "commands" / "drspec"
 
-    def get_file_extension(self) -> str:
-        """Get file extension for Claude Code commands.
-
-        Returns:
-            ".md" extension.
-        """
-        return ".md"
-
     def generate_launcher(self, agent: AgentMetadata) -> str:
         """Generate Claude Code command file for an agent.
 
         Args:
-            agent: Agent metadata dictionary.
+            agent: Agent metadata.
 
         Returns:
             Claude Code .md file content with YAML frontmatter.
         """
-        activation = ACTIVATION_TEMPLATE.format(agent_file=agent["file"])
+        activation = ACTIVATION_TEMPLATE.format(agent_file=agent.file)
 
         return f"""---
-name: 'drspec-{agent['name']}'
-description: 'DrSpec {agent['display_name']} Agent - {agent['description']} ({agent['persona']})'
+name: 'drspec-{agent.name}'
+description: 'DrSpec {agent.display_name} Agent - {agent.description} ({agent.persona})'
 ---
 
 {activation}
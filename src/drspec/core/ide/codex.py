@@ -14,6 +14,8 @@ class CodexSetup(BaseIdeSetup):
     `.codex/prompts/drspec-*.md` (project) files for Codex.
     """
 
+    FILE_EXTENSION = ".md"
+
     def __init__(self, global_install: bool = False) -> None:
         """Initialize Codex setup.
 
@@ -37,39 +39,31 @@ class CodexSetup(BaseIdeSetup):
             return Path.home() / ".codex" / "prompts"
         return project_dir / ".codex" / "prompts"
 
-    def get_file_extension(self) -> str:
-        """Get file extension for Codex prompts.
-
-        Returns:
-            ".md" extension.
-        """
-        return ".md"
-
     def get_filename(self, agent: AgentMetadata) -> str:
         """Get filename for agent launcher.
 
         Codex uses `drspec-{name}.md` format.
 
         Args:
-            agent: Agent metadata dictionary.
+            agent: Agent metadata.
 
         Returns:
             Filename for the launcher.
         """
-        return f"drspec-{agent['name']}{self.get_file_extension()}"
+        return f"drspec-{agent.name}{self.get_file_extension()}"
 
     def generate_launcher(self, agent: AgentMetadata) -> str:
         """Generate Codex prompt file.
 
         Args:
-            agent: Agent metadata dictionary.
+            agent: Agent metadata.
 
         Returns:
             Codex .md file content (no frontmatter, plain markdown).
         """
-        activation = ACTIVATION_TEMPLATE.format(agent_file=agent["file"])
+        activation = ACTIVATION_TEMPLATE.format(agent_file=agent.file)
 
-        return f"""# DrSpec {agent['display_name']} Agent ({agent['persona']})
+        return f"""# DrSpec {agent.display_name} Agent ({agent.persona})
 
 {activation}
 """
@@ -13,6 +13,8 @@ class CursorSetup(BaseIdeSetup):
     Creates `.cursor/rules/drspec/*.mdc` files for Cursor IDE.
     """
 
+    FILE_EXTENSION = ".mdc"
+
     def __init__(self) -> None:
         """Initialize Cursor setup."""
         super().__init__("cursor", "Cursor")
@@ -28,27 +30,19 @@ class CursorSetup(BaseIdeSetup):
         """
         return project_dir / ".cursor" / "rules" / "drspec"
 
-    def get_file_extension(self) -> str:
-        """Get file extension for Cursor rules.
-
-        Returns:
-            ".mdc" extension.
-        """
-        return ".mdc"
-
     def generate_launcher(self, agent: AgentMetadata) -> str:
         """Generate Cursor rule file for an agent.
 
         Args:
-            agent: Agent metadata dictionary.
+            agent: Agent metadata.
 
         Returns:
             Cursor .mdc file content.
         """
-        activation = ACTIVATION_TEMPLATE.format(agent_file=agent["file"])
+        activation = ACTIVATION_TEMPLATE.format(agent_file=agent.file)
 
         return f"""---
-description: DrSpec {agent['display_name']} Agent ({agent['persona']})
+description: DrSpec {agent.display_name} Agent ({agent.persona})
 globs:
 alwaysApply: false
 ---
@@ -13,6 +13,8 @@ class GitHubCopilotSetup(BaseIdeSetup):
     Creates `.github/agents/drspec-*.agent.md` files for GitHub Copilot.
     """
 
+    FILE_EXTENSION = ".agent.md"
+
     def __init__(self) -> None:
         """Initialize GitHub Copilot setup."""
         super().__init__("github-copilot", "GitHub Copilot")
@@ -28,45 +30,37 @@ class GitHubCopilotSetup(BaseIdeSetup):
         """
         return project_dir / ".github" / "agents"
 
-    def get_file_extension(self) -> str:
-        """Get file extension for GitHub Copilot agents.
-
-        Returns:
-            ".agent.md" extension.
-        """
-        return ".agent.md"
-
     def get_filename(self, agent: AgentMetadata) -> str:
         """Get filename for agent launcher.
 
         GitHub Copilot uses `drspec-{name}.agent.md` format.
 
         Args:
-            agent: Agent metadata dictionary.
+            agent: Agent metadata.
 
         Returns:
             Filename for the launcher.
         """
-        return f"drspec-{agent['name']}{self.get_file_extension()}"
+        return f"drspec-{agent.name}{self.get_file_extension()}"
 
     def generate_launcher(self, agent: AgentMetadata) -> str:
         """Generate GitHub Copilot agent file.
 
         Args:
-            agent: Agent metadata dictionary.
+            agent: Agent metadata.
 
         Returns:
             GitHub Copilot .agent.md file content with YAML frontmatter.
         """
-        activation = ACTIVATION_TEMPLATE.format(agent_file=agent["file"])
+        activation = ACTIVATION_TEMPLATE.format(agent_file=agent.file)
 
         # GitHub Copilot requires double quotes and JSON array for tools
         return f'''---
-description: "DrSpec {agent['display_name']} Agent - {agent['description']} ({agent['persona']})"
+description: "DrSpec {agent.display_name} Agent - {agent.description} ({agent.persona})"
 tools: ["changes","edit","fetch","problems","runCommands","runTasks","search","todos"]
 ---
 
-# DrSpec {agent['display_name']} Agent
+# DrSpec {agent.display_name} Agent
 
 {activation}
 '''
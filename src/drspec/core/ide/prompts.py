@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import functools
+import os
 import sys
 from pathlib import Path
 from typing import List, Optional
@@ -34,15 +36,19 @@ def detect_existing_ides(project_dir: Path) -> list[str]:
     Returns:
         List of detected IDE identifiers.
     """
+    # Plain os.path string checks avoid building a Path per probe
+    join = os.path.join
+    lexists = os.path.lexists
+    project = str(project_dir)
     detected = []
 
-    if (project_dir / ".cursor").exists():
+    if lexists(join(project, ".cursor")):
         detected.append("cursor")
-    if (project_dir / ".claude").exists():
+    if lexists(join(project, ".claude")):
         detected.append("claude-code")
-    if (project_dir / ".github").exists():
+    if lexists(join(project, ".github")):
         detected.append("github-copilot")
-    if (project_dir / ".codex").exists() or Path.home().joinpath(".codex").exists():
+    if lexists(join(project, ".codex")) or lexists(join(Path.home(), ".codex")):
         detected.append("codex")
 
     return detected
@@ -237,11 +243,15 @@ PROJECT_ROOT_MARKERS = [
     "Makefile",       # Make project
 ]
 
+# Set form for checking a whole directory listing at once
+_PROJECT_ROOT_MARKER_SET = frozenset(PROJECT_ROOT_MARKERS)
+
 
 def detect_project_root(cwd: Path) -> Path:
     """Detect project root by looking for markers.
 
     Walks up from cwd looking for .git, pyproject.toml, package.json, etc.
+    Results are cached per resolved cwd; see clear_detection_caches().
 
     Args:
         cwd: Current working directory.
@@ -249,16 +259,35 @@ def detect_project_root(cwd: Path) -> Path:
     Returns:
         Detected project root, or cwd if no markers found.
     """
-    current = cwd.resolve()
+    return Path(_detect_project_root(str(cwd.resolve())))
+
+
+@functools.lru_cache(maxsize=32)
+def _detect_project_root(cwd: str) -> str:
+    current = Path(cwd)
 
     while current != current.parent:
-        for marker in PROJECT_ROOT_MARKERS:
-            if (current / marker).exists():
-                return current
+        # One directory listing per level instead of one stat per marker
+        try:
+            with os.scandir(current) as it:
+                names = {entry.name for entry in it}
+        except OSError:
+            names = set()
+        if not _PROJECT_ROOT_MARKER_SET.isdisjoint(names):
+            return str(current)
         current = current.parent
 
     # No markers found, default to current directory
-    return cwd.resolve()
+    return cwd
+
+
+def clear_detection_caches() -> None:
+    """Clear cached project root detection results.
+
+    Call this after creating or removing marker files if detection must
+    see the change in the same process.
+    """
+    _detect_project_root.cache_clear()
 
 
 def prompt_project_root(cwd: Path, detected: Path) -> Path:
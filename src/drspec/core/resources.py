@@ -6,12 +6,13 @@ development mode (running from source) and production mode (PyInstaller binary).
 
 from __future__ import annotations
 
+import functools
 import sys
 from pathlib import Path
 
 
-def _get_base_path() -> Path:
-    """Get the base path for bundled resources.
+def _resolve_base_path() -> Path:
+    """Resolve the base path for bundled resources.
 
     Returns:
         Path to base directory containing agents and other resources.
@@ -27,16 +28,11 @@ def _get_base_path() -> Path:
         return Path(__file__).parent.parent.parent
 
 
-def get_templates_path() -> Path:
-    """Get the path to bundled agent templates.
+def _resolve_templates_path() -> Path:
+    """Resolve the path to bundled agent templates.
 
     Returns:
         Path to agents/ directory.
-
-    Example:
-        >>> templates = get_templates_path()
-        >>> (templates / "librarian.md").exists()
-        True
     """
     if getattr(sys, "frozen", False):
         # In frozen mode, agents are bundled at root level
@@ -47,6 +43,50 @@ def get_templates_path() -> Path:
         return Path(__file__).parent.parent / "agents"
 
 
+def _resolve_schema_path() -> Path:
+    """Resolve the path to the database schema file.
+
+    Returns:
+        Path to drspec/db/schema.sql file.
+    """
+    if getattr(sys, "frozen", False):
+        return _resolve_base_path() / "drspec" / "db" / "schema.sql"
+    else:
+        return Path(__file__).parent.parent / "db" / "schema.sql"
+
+
+# Resource locations cannot change while the process runs (frozen or not),
+# so they are resolved once at import
+_BASE_PATH = _resolve_base_path()
+_TEMPLATES_PATH = _resolve_templates_path()
+_SCHEMA_PATH = _resolve_schema_path()
+
+
+def _get_base_path() -> Path:
+    """Get the base path for bundled resources.
+
+    Returns:
+        Path to base directory containing agents and other resources.
+        - In PyInstaller frozen mode: sys._MEIPASS
+        - In development mode: src/ directory (containing agents/)
+    """
+    return _BASE_PATH
+
+
+def get_templates_path() -> Path:
+    """Get the path to bundled agent templates.
+
+    Returns:
+        Path to agents/ directory.
+
+    Example:
+        >>> templates = get_templates_path()
+        >>> (templates / "librarian.md").exists()
+        True
+    """
+    return _TEMPLATES_PATH
+
+
 def get_schema_path() -> Path:
     """Get the path to the database schema file.
 
@@ -57,19 +97,24 @@ def get_schema_path() -> Path:
         In frozen mode, this is in the bundled drspec/db directory.
         In development mode, this is in src/drspec/db directory.
     """
-    if getattr(sys, "frozen", False):
-        return _get_base_path() / "drspec" / "db" / "schema.sql"
-    else:
-        return Path(__file__).parent.parent / "db" / "schema.sql"
+    return _SCHEMA_PATH
 
 
 def list_template_files() -> list[str]:
     """List all available agent template files.
 
+    The bundled templates do not change while the process runs, so the
+    directory listing is computed once and cached.
+
     Returns:
         List of template filenames (e.g., ["librarian.md", "proposer.md", ...]).
     """
+    return list(_list_template_files())
+
+
+@functools.lru_cache(maxsize=1)
+def _list_template_files() -> tuple[str, ...]:
     templates_path = get_templates_path()
     if not templates_path.exists():
-        return []
-    return [f.name for f in templates_path.glob("*.md")]
+        return ()
+    return tuple(f.name for f in templates_path.glob("*.md"))
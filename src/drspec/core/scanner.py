@@ -8,10 +8,16 @@ from __future__ import annotations
 
 import fnmatch
 import logging
+import os
+import re
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass, field
+from itertools import islice
 from pathlib import Path
 from typing import Callable, Iterator, Optional, Protocol
 
+from drspec._compat import DATACLASS_SLOTS
 from drspec.parsers import CppParser, JavaScriptParser, ParseResult, PythonParser
 from drspec.parsers.models import ExtractedFunction
 
@@ -42,6 +48,19 @@ LANGUAGE_MAP: dict[str, str] = {
     ".H": "cpp",
 }
 
+# Lower-cased LANGUAGE_MAP suffixes, for str.endswith() filtering in the walk
+_SUPPORTED_SUFFIXES: tuple[str, ...] = tuple(sorted({suffix.lower() for suffix in LANGUAGE_MAP}))
+
+# Characters that make an ignore pattern a glob rather than a literal name
+_GLOB_CHARS = frozenset("*?[")
+
+# Files handed to each worker process at a time in parallel scans
+_WORKER_CHUNKSIZE = 16
+
+# Reader threads and files read ahead of the parser in in-process scans
+_PREFETCH_WORKERS = 4
+_PREFETCH_WINDOW = 16
+
 # Default directories and patterns to ignore during scanning
 DEFAULT_IGNORES: list[str] = [
     ".git",
@@ -74,7 +93,9 @@ class Parser(Protocol):
         ...
 
 
-@dataclass
+# Scans can produce hundreds of thousands of ScannedFunction objects, so the
+# per-instance dict is a significant share of scan memory.
+@dataclass(**DATACLASS_SLOTS)
 class ScannedFunction:
     """A function extracted from a scan with additional metadata.
 
@@ -102,6 +123,7 @@ class ScannedFunction:
         extracted: ExtractedFunction,
         file_path: str,
         language: str,
+        copy_decorators: bool = True,
     ) -> "ScannedFunction":
         """Create ScannedFunction from ExtractedFunction.
 
@@ -109,6 +131,9 @@ class ScannedFunction:
             extracted: The extracted function from parser.
             file_path: Relative path to the source file.
             language: The language of the source file.
+            copy_decorators: If False, share the extracted decorators list
+                instead of copying it. Only safe when the caller discards
+                ``extracted`` afterwards.
 
         Returns:
             ScannedFunction with function_id and language set.
@@ -127,13 +152,13 @@ class ScannedFunction:
             end_line=extracted.end_line,
             language=language,
             parent=extracted.parent,
-            decorators=extracted.decorators.copy(),
+            decorators=extracted.decorators.copy() if copy_decorators else extracted.decorators,
             is_method=extracted.is_method,
             is_async=extracted.is_async,
         )
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ScanProgress:
     """Progress information during a directory scan."""
 
@@ -143,7 +168,7 @@ class ScanProgress:
     functions_found: int  # Total functions found so far
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ScanResult:
     """Result of scanning a file or directory."""
 
@@ -170,14 +195,20 @@ class Scanner:
             ignore_patterns: Patterns to ignore during scanning.
                             Defaults to DEFAULT_IGNORES.
         """
-        self._ignore_patterns = ignore_patterns if ignore_patterns is not None else DEFAULT_IGNORES.copy()
-
-        # Initialize parsers (lazy loading could be added if needed)
-        self._parsers: dict[str, Parser] = {
-            "python": PythonParser(),
-            "javascript": JavaScriptParser(),
-            "cpp": CppParser(),
+        self._ignore_patterns = list(ignore_patterns) if ignore_patterns is not None else DEFAULT_IGNORES.copy()
+        self._ignore_names, self._ignore_re = _compile_ignore_patterns(self._ignore_patterns)
+
+        # Parsers are created on first use; loading a tree-sitter grammar is
+        # wasted work for languages the scanned project does not contain
+        self._parser_factories: dict[str, Callable[[], Parser]] = {
+            "python": PythonParser,
+            "javascript": JavaScriptParser,
+            "cpp": CppParser,
         }
+        self._parsers: dict[str, Parser] = {}
+        # Most scans are dominated by one language; remember the last lookup
+        self._last_language: Optional[str] = None
+        self._last_parser: Optional[Parser] = None
 
     @property
     def ignore_patterns(self) -> list[str]:
@@ -188,6 +219,7 @@ class Scanner:
         """Add an ignore pattern."""
         if pattern not in self._ignore_patterns:
             self._ignore_patterns.append(pattern)
+            self._ignore_names, self._ignore_re = _compile_ignore_patterns(self._ignore_patterns)
 
     def detect_language(self, file_path: str | Path) -> Optional[str]:
         """Detect language from file extension.
@@ -198,9 +230,11 @@ class Scanner:
         Returns:
             Language name or None if unsupported.
         """
-        path = Path(file_path)
-        suffix = path.suffix.lower()
-        return LANGUAGE_MAP.get(suffix)
+        if isinstance(file_path, Path):
+            name = file_path.name
+        else:
+            name = os.path.basename(file_path)
+        return _language_for_name(name)
 
     def is_supported(self, file_path: str | Path) -> bool:
         """Check if a file type is supported.
@@ -223,24 +257,47 @@ class Scanner:
         Returns:
             True if the path matches any ignore pattern.
         """
+        if not self._ignore_patterns:
+            return False
+
         # Get relative path for matching
         rel_path = path.relative_to(root) if root else path
-        name = path.name
-
-        for pattern in self._ignore_patterns:
-            # Check against name
-            if fnmatch.fnmatch(name, pattern):
-                return True
-            # Check against full relative path
-            if fnmatch.fnmatch(str(rel_path), pattern):
-                return True
-            # Check if any parent directory matches
-            for parent in rel_path.parents:
-                if fnmatch.fnmatch(parent.name, pattern):
-                    return True
+
+        # Check against name and full relative path
+        if self._matches_ignore(path.name, str(rel_path)):
+            return True
+        # Check if any parent directory matches
+        parent_names = [os.path.normcase(parent.name) for parent in rel_path.parents]
+        if not self._ignore_names.isdisjoint(parent_names):
+            return True
+        if self._ignore_re is not None:
+            return any(self._ignore_re.match(name) for name in parent_names)
 
         return False
 
+    def _matches_ignore(self, name: str, rel_path: str) -> bool:
+        """Check a single entry's name and relative path against ignore patterns.
+
+        Unlike should_ignore(), parent directories are not checked; the
+        directory walk prunes ignored directories before descending.
+
+        Args:
+            name: Entry name.
+            rel_path: Entry path relative to the scan root.
+
+        Returns:
+            True if the name or relative path matches any ignore pattern.
+        """
+        name = os.path.normcase(name)
+        rel_path = os.path.normcase(rel_path)
+        # Literal patterns (all of DEFAULT_IGNORES but one) are set lookups
+        if name in self._ignore_names or rel_path in self._ignore_names:
+            return True
+        ignore_re = self._ignore_re
+        if ignore_re is None:
+            return False
+        return bool(ignore_re.match(name) or ignore_re.match(rel_path))
+
     def scan_file(
         self,
         file_path: str | Path,
@@ -266,30 +323,92 @@ class Scanner:
             result.files_skipped = 1
             return result
 
-        # Get parser
+        # Compute relative path
+        path_str = str(path)
+        rel_path = path_str
+        if relative_to:
+            # Plain prefix slicing covers the usual case of a file under the
+            # root; relative_to() handles the rest (e.g. case differences)
+            prefix = os.path.join(str(relative_to), "")
+            if path_str.startswith(prefix):
+                rel_path = path_str[len(prefix):]
+            else:
+                try:
+                    rel_path = str(path.relative_to(relative_to))
+                except ValueError:
+                    pass
+
+        return self._scan_path(path_str, rel_path, language)
+
+    def _get_parser(self, language: str) -> Optional[Parser]:
+        """Get the parser for a language, creating it on first use.
+
+        Args:
+            language: Language name.
+
+        Returns:
+            Parser instance, or None if the language has no parser.
+        """
+        if language is self._last_language:
+            return self._last_parser
+
         parser = self._parsers.get(language)
+        if parser is None:
+            factory = self._parser_factories.get(language)
+            if factory is None:
+                return None
+            parser = self._parsers[language] = factory()
+        self._last_language, self._last_parser = language, parser
+        return parser
+
+    def _scan_path(
+        self,
+        path: str,
+        rel_path: str,
+        language: str,
+        source: Optional[str] = None,
+    ) -> ScanResult:
+        """Parse a file whose language and relative path are already known.
+
+        Directory scans call this directly with paths produced by the walk,
+        skipping the resolve()/relative_to() work done by scan_file().
+
+        The scanner reads the file itself and hands the text to
+        ``parser.parse()``, so callers that already hold the contents can
+        pass them in and the file is not opened again.
+
+        Args:
+            path: Path to the file to parse.
+            rel_path: Path reported in results (relative to the scan root).
+            language: Language of the file.
+            source: File contents, if already read; read from path if None.
+
+        Returns:
+            ScanResult with extracted functions.
+        """
+        result = ScanResult()
+
+        # Get parser
+        parser = self._get_parser(language)
         if parser is None:
             logger.warning(f"No parser for language '{language}': {path}")
             result.files_skipped = 1
             return result
 
-        # Compute relative path
-        if relative_to:
-            try:
-                rel_path = str(path.relative_to(relative_to))
-            except ValueError:
-                rel_path = str(path)
-        else:
-            rel_path = str(path)
-
         # Parse file
         try:
-            parse_result = parser.parse_file(str(path))
+            if source is None:
+                source = _read_source(path)
+            parse_result = parser.parse(source, file_path=path)
             result.files_scanned = 1
 
             # Convert to ScannedFunction
             for extracted in parse_result.functions:
-                scanned = ScannedFunction.from_extracted(extracted, rel_path, language)
+                # Parser output is discarded after conversion, so its
+                # decorator lists can be handed over without copying
+                scanned = ScannedFunction.from_extracted(
+                    extracted, rel_path, language, copy_decorators=False
+                )
                 result.functions.append(scanned)
 
             if parse_result.has_errors:
@@ -314,6 +433,7 @@ class Scanner:
         directory: str | Path,
         recursive: bool = True,
         progress_callback: Optional[ProgressCallback] = None,
+        max_workers: Optional[int] = 1,
     ) -> ScanResult:
         """Scan a directory for functions.
 
@@ -321,29 +441,70 @@ class Scanner:
             directory: Path to the directory to scan.
             recursive: If True, scan subdirectories recursively.
             progress_callback: Optional callback for progress updates.
+            max_workers: Number of worker processes used for parsing.
+                        1 parses in this process; None uses one per CPU.
 
         Returns:
             ScanResult with all extracted functions.
         """
+        functions: list[ScannedFunction] = []
+        result = self.scan_directory_streaming(
+            directory,
+            functions.append,
+            recursive=recursive,
+            progress_callback=progress_callback,
+            max_workers=max_workers,
+        )
+        result.functions = functions
+        return result
+
+    def scan_directory_streaming(
+        self,
+        directory: str | Path,
+        sink: Callable[[ScannedFunction], None],
+        recursive: bool = True,
+        progress_callback: Optional[ProgressCallback] = None,
+        max_workers: Optional[int] = 1,
+    ) -> ScanResult:
+        """Scan a directory, handing each function to a sink as it is found.
+
+        Functions are not retained, so for in-process scans peak memory is
+        bounded by one file's functions (mostly their ``body`` text) rather
+        than the whole tree.
+
+        Args:
+            directory: Path to the directory to scan.
+            sink: Called once per extracted function, in file order.
+            recursive: If True, scan subdirectories recursively.
+            progress_callback: Optional callback for progress updates.
+            max_workers: Number of worker processes used for parsing.
+                        1 parses in this process; None uses one per CPU.
+
+        Returns:
+            ScanResult with file counts and errors; ``functions`` is empty.
+        """
         root = Path(directory).resolve()
         if not root.is_dir():
             raise ValueError(f"Not a directory: {root}")
 
-        # Collect all files to scan
-        files_to_scan: list[Path] = []
-        for path in self._iter_files(root, recursive):
-            if self.is_supported(path):
-                files_to_scan.append(path)
+        # Collect all files to scan as (path, relative path, language)
+        files_to_scan: list[tuple[str, str, str]] = []
+        for entry, rel_path in self._iter_entries(root, recursive, supported_only=True):
+            language = _language_for_name(entry.name)
+            if language is not None:
+                files_to_scan.append((entry.path, rel_path, language))
 
         total_files = len(files_to_scan)
         result = ScanResult()
-
-        # Scan each file
-        for i, file_path in enumerate(files_to_scan, 1):
-            file_result = self.scan_file(file_path, relative_to=root)
-
-            # Aggregate results
-            result.functions.extend(file_result.functions)
+        functions_found = 0
+
+        # Scan each file (results arrive in files_to_scan order)
+        file_results = self._iter_scan_results(files_to_scan, max_workers)
+        for i, file_result in enumerate(file_results, 1):
+            # Pass functions on and aggregate the rest
+            for function in file_result.functions:
+                sink(function)
+            functions_found += len(file_result.functions)
             result.files_scanned += file_result.files_scanned
             result.files_skipped += file_result.files_skipped
             result.errors.extend(file_result.errors)
@@ -353,13 +514,84 @@ class Scanner:
                 progress = ScanProgress(
                     current=i,
                     total=total_files,
-                    current_file=str(file_path.relative_to(root)),
-                    functions_found=len(result.functions),
+                    current_file=files_to_scan[i - 1][1],
+                    functions_found=functions_found,
                 )
                 progress_callback(progress)
 
         return result
 
+    def _iter_scan_results(
+        self,
+        files_to_scan: list[tuple[str, str, str]],
+        max_workers: Optional[int],
+    ) -> Iterator[ScanResult]:
+        """Parse files, optionally across a process pool.
+
+        Parsing is CPU-bound and independent per file, so with more than
+        one worker the files are distributed over a ProcessPoolExecutor.
+        In-process scans instead read files ahead on a few threads, which
+        hides disk latency behind parsing.
+
+        Args:
+            files_to_scan: Tuples of (path, relative path, language).
+            max_workers: Worker process count (1 = in-process, None = per CPU).
+
+        Yields:
+            ScanResult for each file, in input order.
+        """
+        if len(files_to_scan) < 2:
+            for file_path, rel_path, language in files_to_scan:
+                yield self._scan_path(file_path, rel_path, language)
+            return
+
+        if max_workers == 1:
+            yield from self._iter_prefetched_scan_results(files_to_scan)
+            return
+
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_init_scan_worker,
+        ) as executor:
+            yield from executor.map(
+                _scan_in_worker,
+                files_to_scan,
+                chunksize=_WORKER_CHUNKSIZE,
+            )
+
+    def _iter_prefetched_scan_results(
+        self,
+        files_to_scan: list[tuple[str, str, str]],
+    ) -> Iterator[ScanResult]:
+        """Parse files in this process while reader threads fetch ahead.
+
+        At most _PREFETCH_WINDOW reads are outstanding, so memory held by
+        prefetched sources stays bounded regardless of tree size.
+
+        Args:
+            files_to_scan: Tuples of (path, relative path, language).
+
+        Yields:
+            ScanResult for each file, in input order.
+        """
+        with ThreadPoolExecutor(max_workers=_PREFETCH_WORKERS) as executor:
+            items = iter(files_to_scan)
+            pending: deque[tuple[tuple[str, str, str], Future[str]]] = deque(
+                (item, executor.submit(_read_source, item[0]))
+                for item in islice(items, _PREFETCH_WINDOW)
+            )
+            while pending:
+                (file_path, rel_path, language), future = pending.popleft()
+                for item in islice(items, 1):
+                    pending.append((item, executor.submit(_read_source, item[0])))
+
+                try:
+                    source: Optional[str] = future.result()
+                except (OSError, UnicodeDecodeError):
+                    # Let _scan_path re-read the file and report the error
+                    source = None
+                yield self._scan_path(file_path, rel_path, language, source)
+
     def iter_scan_directory(
         self,
         directory: str | Path,
@@ -380,10 +612,11 @@ class Scanner:
         if not root.is_dir():
             raise ValueError(f"Not a directory: {root}")
 
-        for path in self._iter_files(root, recursive):
-            if self.is_supported(path):
-                result = self.scan_file(path, relative_to=root)
-                yield path, result
+        for entry, rel_path in self._iter_entries(root, recursive, supported_only=True):
+            language = _language_for_name(entry.name)
+            if language is not None:
+                result = self._scan_path(entry.path, rel_path, language)
+                yield Path(entry.path), result
 
     def _iter_files(self, root: Path, recursive: bool) -> Iterator[Path]:
         """Iterate through files in directory, respecting ignore patterns.
@@ -395,14 +628,169 @@ class Scanner:
         Yields:
             Path objects for each file.
         """
-        if recursive:
-            for path in root.rglob("*"):
-                if path.is_file() and not self.should_ignore(path, root):
-                    yield path
+        for entry, _ in self._iter_entries(root, recursive):
+            yield Path(entry.path)
+
+    def _iter_entries(
+        self,
+        root: Path,
+        recursive: bool,
+        supported_only: bool = False,
+    ) -> Iterator[tuple[os.DirEntry, str]]:
+        """Walk a directory, yielding file entries with their relative paths.
+
+        Ignored directories are pruned during the walk, so nothing below
+        them (e.g. .git or node_modules) is listed or stat'ed. Symlinked
+        directories are not followed, and a directory reached twice (e.g.
+        through a bind mount) is listed only once. Entry types come from the dirent
+        cache, and relative paths are built by string concatenation, so
+        no Path objects or extra stat calls are made per file.
+
+        Args:
+            root: Root directory to scan.
+            recursive: If True, include subdirectories.
+            supported_only: If True, skip files without a LANGUAGE_MAP
+                           suffix before any other per-file work.
+
+        Yields:
+            Tuples of (directory entry, path relative to root).
+        """
+        ignore_names = self._ignore_names
+        normcase = os.path.normcase
+
+        # Stack of (directory path, its path relative to root with trailing sep)
+        pending: list[tuple[str, str]] = [(str(root), "")]
+        # (st_dev, st_ino) of directories already listed. Symlinks are not
+        # followed, but junctions and bind mounts can still form loops.
+        visited: set[tuple[int, int]] = set()
+        while pending:
+            directory, rel_dir = pending.pop()
+            try:
+                st = os.stat(directory)
+                # Some filesystems report no inode numbers; don't dedupe those
+                if st.st_ino:
+                    key = (st.st_dev, st.st_ino)
+                    if key in visited:
+                        logger.debug(f"Skipping already visited directory: {directory}")
+                        continue
+                    visited.add(key)
+                with os.scandir(directory) as it:
+                    entries = list(it)
+            except OSError as e:
+                logger.warning(f"Cannot read directory {directory}: {e}")
+                continue
+
+            subdirs = []
+            for entry in entries:
+                # Unsupported files (lockfiles, assets, docs) are usually the
+                # majority; a C-level endswith() drops them cheaply. Anything
+                # with a supported suffix is a file candidate or a directory.
+                if supported_only and not entry.name.lower().endswith(_SUPPORTED_SUFFIXES):
+                    if not entry.is_dir(follow_symlinks=False):
+                        continue
+                # Literal names (.git, node_modules, ...) are pruned before
+                # building the relative path or running glob patterns
+                if normcase(entry.name) in ignore_names:
+                    continue
+                rel_path = rel_dir + entry.name
+                if self._matches_ignore(entry.name, rel_path):
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    if recursive:
+                        subdirs.append((entry.path, rel_path + os.sep))
+                elif entry.is_file():
+                    yield entry, rel_path
+
+            # Reverse so subdirectories are visited in listing order
+            pending.extend(reversed(subdirs))
+
+
+# Per-process scanner used by parallel directory scans
+_worker_scanner: Optional[Scanner] = None
+
+
+def _init_scan_worker() -> None:
+    """Create the scanner reused by a worker process for all its files."""
+    global _worker_scanner
+    _worker_scanner = Scanner(ignore_patterns=[])
+
+
+def _scan_in_worker(item: tuple[str, str, str]) -> ScanResult:
+    """Parse one file in a worker process.
+
+    Args:
+        item: Tuple of (path, relative path, language).
+
+    Returns:
+        ScanResult for the file.
+    """
+    file_path, rel_path, language = item
+    return _worker_scanner._scan_path(file_path, rel_path, language)
+
+
+def _read_source(path: str) -> str:
+    """Read a source file the way the parsers' parse_file() does.
+
+    Args:
+        path: Path to the file.
+
+    Returns:
+        File contents decoded as UTF-8.
+
+    Raises:
+        FileNotFoundError: If the file doesn't exist.
+        IOError: If the file can't be read.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        return f.read()
+
+
+def _language_for_name(name: str) -> Optional[str]:
+    """Detect language from a bare file name.
+
+    Equivalent to looking up ``Path(name).suffix.lower()`` in LANGUAGE_MAP,
+    without constructing a Path.
+
+    Args:
+        name: File name (no directory components).
+
+    Returns:
+        Language name or None if unsupported.
+    """
+    i = name.rfind(".")
+    # No suffix when there is no dot or the name is a dotfile (e.g. ".py")
+    if i <= 0:
+        return None
+    return LANGUAGE_MAP.get(name[i:].lower())
+
+
+def _compile_ignore_patterns(
+    patterns: list[str],
+) -> tuple[frozenset[str], Optional[re.Pattern[str]]]:
+    """Split ignore patterns into literal names and a compiled glob regex.
+
+    Patterns without glob metacharacters match only themselves, so they are
+    checked by set membership; the rest are combined into one regex with
+    fnmatch semantics.
+
+    Args:
+        patterns: Glob patterns as accepted by fnmatch.
+
+    Returns:
+        Tuple of (normcase'd literal patterns, compiled alternation of the
+        glob patterns or None if there are none).
+    """
+    literals = set()
+    globs = []
+    for pattern in patterns:
+        pattern = os.path.normcase(pattern)
+        if _GLOB_CHARS.isdisjoint(pattern):
+            literals.add(pattern)
         else:
-            for path in root.iterdir():
-                if path.is_file() and not self.should_ignore(path, root):
-                    yield path
+            globs.append(pattern)
+
+    glob_re = re.compile("|".join(fnmatch.translate(p) for p in globs)) if globs else None
+    return frozenset(literals), glob_re
 
 
 # Convenience functions for simple usage
@@ -423,6 +811,7 @@ def scan_directory(
     directory: str | Path,
     recursive: bool = True,
     ignore_patterns: Optional[list[str]] = None,
+    max_workers: Optional[int] = 1,
 ) -> ScanResult:
     """Scan a directory for functions.
 
@@ -430,9 +819,10 @@ def scan_directory(
         directory: Path to the directory.
         recursive: If True, scan subdirectories.
         ignore_patterns: Patterns to ignore.
+        max_workers: Number of parser processes (1 = in-process, None = per CPU).
 
     Returns:
         ScanResult with extracted functions.
     """
     scanner = Scanner(ignore_patterns=ignore_patterns)
-    return scanner.scan_directory(directory, recursive=recursive)
+    return scanner.scan_directory(directory, recursive=recursive, max_workers=max_workers)
@@ -12,20 +12,22 @@ Artifact statuses represent the lifecycle state of contract generation:
 
 from __future__ import annotations
 
+from collections import defaultdict
 from dataclasses import dataclass
 
 import duckdb
 
+from drspec._compat import DATACLASS_SLOTS
 from drspec.db.queries import (
     VALID_ARTIFACT_STATUSES,
     Artifact,
     list_artifacts,
-    count_artifacts,
+    prefix_filter,
     update_artifact_status,
 )
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class StatusSummary:
     """Summary of artifact statuses.
 
@@ -104,13 +106,31 @@ def get_status_summary(conn: duckdb.DuckDBPyConnection) -> StatusSummary:
     Returns:
         StatusSummary with counts for each status.
     """
+    try:
+        rows = conn.execute("SELECT status, cnt FROM v_artifact_status_counts").fetchall()
+    except duckdb.CatalogException:
+        # Database created before the view was added to the schema
+        rows = conn.execute("SELECT status, COUNT(*) FROM artifacts GROUP BY status").fetchall()
+    return _summary_from_counts(rows)
+
+
+def _summary_from_counts(rows: list[tuple]) -> StatusSummary:
+    """Build a StatusSummary from (status, count) rows of a GROUP BY query.
+
+    Args:
+        rows: Rows of (status, count), one per distinct status.
+
+    Returns:
+        StatusSummary whose total includes every row.
+    """
+    counts = dict(rows)
     return StatusSummary(
-        total=count_artifacts(conn),
-        pending=count_artifacts(conn, status="PENDING"),
-        verified=count_artifacts(conn, status="VERIFIED"),
-        needs_review=count_artifacts(conn, status="NEEDS_REVIEW"),
-        stale=count_artifacts(conn, status="STALE"),
-        broken=count_artifacts(conn, status="BROKEN"),
+        total=sum(counts.values()),
+        pending=counts.get("PENDING", 0),
+        verified=counts.get("VERIFIED", 0),
+        needs_review=counts.get("NEEDS_REVIEW", 0),
+        stale=counts.get("STALE", 0),
+        broken=counts.get("BROKEN", 0),
     )
 
 
@@ -280,25 +300,12 @@ def get_file_status_summary(
     Returns:
         StatusSummary for artifacts in the file.
     """
-    # Count by querying with file_path filter
-    total = len(list_artifacts(conn, file_path=file_path, limit=10000))
-
-    pending = len(list_artifacts(conn, file_path=file_path, status="PENDING", limit=10000))
-    verified = len(list_artifacts(conn, file_path=file_path, status="VERIFIED", limit=10000))
-    needs_review = len(
-        list_artifacts(conn, file_path=file_path, status="NEEDS_REVIEW", limit=10000)
-    )
-    stale = len(list_artifacts(conn, file_path=file_path, status="STALE", limit=10000))
-    broken = len(list_artifacts(conn, file_path=file_path, status="BROKEN", limit=10000))
-
-    return StatusSummary(
-        total=total,
-        pending=pending,
-        verified=verified,
-        needs_review=needs_review,
-        stale=stale,
-        broken=broken,
-    )
+    condition, params = prefix_filter("file_path", file_path)
+    rows = conn.execute(
+        f"SELECT status, COUNT(*) FROM artifacts WHERE {condition} GROUP BY status",
+        params,
+    ).fetchall()
+    return _summary_from_counts(rows)
 
 
 def get_language_status_summary(
@@ -314,25 +321,67 @@ def get_language_status_summary(
     Returns:
         StatusSummary for artifacts in the language.
     """
-    # Count by querying with language filter
-    total = len(list_artifacts(conn, language=language, limit=10000))
+    rows = conn.execute(
+        "SELECT status, COUNT(*) FROM artifacts WHERE language = ? GROUP BY status",
+        [language],
+    ).fetchall()
+    return _summary_from_counts(rows)
 
-    pending = len(list_artifacts(conn, language=language, status="PENDING", limit=10000))
-    verified = len(list_artifacts(conn, language=language, status="VERIFIED", limit=10000))
-    needs_review = len(
-        list_artifacts(conn, language=language, status="NEEDS_REVIEW", limit=10000)
-    )
-    stale = len(list_artifacts(conn, language=language, status="STALE", limit=10000))
-    broken = len(list_artifacts(conn, language=language, status="BROKEN", limit=10000))
 
-    return StatusSummary(
-        total=total,
-        pending=pending,
-        verified=verified,
-        needs_review=needs_review,
-        stale=stale,
-        broken=broken,
-    )
+def get_all_file_status_summaries(
+    conn: duckdb.DuckDBPyConnection,
+) -> dict[str, StatusSummary]:
+    """Get status summaries for every file in one query.
+
+    Prefer this over calling get_file_status_summary() once per file.
+
+    Args:
+        conn: DuckDB connection.
+
+    Returns:
+        Mapping of file path to its StatusSummary, ordered by file path.
+    """
+    return _grouped_summaries(conn, "file_path")
+
+
+def get_all_language_status_summaries(
+    conn: duckdb.DuckDBPyConnection,
+) -> dict[str, StatusSummary]:
+    """Get status summaries for every language in one query.
+
+    Prefer this over calling get_language_status_summary() once per language.
+
+    Args:
+        conn: DuckDB connection.
+
+    Returns:
+        Mapping of language to its StatusSummary, ordered by language.
+    """
+    return _grouped_summaries(conn, "language")
+
+
+def _grouped_summaries(
+    conn: duckdb.DuckDBPyConnection,
+    column: str,
+) -> dict[str, StatusSummary]:
+    """Count artifacts per (column, status) and build a summary per group.
+
+    Args:
+        conn: DuckDB connection.
+        column: Artifacts column to group by (trusted, not user input).
+
+    Returns:
+        Mapping of column value to its StatusSummary.
+    """
+    rows = conn.execute(
+        f"SELECT {column}, status, COUNT(*) FROM artifacts GROUP BY 1, 2 ORDER BY 1"
+    ).fetchall()
+
+    counts_by_group: dict[str, list[tuple]] = defaultdict(list)
+    for group, status, count in rows:
+        counts_by_group[group].append((status, count))
+
+    return {group: _summary_from_counts(counts) for group, counts in counts_by_group.items()}
 
 
 def bulk_update_status(
@@ -356,12 +405,65 @@ def bulk_update_status(
     if status not in VALID_ARTIFACT_STATUSES:
         raise ValueError(f"Invalid status: {status}. Must be one of {VALID_ARTIFACT_STATUSES}")
 
-    updated = 0
-    for function_id in function_ids:
-        if update_artifact_status(conn, function_id, status):
-            updated += 1
+    if not function_ids:
+        return 0
+
+    # One statement for all ids; RETURNING gives the rows actually matched
+    # (DuckDB's rowcount is not reliable)
+    updated = conn.execute(
+        """
+        UPDATE artifacts
+        SET status = ?, updated_at = now()
+        WHERE function_id = ANY(?::VARCHAR[])
+        RETURNING function_id
+        """,
+        [status, list(function_ids)],
+    ).fetchall()
+    return len(updated)
 
-    return updated
+
+def bulk_update_statuses(
+    conn: duckdb.DuckDBPyConnection,
+    updates: list[tuple[str, str]],
+) -> int:
+    """Update artifacts to per-artifact statuses.
+
+    Use bulk_update_status() when every artifact gets the same status.
+
+    Args:
+        conn: DuckDB connection.
+        updates: (function_id, status) pairs. If a function ID appears more
+            than once, its last status wins.
+
+    Returns:
+        Number of artifacts updated.
+
+    Raises:
+        ValueError: If any status is not a valid artifact status.
+    """
+    for _, status in updates:
+        if status not in VALID_ARTIFACT_STATUSES:
+            raise ValueError(f"Invalid status: {status}. Must be one of {VALID_ARTIFACT_STATUSES}")
+
+    new_statuses = dict(updates)
+
+    if not new_statuses:
+        return 0
+
+    # Join against the (id, status) pairs so the whole batch is one statement
+    updated = conn.execute(
+        """
+        UPDATE artifacts
+        SET status = u.status, updated_at = now()
+        FROM (
+            SELECT unnest(?::VARCHAR[]) AS function_id, unnest(?::VARCHAR[]) AS status
+        ) u
+        WHERE artifacts.function_id = u.function_id
+        RETURNING artifacts.function_id
+        """,
+        [list(new_statuses), list(new_statuses.values())],
+    ).fetchall()
+    return len(updated)
 
 
 def reset_stale_to_pending(
@@ -377,8 +479,7 @@ def reset_stale_to_pending(
     Returns:
         Number of artifacts reset.
     """
-    stale = list_artifacts(conn, status="STALE", limit=10000)
-    return bulk_update_status(conn, [a.function_id for a in stale], "PENDING")
+    return _reset_to_pending(conn, "STALE")
 
 
 def reset_broken_to_pending(
@@ -394,5 +495,29 @@ def reset_broken_to_pending(
     Returns:
         Number of artifacts reset.
     """
-    broken = list_artifacts(conn, status="BROKEN", limit=10000)
-    return bulk_update_status(conn, [a.function_id for a in broken], "PENDING")
+    return _reset_to_pending(conn, "BROKEN")
+
+
+def _reset_to_pending(
+    conn: duckdb.DuckDBPyConnection,
+    from_status: str,
+) -> int:
+    """Reset every artifact with the given status to pending in one UPDATE.
+
+    Args:
+        conn: DuckDB connection.
+        from_status: Status of the artifacts to reset.
+
+    Returns:
+        Number of artifacts reset.
+    """
+    reset = conn.execute(
+        """
+        UPDATE artifacts
+        SET status = 'PENDING', updated_at = now()
+        WHERE status = ?
+        RETURNING 1
+        """,
+        [from_status],
+    ).fetchall()
+    return len(reset)
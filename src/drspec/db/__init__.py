@@ -15,13 +15,16 @@ from drspec.db.queries import (
     VALID_FINDING_SIGNIFICANCE,
     VALID_FINDING_STATUSES,
     insert_artifact,
+    insert_artifacts_bulk,
     get_artifact,
     list_artifacts,
+    list_artifact_names,
     count_artifacts,
     update_artifact_status,
     insert_contract,
     get_contract,
     list_contracts,
+    list_contracts_arrow,
     count_contracts,
     get_contract_confidence_stats,
     query_contract,
@@ -29,6 +32,7 @@ from drspec.db.queries import (
     search_contracts,
     queue_push,
     queue_pop,
+    queue_pop_many,
     queue_peek,
     queue_get,
     queue_complete,
@@ -38,10 +42,13 @@ from drspec.db.queries import (
     queue_count,
     queue_clear_completed,
     insert_dependency,
+    insert_dependencies,
     get_callers,
     get_callees,
     insert_reasoning_trace,
+    insert_reasoning_traces,
     get_reasoning_traces,
+    get_reasoning_traces_arrow,
     get_config,
     set_config,
     get_all_config,
@@ -51,6 +58,7 @@ from drspec.db.queries import (
     update_vision_finding_status,
     count_vision_findings,
     calculate_confidence_with_findings,
+    get_vision_finding_penalties,
 )
 from drspec.db.graph import (
     DependencyNode,
@@ -80,14 +88,17 @@ __all__ = [
     "VALID_FINDING_STATUSES",
     # Artifact queries
     "insert_artifact",
+    "insert_artifacts_bulk",
     "get_artifact",
     "list_artifacts",
+    "list_artifact_names",
     "count_artifacts",
     "update_artifact_status",
     # Contract queries
     "insert_contract",
     "get_contract",
     "list_contracts",
+    "list_contracts_arrow",
     "count_contracts",
     "get_contract_confidence_stats",
     # Contract query functions (for Debugger Agent)
@@ -97,6 +108,7 @@ __all__ = [
     # Queue queries
     "queue_push",
     "queue_pop",
+    "queue_pop_many",
     "queue_peek",
     "queue_get",
     "queue_complete",
@@ -107,11 +119,14 @@ __all__ = [
     "queue_clear_completed",
     # Dependency queries
     "insert_dependency",
+    "insert_dependencies",
     "get_callers",
     "get_callees",
     # Reasoning trace queries
     "insert_reasoning_trace",
+    "insert_reasoning_traces",
     "get_reasoning_traces",
+    "get_reasoning_traces_arrow",
     # Config queries
     "get_config",
     "set_config",
@@ -123,6 +138,7 @@ __all__ = [
     "update_vision_finding_status",
     "count_vision_findings",
     "calculate_confidence_with_findings",
+    "get_vision_finding_penalties",
     # Graph models
     "DependencyNode",
     "DependencyEdge",
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 from contextlib import contextmanager
 from pathlib import Path
 from typing import Generator, Optional
@@ -11,6 +12,27 @@ import duckdb
 # Default database path relative to current working directory
 DEFAULT_DB_PATH = "_drspec/contracts.db"
 
+# Views, sequences and tables dropped by init_schema(rebuild=True); tables
+# are in reverse dependency order (vision_findings depends on artifacts)
+_DROP_SCHEMA_SQL = """
+DROP VIEW IF EXISTS v_artifact_status_counts;
+DROP TABLE IF EXISTS vision_findings;
+DROP SEQUENCE IF EXISTS seq_vision_findings_id;
+DROP TABLE IF EXISTS reasoning_traces;
+DROP SEQUENCE IF EXISTS seq_reasoning_traces_id;
+DROP TABLE IF EXISTS config;
+DROP TABLE IF EXISTS dependencies;
+DROP TABLE IF EXISTS queue;
+DROP TABLE IF EXISTS contracts;
+DROP TABLE IF EXISTS artifacts;
+DROP TYPE IF EXISTS artifact_status;
+DROP TYPE IF EXISTS queue_status;
+DROP TYPE IF EXISTS queue_reason;
+DROP TYPE IF EXISTS finding_type;
+DROP TYPE IF EXISTS finding_significance;
+DROP TYPE IF EXISTS finding_status;
+"""
+
 
 def get_db_path(db_path: Optional[Path] = None) -> Path:
     """Get the database path, using default if not provided.
@@ -81,25 +103,13 @@ def init_schema(
         conn: DuckDB connection.
         rebuild: If True, drop all tables and recreate. Use for development.
     """
-    # Read schema file
-    schema_path = Path(__file__).parent / "schema.sql"
-    schema_sql = schema_path.read_text()
+    schema_sql = _read_schema_sql()
 
     # Execute in transaction
     conn.begin()
     try:
         if rebuild:
-            # Drop tables in reverse dependency order
-            # vision_findings depends on artifacts
-            conn.execute("DROP TABLE IF EXISTS vision_findings")
-            conn.execute("DROP SEQUENCE IF EXISTS seq_vision_findings_id")
-            conn.execute("DROP TABLE IF EXISTS reasoning_traces")
-            conn.execute("DROP SEQUENCE IF EXISTS seq_reasoning_traces_id")
-            conn.execute("DROP TABLE IF EXISTS config")
-            conn.execute("DROP TABLE IF EXISTS dependencies")
-            conn.execute("DROP TABLE IF EXISTS queue")
-            conn.execute("DROP TABLE IF EXISTS contracts")
-            conn.execute("DROP TABLE IF EXISTS artifacts")
+            conn.execute(_DROP_SCHEMA_SQL)
 
         # Execute schema
         conn.execute(schema_sql)
@@ -109,6 +119,16 @@ def init_schema(
         raise
 
 
+@functools.lru_cache(maxsize=1)
+def _read_schema_sql() -> str:
+    """Read schema.sql once per process.
+
+    Returns:
+        Contents of the bundled schema file.
+    """
+    return (Path(__file__).parent / "schema.sql").read_text()
+
+
 def ensure_db_directory(db_path: Optional[Path] = None) -> Path:
     """Ensure database directory exists, creating it if necessary.
 
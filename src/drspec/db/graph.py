@@ -12,13 +12,15 @@ from typing import Any, List, Optional, Set, Tuple
 
 import duckdb
 
+from drspec._compat import DATACLASS_SLOTS
+
 
 # =============================================================================
 # Graph Models
 # =============================================================================
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class DependencyNode:
     """A node in the dependency graph.
 
@@ -53,7 +55,7 @@ class DependencyNode:
         }
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class DependencyEdge:
     """An edge in the dependency graph.
 
@@ -76,7 +78,7 @@ class DependencyEdge:
         }
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class DependencyGraph:
     """Complete dependency graph centered on a function.
 
@@ -183,40 +185,61 @@ def get_dependency_graph(
         ))
         visited[function_id] = "root"
 
+    # Index of nodes by function ID, kept in step with graph.nodes
+    nodes_by_id: dict[str, DependencyNode] = {function_id: graph.nodes[0]}
+
+    # Node info fetched so far, shared by both traversal directions
+    nodes_info: dict[str, dict[str, Any]] = {}
+    if root_info:
+        nodes_info[function_id] = root_info
+
+    # One indexed probe tells which directions have any edges; leaf and
+    # standalone functions then skip the traversal queries entirely
+    has_callees, has_callers = conn.execute(
+        """
+        SELECT
+            EXISTS(SELECT 1 FROM dependencies WHERE caller_id = ?),
+            EXISTS(SELECT 1 FROM dependencies WHERE callee_id = ?)
+        """,
+        [function_id, function_id],
+    ).fetchone()
+
     # BFS for callees
-    if direction in ("callees", "both"):
+    if has_callees and direction in ("callees", "both"):
         _bfs_traverse(
             conn=conn,
             start_id=function_id,
             depth=depth,
-            get_neighbors=_get_callees_raw,
+            neighbors=_load_neighbors(conn, function_id, depth, "callee"),
             relationship="callee",
             visited=visited,
             edges=all_edges,
             nodes=graph.nodes,
+            nodes_by_id=nodes_by_id,
+            nodes_info=nodes_info,
         )
 
     # BFS for callers
-    if direction in ("callers", "both"):
+    if has_callers and direction in ("callers", "both"):
         _bfs_traverse(
             conn=conn,
             start_id=function_id,
             depth=depth,
-            get_neighbors=_get_callers_raw,
+            neighbors=_load_neighbors(conn, function_id, depth, "caller"),
             relationship="caller",
             visited=visited,
             edges=all_edges,
             nodes=graph.nodes,
+            nodes_by_id=nodes_by_id,
+            nodes_info=nodes_info,
         )
 
     # Detect cycles and build edges
     cyclic_edges = _detect_cycles(all_edges)
-    for caller_id, callee_id in all_edges:
-        graph.edges.append(DependencyEdge(
-            caller_id=caller_id,
-            callee_id=callee_id,
-            is_cyclic=(caller_id, callee_id) in cyclic_edges,
-        ))
+    graph.edges = [
+        DependencyEdge(caller_id, callee_id, (caller_id, callee_id) in cyclic_edges)
+        for caller_id, callee_id in all_edges
+    ]
 
     graph.has_cycles = len(cyclic_edges) > 0
     graph.max_depth_reached = max((n.depth for n in graph.nodes), default=0)
@@ -307,55 +330,114 @@ def _get_node_info(
     }
 
 
-def _get_callees_raw(
+def _get_nodes_info(
     conn: duckdb.DuckDBPyConnection,
-    function_id: str,
-) -> List[str]:
-    """Get raw list of callee function IDs.
+    function_ids: Set[str],
+) -> dict[str, dict[str, Any]]:
+    """Get node information for many functions in one query.
 
     Args:
         conn: DuckDB connection.
-        function_id: Caller function.
+        function_ids: Functions to look up.
 
     Returns:
-        List of callee function IDs.
+        Mapping of function ID to node info, as returned by _get_node_info().
+        Functions not in artifacts are absent.
     """
-    result = conn.execute(
-        "SELECT callee_id FROM dependencies WHERE caller_id = ?",
-        [function_id],
+    if not function_ids:
+        return {}
+
+    rows = conn.execute(
+        """
+        SELECT
+            a.function_id,
+            a.function_name,
+            a.file_path,
+            a.status,
+            c.function_id IS NOT NULL as has_contract
+        FROM artifacts a
+        LEFT JOIN contracts c ON a.function_id = c.function_id
+        WHERE a.function_id = ANY(?::VARCHAR[])
+        """,
+        [list(function_ids)],
     ).fetchall()
-    return [row[0] for row in result]
+
+    return {
+        row[0]: {
+            "function_name": row[1],
+            "file_path": row[2],
+            "status": row[3],
+            "has_contract": bool(row[4]),
+        }
+        for row in rows
+    }
+
+
+# (column matched against the walk, neighbor column) per traversal direction
+_NEIGHBOR_COLUMNS: dict[str, Tuple[str, str]] = {
+    "callee": ("caller_id", "callee_id"),
+    "caller": ("callee_id", "caller_id"),
+}
 
 
-def _get_callers_raw(
+def _load_neighbors(
     conn: duckdb.DuckDBPyConnection,
-    function_id: str,
-) -> List[str]:
-    """Get raw list of caller function IDs.
+    start_id: str,
+    depth: int,
+    relationship: str,
+) -> dict[str, List[str]]:
+    """Load every edge a traversal could follow in one recursive query.
+
+    A recursive CTE walks the dependencies from start_id, in the direction
+    given by relationship, to every function less than depth hops away.
+    The edges leaving those functions are returned in table order, which
+    is the order a per-node ``WHERE caller_id = ?`` lookup would give.
 
     Args:
         conn: DuckDB connection.
-        function_id: Callee function.
+        start_id: Starting function ID.
+        depth: Maximum traversal depth.
+        relationship: Relationship type ("callee" or "caller").
 
     Returns:
-        List of caller function IDs.
+        Mapping of function ID to its neighbor IDs (callees or callers).
     """
-    result = conn.execute(
-        "SELECT caller_id FROM dependencies WHERE callee_id = ?",
-        [function_id],
+    from_col, to_col = _NEIGHBOR_COLUMNS[relationship]
+    rows = conn.execute(
+        f"""
+        WITH RECURSIVE walk(function_id, depth) AS (
+            SELECT ?, 0
+            UNION
+            SELECT d.{to_col}, w.depth + 1
+            FROM walk w
+            JOIN dependencies d ON d.{from_col} = w.function_id
+            WHERE w.depth + 1 < ?
+        )
+        SELECT d.{from_col}, d.{to_col}
+        FROM dependencies d
+        WHERE d.{from_col} IN (SELECT function_id FROM walk)
+        ORDER BY d.rowid
+        """,
+        [start_id, depth],
     ).fetchall()
-    return [row[0] for row in result]
+
+    neighbors: dict[str, List[str]] = defaultdict(list)
+    for function_id, neighbor_id in rows:
+        neighbors[function_id].append(neighbor_id)
+    return neighbors
 
 
 def _bfs_traverse(
     conn: duckdb.DuckDBPyConnection,
     start_id: str,
     depth: int,
-    get_neighbors: Any,
+    neighbors: dict[str, List[str]],
     relationship: str,
     visited: dict[str, str],
     edges: List[Tuple[str, str]],
     nodes: List[DependencyNode],
+    nodes_by_id: dict[str, DependencyNode],
+    nodes_info: dict[str, dict[str, Any]],
 ) -> None:
     """BFS traversal to collect nodes and edges.
 
@@ -363,16 +445,26 @@ def _bfs_traverse(
         conn: DuckDB connection.
         start_id: Starting function ID.
         depth: Maximum depth to traverse.
-        get_neighbors: Function to get neighbors (callees or callers).
+        neighbors: Neighbor IDs (callees or callers) by function ID, as
+            loaded by _load_neighbors().
         relationship: Relationship type ("callee" or "caller").
         visited: Dictionary tracking visited nodes and their relationships.
         edges: List to append edges to.
         nodes: List to append nodes to.
+        nodes_by_id: Index of nodes by function ID, updated with nodes.
+        nodes_info: Node info already fetched, by function ID; extended
+            with any reachable nodes not in it yet.
     """
     queue: deque[Tuple[str, int]] = deque()
 
+    # Every node this traversal can reach is a neighbor of some loaded node,
+    # so their info is fetched up front instead of once per visited node.
+    # Nodes already fetched (e.g. by the other direction) are not re-queried.
+    reachable = {n for ids in neighbors.values() for n in ids}
+    nodes_info.update(_get_nodes_info(conn, reachable.difference(nodes_info)))
+
     # Get initial neighbors
-    for neighbor_id in get_neighbors(conn, start_id):
+    for neighbor_id in neighbors.get(start_id, ()):
         if neighbor_id not in visited:
             queue.append((neighbor_id, 1))
             visited[neighbor_id] = relationship
@@ -387,9 +479,9 @@ def _bfs_traverse(
         current_id, current_depth = queue.popleft()
 
         # Get node info and add to nodes list
-        node_info = _get_node_info(conn, current_id)
+        node_info = nodes_info.get(current_id)
         if node_info:
-            nodes.append(DependencyNode(
+            node = DependencyNode(
                 function_id=current_id,
                 function_name=node_info["function_name"],
                 file_path=node_info["file_path"],
@@ -397,10 +489,10 @@ def _bfs_traverse(
                 has_contract=node_info["has_contract"],
                 depth=current_depth,
                 relationship=visited[current_id],
-            ))
+            )
         else:
             # Function not in artifacts - add with limited info
-            nodes.append(DependencyNode(
+            node = DependencyNode(
                 function_id=current_id,
                 function_name=current_id.split("::")[-1] if "::" in current_id else current_id,
                 file_path="",
@@ -408,11 +500,13 @@ def _bfs_traverse(
                 has_contract=False,
                 depth=current_depth,
                 relationship=visited[current_id],
-            ))
+            )
+        nodes.append(node)
+        nodes_by_id[current_id] = node
 
         # Continue BFS if not at max depth
         if current_depth < depth:
-            for neighbor_id in get_neighbors(conn, current_id):
+            for neighbor_id in neighbors.get(current_id, ()):
                 # Add edge
                 if relationship == "callee":
                     edges.append((current_id, neighbor_id))
@@ -426,16 +520,16 @@ def _bfs_traverse(
                 elif visited[neighbor_id] != relationship:
                     # Node was visited from other direction - mark as "both"
                     # Update existing node
-                    for node in nodes:
-                        if node.function_id == neighbor_id:
-                            node.relationship = "both"
-                            break
+                    existing = nodes_by_id.get(neighbor_id)
+                    if existing is not None:
+                        existing.relationship = "both"
 
 
 def _detect_cycles(edges: List[Tuple[str, str]]) -> Set[Tuple[str, str]]:
     """Detect cyclic edges in the graph.
 
-    Uses DFS-based cycle detection.
+    Uses DFS-based cycle detection with an explicit stack, so deep call
+    chains cannot hit the recursion limit.
 
     Args:
         edges: List of (caller_id, callee_id) tuples.
@@ -443,33 +537,48 @@ def _detect_cycles(edges: List[Tuple[str, str]]) -> Set[Tuple[str, str]]:
     Returns:
         Set of cyclic edges.
     """
-    # Build adjacency list
-    graph: dict[str, Set[str]] = defaultdict(set)
+    # Build adjacency list (callers only; leaves have no entry)
+    graph: dict[str, Set[str]] = {}
     for caller_id, callee_id in edges:
-        graph[caller_id].add(callee_id)
+        callees = graph.get(caller_id)
+        if callees is None:
+            graph[caller_id] = {callee_id}
+        else:
+            callees.add(callee_id)
+
+    # Every cycle passes through a node that both calls and is called.
+    # Traversals of call trees often have none, so skip the DFS for them.
+    if graph.keys().isdisjoint(callee_id for _, callee_id in edges):
+        return set()
 
     cyclic_edges: Set[Tuple[str, str]] = set()
     visited: Set[str] = set()
     rec_stack: Set[str] = set()
 
-    def dfs(node: str) -> None:
-        visited.add(node)
-        rec_stack.add(node)
-
-        for neighbor in graph[node]:
-            if neighbor not in visited:
-                dfs(neighbor)
+    # Run DFS from all unvisited nodes
+    for start, start_callees in graph.items():
+        if start in visited:
+            continue
+
+        visited.add(start)
+        rec_stack.add(start)
+        # Stack of (node, iterator over its remaining neighbors)
+        stack = [(start, iter(start_callees))]
+        while stack:
+            node, neighbors = stack[-1]
+            neighbor = next(neighbors, None)
+            if neighbor is None:
+                # All neighbors done - leave the current path
+                rec_stack.remove(node)
+                stack.pop()
+            elif neighbor not in visited:
+                visited.add(neighbor)
+                rec_stack.add(neighbor)
+                stack.append((neighbor, iter(graph.get(neighbor, ()))))
             elif neighbor in rec_stack:
                 # Found back edge - marks a cycle
                 cyclic_edges.add((node, neighbor))
 
-        rec_stack.remove(node)
-
-    # Run DFS from all unvisited nodes
-    for node in list(graph.keys()):
-        if node not in visited:
-            dfs(node)
-
     return cyclic_edges
 
 
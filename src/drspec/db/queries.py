@@ -4,10 +4,11 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Optional
+from typing import Any, Iterable, Optional
 
 import duckdb
 
+from drspec._compat import DATACLASS_SLOTS
 
 # =============================================================================
 # Status Values
@@ -20,13 +21,70 @@ VALID_FINDING_TYPES = frozenset({"outlier", "discontinuity", "boundary", "correl
 VALID_FINDING_SIGNIFICANCE = frozenset({"HIGH", "MEDIUM", "LOW"})
 VALID_FINDING_STATUSES = frozenset({"NEW", "ADDRESSED", "IGNORED"})
 
+# Confidence points deducted per unresolved (NEW) vision finding
+_FINDING_PENALTIES: dict[str, int] = {"HIGH": 15, "MEDIUM": 8, "LOW": 3}
+
+
+# =============================================================================
+# Query Helpers
+# =============================================================================
+
+
+def prefix_filter(column: str, prefix: str) -> tuple[str, list[str]]:
+    """Build a WHERE condition matching values that start with a prefix.
+
+    Uses a half-open range (``column >= prefix AND column < upper``) rather
+    than ``LIKE 'prefix%'`` so DuckDB can prune with zonemaps and indexes.
+    Unlike LIKE, ``_`` and ``%`` in the prefix match literally.
+
+    Args:
+        column: Column expression to filter (trusted SQL, not user input).
+        prefix: Required value prefix.
+
+    Returns:
+        Tuple of (SQL condition, parameters).
+    """
+    # Smallest string greater than every string with this prefix: bump the
+    # last code point (UTF-8 byte order matches code point order)
+    head = prefix
+    while head:
+        code = ord(head[-1]) + 1
+        if code <= 0x10FFFF:
+            if 0xD800 <= code <= 0xDFFF:
+                code = 0xE000  # Surrogates cannot be encoded
+            upper = head[:-1] + chr(code)
+            return f"({column} >= ? AND {column} < ?)", [prefix, upper]
+        head = head[:-1]
+    return f"starts_with({column}, ?)", [prefix]
+
+
+def _execute_returning(
+    conn: duckdb.DuckDBPyConnection,
+    sql: str,
+    params: list[Any],
+) -> bool:
+    """Run an UPDATE or DELETE ending in RETURNING and report whether it matched.
+
+    DuckDB's rowcount is not reliable for these statements, so the
+    RETURNING row answers "was anything affected" in the same round trip.
+
+    Args:
+        conn: DuckDB connection.
+        sql: Mutating statement with a RETURNING clause.
+        params: Query parameters.
+
+    Returns:
+        True if at least one row was affected.
+    """
+    return conn.execute(sql, params).fetchone() is not None
+
 
 # =============================================================================
 # Artifact Model
 # =============================================================================
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Artifact:
     """Represents a scanned function artifact.
 
@@ -65,26 +123,12 @@ class Artifact:
         """Create Artifact from database row.
 
         Args:
-            row: Database row tuple in column order.
+            row: Database row tuple in column order (the field order).
 
         Returns:
             Artifact instance.
         """
-        return cls(
-            function_id=row[0],
-            file_path=row[1],
-            function_name=row[2],
-            signature=row[3],
-            body=row[4],
-            code_hash=row[5],
-            language=row[6],
-            start_line=row[7],
-            end_line=row[8],
-            parent=row[9],
-            status=row[10],
-            created_at=row[11],
-            updated_at=row[12],
-        )
+        return cls(*row)
 
 
 # =============================================================================
@@ -129,58 +173,162 @@ def insert_artifact(
     Returns:
         True if the artifact was changed (new or hash changed), False otherwise.
     """
-    # Check if artifact exists and get its current hash
-    existing = conn.execute(
-        "SELECT code_hash, status FROM artifacts WHERE function_id = ?",
-        [function_id],
+    # One upsert: the WHERE clause skips rows whose hash is unchanged, which
+    # also avoids DuckDB's FK limitation where an UPDATE of a referenced row
+    # fails with "still referenced by a foreign key". RETURNING yields a row
+    # only when the artifact was inserted or updated (rowcount not reliable).
+    changed = conn.execute(
+        """
+        INSERT INTO artifacts (
+            function_id, file_path, function_name, signature, body, code_hash,
+            language, start_line, end_line, parent, status, updated_at
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, now())
+        ON CONFLICT (function_id) DO UPDATE SET
+            file_path = EXCLUDED.file_path,
+            function_name = EXCLUDED.function_name,
+            signature = EXCLUDED.signature,
+            body = EXCLUDED.body,
+            code_hash = EXCLUDED.code_hash,
+            language = EXCLUDED.language,
+            start_line = EXCLUDED.start_line,
+            end_line = EXCLUDED.end_line,
+            parent = EXCLUDED.parent,
+            status = CASE
+                WHEN artifacts.status IN ('VERIFIED', 'NEEDS_REVIEW') THEN 'STALE'
+                WHEN artifacts.status = 'BROKEN' THEN 'BROKEN'
+                ELSE EXCLUDED.status
+            END,
+            updated_at = now()
+        WHERE artifacts.code_hash <> EXCLUDED.code_hash
+        RETURNING 1
+        """,
+        [function_id, file_path, function_name, signature, body, code_hash, language, start_line, end_line, parent, status],
     ).fetchone()
+    return changed is not None
+
+
+# Status after a code hash change, keyed by the stored status (others reset
+# to PENDING); mirrors the CASE expression in insert_artifact()
+_HASH_CHANGE_STATUS = {
+    "VERIFIED": "STALE",
+    "NEEDS_REVIEW": "STALE",
+    "BROKEN": "BROKEN",  # Keep broken status, requires manual reset
+}
+
+# Artifact columns as parallel lists (one parameter per column), zipped back
+# into rows by unnest() so a whole batch is written by a single statement
+_ARTIFACT_BATCH_SQL = """
+    SELECT
+        unnest(?::VARCHAR[]) AS function_id,
+        unnest(?::VARCHAR[]) AS file_path,
+        unnest(?::VARCHAR[]) AS function_name,
+        unnest(?::VARCHAR[]) AS signature,
+        unnest(?::VARCHAR[]) AS body,
+        unnest(?::VARCHAR[]) AS code_hash,
+        unnest(?::VARCHAR[]) AS language,
+        unnest(?::INTEGER[]) AS start_line,
+        unnest(?::INTEGER[]) AS end_line,
+        unnest(?::VARCHAR[]) AS parent,
+        unnest(?::VARCHAR[]) AS status
+"""
+
+
+def insert_artifacts_bulk(
+    conn: duckdb.DuckDBPyConnection,
+    artifacts: Iterable[tuple],
+) -> list[str]:
+    """Insert or update many artifacts with hash change detection.
 
-    if existing is not None:
-        old_hash, old_status = existing
-        if old_hash == code_hash:
-            # No change in code - skip update to avoid DuckDB FK constraint issue
-            # DuckDB has a known limitation where UPDATE on tables with FK references
-            # can fail with "still referenced by a foreign key" error
-            return False
-
-        # Hash changed - determine new status
-        if old_status in ("VERIFIED", "NEEDS_REVIEW"):
-            status = "STALE"
-        elif old_status == "BROKEN":
-            status = "BROKEN"  # Keep broken status, requires manual reset
-        # PENDING stays as PENDING
+    Batch equivalent of calling insert_artifact() once per row: existing
+    hashes are fetched in one query, new rows are written by one INSERT and
+    changed rows by one UPDATE. Status transitions match insert_artifact().
 
+    Args:
+        conn: DuckDB connection.
+        artifacts: Rows of (function_id, file_path, function_name, signature,
+            body, code_hash, language, start_line, end_line, parent), in the
+            positional order of insert_artifact(). New rows get PENDING status.
+
+    Returns:
+        One of "new", "changed" or "unchanged" per input row, in input order.
+    """
+    rows = list(artifacts)
+    if not rows:
+        return []
+
+    function_ids = list({row[0]: None for row in rows})
+    known = {
+        function_id: (code_hash, status)
+        for function_id, code_hash, status in conn.execute(
+            "SELECT function_id, code_hash, status FROM artifacts WHERE function_id = ANY(?::VARCHAR[])",
+            [function_ids],
+        ).fetchall()
+    }
+
+    outcomes: list[str] = []
+    new_ids: set[str] = set()
+    final_rows: dict[str, tuple] = {}  # function_id -> row plus status, last wins
+    for row in rows:
+        function_id, code_hash = row[0], row[5]
+        current = known.get(function_id)
+        if current is None:
+            status = "PENDING"
+            new_ids.add(function_id)
+            outcomes.append("new")
+        elif current[0] == code_hash:
+            outcomes.append("unchanged")
+            continue
+        else:
+            status = _HASH_CHANGE_STATUS.get(current[1], "PENDING")
+            outcomes.append("changed")
+        known[function_id] = (code_hash, status)
+        final_rows[function_id] = (*row, status)
+
+    # Written in key order, which keeps DuckDB's index maintenance cheap
+    inserts = [final_rows[fid] for fid in sorted(final_rows) if fid in new_ids]
+    updates = [final_rows[fid] for fid in sorted(final_rows) if fid not in new_ids]
+
+    if inserts:
+        conn.execute(
+            f"""
+            INSERT INTO artifacts (
+                function_id, file_path, function_name, signature, body, code_hash,
+                language, start_line, end_line, parent, status, updated_at
+            )
+            SELECT *, now() FROM ({_ARTIFACT_BATCH_SQL})
+            """,
+            [list(column) for column in zip(*inserts)],
+        )
+
+    if updates:
         conn.execute(
-            """
+            f"""
             UPDATE artifacts SET
-                file_path = ?,
-                function_name = ?,
-                signature = ?,
-                body = ?,
-                code_hash = ?,
-                language = ?,
-                start_line = ?,
-                end_line = ?,
-                parent = ?,
-                status = ?,
+                file_path = i.file_path,
+                function_name = i.function_name,
+                signature = i.signature,
+                body = i.body,
+                code_hash = i.code_hash,
+                language = i.language,
+                start_line = i.start_line,
+                end_line = i.end_line,
+                parent = i.parent,
+                status = i.status,
                 updated_at = now()
-            WHERE function_id = ?
+            FROM ({_ARTIFACT_BATCH_SQL}) AS i
+            WHERE artifacts.function_id = i.function_id
             """,
-            [file_path, function_name, signature, body, code_hash, language, start_line, end_line, parent, status, function_id],
+            [list(column) for column in zip(*updates)],
         )
-        return True
 
-    # New artifact - insert
-    conn.execute(
-        """
-        INSERT INTO artifacts (
-            function_id, file_path, function_name, signature, body, code_hash,
-            language, start_line, end_line, parent, status, updated_at
-        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, now())
-        """,
-        [function_id, file_path, function_name, signature, body, code_hash, language, start_line, end_line, parent, status],
-    )
-    return True
+    return outcomes
+
+
+# Artifact columns in field order, so rows unpack straight into Artifact
+_ARTIFACT_SELECT_SQL = """
+    SELECT function_id, file_path, function_name, signature, body, code_hash,
+           language, start_line, end_line, parent, status, created_at, updated_at
+    FROM artifacts"""
 
 
 def get_artifact(
@@ -197,16 +345,14 @@ def get_artifact(
         Artifact object or None if not found.
     """
     result = conn.execute(
-        """SELECT function_id, file_path, function_name, signature, body, code_hash,
-                  language, start_line, end_line, parent, status, created_at, updated_at
-           FROM artifacts WHERE function_id = ?""",
+        _ARTIFACT_SELECT_SQL + " WHERE function_id = ?",
         [function_id],
     ).fetchone()
 
     if result is None:
         return None
 
-    return Artifact.from_row(result)
+    return Artifact(*result)
 
 
 def list_artifacts(
@@ -230,9 +376,7 @@ def list_artifacts(
     Returns:
         List of Artifact objects.
     """
-    query = """SELECT function_id, file_path, function_name, signature, body, code_hash,
-                      language, start_line, end_line, parent, status, created_at, updated_at
-               FROM artifacts WHERE 1=1"""
+    query = _ARTIFACT_SELECT_SQL + " WHERE 1=1"
     params: list[Any] = []
 
     if status is not None:
@@ -240,8 +384,9 @@ def list_artifacts(
         params.append(status)
 
     if file_path is not None:
-        query += " AND file_path LIKE ?"
-        params.append(f"{file_path}%")
+        condition, condition_params = prefix_filter("file_path", file_path)
+        query += f" AND {condition}"
+        params.extend(condition_params)
 
     if language is not None:
         query += " AND language = ?"
@@ -251,7 +396,31 @@ def list_artifacts(
     params.extend([limit, offset])
 
     results = conn.execute(query, params).fetchall()
-    return [Artifact.from_row(row) for row in results]
+    return [Artifact(*row) for row in results]
+
+
+def list_artifact_names(
+    conn: duckdb.DuckDBPyConnection,
+    limit: int = 100,
+) -> list[tuple[str, str, str]]:
+    """List artifact identifiers without loading signatures or bodies.
+
+    Rows come in the same order as list_artifacts(), for callers that only
+    need names (e.g. "did you mean" suggestions).
+
+    Args:
+        conn: DuckDB connection.
+        limit: Maximum number of results.
+
+    Returns:
+        List of (function_id, function_name, file_path) tuples.
+    """
+    return conn.execute(
+        """SELECT function_id, function_name, file_path
+           FROM artifacts
+           ORDER BY file_path, start_line LIMIT ?""",
+        [limit],
+    ).fetchall()
 
 
 def count_artifacts(
@@ -267,15 +436,16 @@ def count_artifacts(
     Returns:
         Number of artifacts.
     """
+    # COUNT(*) always yields exactly one row
     if status is not None:
-        result = conn.execute(
+        (count,) = conn.execute(
             "SELECT COUNT(*) FROM artifacts WHERE status = ?",
             [status],
         ).fetchone()
     else:
-        result = conn.execute("SELECT COUNT(*) FROM artifacts").fetchone()
+        (count,) = conn.execute("SELECT COUNT(*) FROM artifacts").fetchone()
 
-    return result[0] if result else 0
+    return count
 
 
 def update_artifact_status(
@@ -299,22 +469,16 @@ def update_artifact_status(
     if status not in VALID_ARTIFACT_STATUSES:
         raise ValueError(f"Invalid status: {status}. Must be one of {VALID_ARTIFACT_STATUSES}")
 
-    # Check if artifact exists first (DuckDB rowcount not reliable)
-    existing = conn.execute(
-        "SELECT 1 FROM artifacts WHERE function_id = ?", [function_id]
-    ).fetchone()
-    if existing is None:
-        return False
-
-    conn.execute(
+    return _execute_returning(
+        conn,
         """
         UPDATE artifacts
         SET status = ?, updated_at = now()
         WHERE function_id = ?
+        RETURNING 1
         """,
         [status, function_id],
     )
-    return True
 
 
 # =============================================================================
@@ -322,6 +486,25 @@ def update_artifact_status(
 # =============================================================================
 
 
+# Dictionary keys for get_contract() and list_contracts() rows, in SELECT order
+_CONTRACT_COLUMNS = (
+    "function_id",
+    "contract_json",
+    "confidence_score",
+    "verification_script",
+    "created_at",
+    "updated_at",
+)
+_CONTRACT_LIST_COLUMNS = (
+    "function_id",
+    "contract_json",
+    "confidence_score",
+    "created_at",
+    "updated_at",
+    "status",
+)
+
+
 def insert_contract(
     conn: duckdb.DuckDBPyConnection,
     function_id: str,
@@ -366,22 +549,14 @@ def get_contract(
         Contract dict or None if not found.
     """
     result = conn.execute(
-        "SELECT * FROM contracts WHERE function_id = ?",
+        f"SELECT {', '.join(_CONTRACT_COLUMNS)} FROM contracts WHERE function_id = ?",
         [function_id],
     ).fetchone()
 
     if result is None:
         return None
 
-    columns = [
-        "function_id",
-        "contract_json",
-        "confidence_score",
-        "verification_script",
-        "created_at",
-        "updated_at",
-    ]
-    return dict(zip(columns, result))
+    return dict(zip(_CONTRACT_COLUMNS, result))
 
 
 def list_contracts(
@@ -399,39 +574,50 @@ def list_contracts(
     Returns:
         List of contract dicts.
     """
+    query, params = _list_contracts_query(status, limit)
+    result = conn.execute(query, params).fetchall()
+    return [dict(zip(_CONTRACT_LIST_COLUMNS, row)) for row in result]
+
+
+def list_contracts_arrow(
+    conn: duckdb.DuckDBPyConnection,
+    status: Optional[str] = None,
+    limit: int = 100,
+) -> Any:
+    """List contracts as a columnar Arrow table.
+
+    Same rows and columns as list_contracts(), fetched straight from
+    DuckDB's columnar result without building a dict per row. Requires the
+    optional ``pyarrow`` package.
+
+    Args:
+        conn: DuckDB connection.
+        status: Optional status filter (VERIFIED, NEEDS_REVIEW, etc.).
+        limit: Maximum number of results.
+
+    Returns:
+        pyarrow.Table with the list_contracts() columns.
+    """
+    query, params = _list_contracts_query(status, limit)
+    return conn.execute(query, params).fetch_arrow_table()
+
+
+def _list_contracts_query(status: Optional[str], limit: int) -> tuple[str, list[Any]]:
+    query = """
+        SELECT c.function_id, c.contract_json, c.confidence_score,
+               c.created_at, c.updated_at, a.status
+        FROM contracts c
+        JOIN artifacts a ON c.function_id = a.function_id
+    """
+    params: list[Any] = []
+
     if status:
-        result = conn.execute(
-            """
-            SELECT c.*, a.status
-            FROM contracts c
-            JOIN artifacts a ON c.function_id = a.function_id
-            WHERE a.status = ?
-            ORDER BY c.confidence_score DESC
-            LIMIT ?
-            """,
-            [status, limit],
-        ).fetchall()
-    else:
-        result = conn.execute(
-            """
-            SELECT c.*, a.status
-            FROM contracts c
-            JOIN artifacts a ON c.function_id = a.function_id
-            ORDER BY c.confidence_score DESC
-            LIMIT ?
-            """,
-            [limit],
-        ).fetchall()
+        query += " WHERE a.status = ?"
+        params.append(status)
 
-    columns = [
-        "function_id",
-        "contract_json",
-        "confidence_score",
-        "created_at",
-        "updated_at",
-        "status",
-    ]
-    return [dict(zip(columns, row)) for row in result]
+    query += " ORDER BY c.confidence_score DESC LIMIT ?"
+    params.append(limit)
+    return query, params
 
 
 def count_contracts(conn: duckdb.DuckDBPyConnection) -> int:
@@ -443,8 +629,8 @@ def count_contracts(conn: duckdb.DuckDBPyConnection) -> int:
     Returns:
         Number of contracts.
     """
-    result = conn.execute("SELECT COUNT(*) FROM contracts").fetchone()
-    return result[0] if result else 0
+    (count,) = conn.execute("SELECT COUNT(*) FROM contracts").fetchone()
+    return count
 
 
 def get_contract_confidence_stats(
@@ -458,36 +644,36 @@ def get_contract_confidence_stats(
     Returns:
         Dictionary with average and distribution.
     """
-    result = conn.execute(
+    # One grouped pass: each score's bucket index is the number of band
+    # edges (0.5, 0.7, 0.9) it reaches; NULL scores fall in a NULL bucket
+    rows = conn.execute(
         """
         SELECT
-            AVG(confidence_score) as average,
-            SUM(CASE WHEN confidence_score < 0.5 THEN 1 ELSE 0 END) as below_50,
-            SUM(CASE WHEN confidence_score >= 0.5 AND confidence_score < 0.7 THEN 1 ELSE 0 END) as range_50_70,
-            SUM(CASE WHEN confidence_score >= 0.7 AND confidence_score < 0.9 THEN 1 ELSE 0 END) as range_70_90,
-            SUM(CASE WHEN confidence_score >= 0.9 THEN 1 ELSE 0 END) as above_90
+            (confidence_score >= 0.5)::INTEGER
+                + (confidence_score >= 0.7)::INTEGER
+                + (confidence_score >= 0.9)::INTEGER AS bucket,
+            COUNT(*),
+            SUM(confidence_score)
         FROM contracts
+        GROUP BY bucket
         """
-    ).fetchone()
+    ).fetchall()
 
-    if result is None or result[0] is None:
-        return {
-            "average": 0.0,
-            "distribution": {
-                "below_50": 0,
-                "50_to_70": 0,
-                "70_to_90": 0,
-                "above_90": 0,
-            },
-        }
+    counts = [0, 0, 0, 0]
+    total = 0.0
+    for bucket, count, score_sum in rows:
+        if bucket is not None:
+            counts[bucket] = count
+            total += score_sum
 
+    scored = sum(counts)
     return {
-        "average": round(result[0] * 100, 1),  # Convert to percentage
+        "average": round(total / scored * 100, 1) if scored else 0.0,  # Convert to percentage
         "distribution": {
-            "below_50": int(result[1] or 0),
-            "50_to_70": int(result[2] or 0),
-            "70_to_90": int(result[3] or 0),
-            "above_90": int(result[4] or 0),
+            "below_50": counts[0],
+            "50_to_70": counts[1],
+            "70_to_90": counts[2],
+            "above_90": counts[3],
         },
     }
 
@@ -497,7 +683,7 @@ def get_contract_confidence_stats(
 # =============================================================================
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ContractDetails:
     """Comprehensive contract details for debugger queries.
 
@@ -530,22 +716,12 @@ class ContractDetails:
         """Create ContractDetails from database row.
 
         Args:
-            row: Database row tuple in column order.
+            row: Database row tuple in column order (the field order).
 
         Returns:
             ContractDetails instance.
         """
-        return cls(
-            function_id=row[0],
-            contract_json=row[1],
-            confidence_score=row[2],
-            created_at=row[3],
-            updated_at=row[4],
-            status=row[5],
-            file_path=row[6],
-            function_name=row[7],
-            has_verification_script=row[8],
-        )
+        return cls(*row)
 
 
 # =============================================================================
@@ -553,6 +729,24 @@ class ContractDetails:
 # =============================================================================
 
 
+# ContractDetails columns in field order, so rows unpack straight into the
+# dataclass; callers append the WHERE clause
+_CONTRACT_DETAILS_SQL = """
+    SELECT
+        c.function_id,
+        c.contract_json,
+        c.confidence_score,
+        a.status,
+        a.file_path,
+        a.function_name,
+        c.created_at,
+        c.updated_at,
+        c.verification_script IS NOT NULL AS has_verification_script
+    FROM contracts c
+    JOIN artifacts a ON c.function_id = a.function_id
+"""
+
+
 def query_contract(
     conn: duckdb.DuckDBPyConnection,
     function_id: str,
@@ -570,28 +764,14 @@ def query_contract(
         ContractDetails or None if not found.
     """
     result = conn.execute(
-        """
-        SELECT
-            c.function_id,
-            c.contract_json,
-            c.confidence_score,
-            c.created_at,
-            c.updated_at,
-            a.status,
-            a.file_path,
-            a.function_name,
-            c.verification_script IS NOT NULL as has_verification_script
-        FROM contracts c
-        JOIN artifacts a ON c.function_id = a.function_id
-        WHERE c.function_id = ?
-        """,
+        _CONTRACT_DETAILS_SQL + "WHERE c.function_id = ?",
         [function_id],
     ).fetchone()
 
     if result is None:
         return None
 
-    return ContractDetails.from_row(result)
+    return ContractDetails(*result)
 
 
 def query_contracts(
@@ -614,28 +794,13 @@ def query_contracts(
     if not function_ids:
         return {}
 
-    # Build parameterized IN clause
-    placeholders = ", ".join(["?" for _ in function_ids])
+    # One list parameter keeps the statement text fixed for any number of IDs
     result = conn.execute(
-        f"""
-        SELECT
-            c.function_id,
-            c.contract_json,
-            c.confidence_score,
-            c.created_at,
-            c.updated_at,
-            a.status,
-            a.file_path,
-            a.function_name,
-            c.verification_script IS NOT NULL as has_verification_script
-        FROM contracts c
-        JOIN artifacts a ON c.function_id = a.function_id
-        WHERE c.function_id IN ({placeholders})
-        """,
-        function_ids,
+        _CONTRACT_DETAILS_SQL + "WHERE c.function_id = ANY(?::VARCHAR[])",
+        [function_ids],
     ).fetchall()
 
-    return {row[0]: ContractDetails.from_row(row) for row in result}
+    return {row[0]: ContractDetails(*row) for row in result}
 
 
 def search_contracts(
@@ -660,31 +825,30 @@ def search_contracts(
     if not pattern:
         return []
 
+    # Ranked arms (exact name, name prefix, function_id substring) so the
+    # first two can use the function_name index; each arm excludes rows
+    # already matched by a higher-ranked one
+    name_condition, name_params = prefix_filter("function_name", pattern)
     result = conn.execute(
-        """
-        SELECT
-            c.function_id,
-            c.contract_json,
-            c.confidence_score,
-            c.created_at,
-            c.updated_at,
-            a.status,
-            a.file_path,
-            a.function_name,
-            c.verification_script IS NOT NULL as has_verification_script
-        FROM contracts c
-        JOIN artifacts a ON c.function_id = a.function_id
-        WHERE a.function_name LIKE ? || '%'
-           OR c.function_id LIKE '%' || ? || '%'
-        ORDER BY
-            CASE WHEN a.function_name = ? THEN 0 ELSE 1 END,
-            a.function_name
+        f"""
+        WITH details AS ({_CONTRACT_DETAILS_SQL})
+        SELECT * EXCLUDE (match_rank) FROM (
+            SELECT *, 0 AS match_rank FROM details
+            WHERE function_name = ?
+            UNION ALL
+            SELECT *, 1 AS match_rank FROM details
+            WHERE {name_condition} AND function_name <> ?
+            UNION ALL
+            SELECT *, 2 AS match_rank FROM details
+            WHERE position(? IN function_id) > 0 AND NOT {name_condition}
+        )
+        ORDER BY match_rank, function_name
         LIMIT ?
         """,
-        [pattern, pattern, pattern, limit],
+        [pattern, *name_params, pattern, pattern, *name_params, limit],
     ).fetchall()
 
-    return [ContractDetails.from_row(row) for row in result]
+    return [ContractDetails(*row) for row in result]
 
 
 # =============================================================================
@@ -692,7 +856,7 @@ def search_contracts(
 # =============================================================================
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class QueueItem:
     """Represents a processing queue item.
 
@@ -723,28 +887,26 @@ class QueueItem:
         """Create QueueItem from database row.
 
         Args:
-            row: Database row tuple in column order.
+            row: Database row tuple in column order (the field order).
 
         Returns:
             QueueItem instance.
         """
-        return cls(
-            function_id=row[0],
-            priority=row[1],
-            status=row[2],
-            reason=row[3],
-            attempts=row[4],
-            max_attempts=row[5],
-            error_message=row[6],
-            created_at=row[7],
-            updated_at=row[8],
-        )
+        return cls(*row)
 
 
 # =============================================================================
 # Queue Queries
 # =============================================================================
 
+# QueueItem columns in field order, so rows unpack straight into QueueItem
+_QUEUE_COLUMNS = """function_id, priority, status, reason, attempts, max_attempts,
+           error_message, created_at, updated_at"""
+
+_QUEUE_SELECT_SQL = f"""
+    SELECT {_QUEUE_COLUMNS}
+    FROM queue"""
+
 
 def queue_push(
     conn: duckdb.DuckDBPyConnection,
@@ -755,7 +917,8 @@ def queue_push(
     """Add a function to the processing queue.
 
     If the function is already in the queue, updates priority and reason,
-    and resets status to PENDING.
+    and resets status to PENDING. Re-pushing an item that is already
+    PENDING with the same priority and reason leaves the row untouched.
 
     Args:
         conn: DuckDB connection.
@@ -778,6 +941,9 @@ def queue_push(
             status = 'PENDING',
             reason = EXCLUDED.reason,
             updated_at = now()
+        WHERE queue.status IS DISTINCT FROM 'PENDING'
+            OR queue.priority IS DISTINCT FROM EXCLUDED.priority
+            OR queue.reason IS DISTINCT FROM EXCLUDED.reason
         """,
         [function_id, priority, reason],
     )
@@ -797,46 +963,47 @@ def queue_pop(
     Returns:
         QueueItem or None if queue is empty.
     """
-    # Get next pending item that hasn't exceeded max attempts
-    result = conn.execute(
-        """
-        SELECT function_id, priority, status, reason, attempts, max_attempts,
-               error_message, created_at, updated_at
-        FROM queue
-        WHERE status = 'PENDING' AND attempts < max_attempts
-        ORDER BY priority ASC, created_at ASC
-        LIMIT 1
-        """,
-    ).fetchone()
+    items = queue_pop_many(conn, 1)
+    return items[0] if items else None
 
-    if result is None:
-        return None
 
-    function_id = result[0]
-    attempts = result[4]
+def queue_pop_many(
+    conn: duckdb.DuckDBPyConnection,
+    count: int,
+) -> list[QueueItem]:
+    """Get and mark the next items from the queue as processing.
 
-    # Mark as processing and increment attempts
-    conn.execute(
+    Batch equivalent of queue_pop(): claims up to ``count`` items in one
+    statement, for workers that process several items per database trip.
+
+    Args:
+        conn: DuckDB connection.
+        count: Maximum number of items to claim.
+
+    Returns:
+        Claimed QueueItems in priority order (empty if the queue is empty).
+    """
+    # Select and claim in one statement, so two callers cannot pop the
+    # same row
+    rows = conn.execute(
         """
         UPDATE queue
-        SET status = 'PROCESSING', attempts = ?, updated_at = now()
-        WHERE function_id = ?
-        """,
-        [attempts + 1, function_id],
-    )
+        SET status = 'PROCESSING', attempts = attempts + 1, updated_at = now()
+        WHERE function_id IN (
+            SELECT function_id FROM queue
+            WHERE status = 'PENDING' AND attempts < max_attempts
+            ORDER BY priority ASC, created_at ASC
+            LIMIT ?
+        )
+        RETURNING """
+        + _QUEUE_COLUMNS,
+        [count],
+    ).fetchall()
 
-    # Return updated item
-    return QueueItem(
-        function_id=result[0],
-        priority=result[1],
-        status="PROCESSING",
-        reason=result[3],
-        attempts=attempts + 1,
-        max_attempts=result[5],
-        error_message=result[6],
-        created_at=result[7],
-        updated_at=result[8],
-    )
+    # RETURNING does not preserve the subquery's order
+    items = [QueueItem(*row) for row in rows]
+    items.sort(key=lambda item: (item.priority, item.created_at))
+    return items
 
 
 def queue_peek(
@@ -856,10 +1023,8 @@ def queue_peek(
     """
     if include_all:
         result = conn.execute(
-            """
-            SELECT function_id, priority, status, reason, attempts, max_attempts,
-                   error_message, created_at, updated_at
-            FROM queue
+            _QUEUE_SELECT_SQL
+            + """
             ORDER BY priority ASC, created_at ASC
             LIMIT ?
             """,
@@ -867,10 +1032,8 @@ def queue_peek(
         ).fetchall()
     else:
         result = conn.execute(
-            """
-            SELECT function_id, priority, status, reason, attempts, max_attempts,
-                   error_message, created_at, updated_at
-            FROM queue
+            _QUEUE_SELECT_SQL
+            + """
             WHERE status = 'PENDING' AND attempts < max_attempts
             ORDER BY priority ASC, created_at ASC
             LIMIT ?
@@ -878,7 +1041,7 @@ def queue_peek(
             [count],
         ).fetchall()
 
-    return [QueueItem.from_row(row) for row in result]
+    return [QueueItem(*row) for row in result]
 
 
 def queue_complete(
@@ -898,23 +1061,17 @@ def queue_complete(
     Returns:
         True if item was found and updated.
     """
-    # Check if queue item exists first (DuckDB rowcount not reliable)
-    existing = conn.execute(
-        "SELECT 1 FROM queue WHERE function_id = ?", [function_id]
-    ).fetchone()
-    if existing is None:
-        return False
-
     status = "COMPLETED" if success else "FAILED"
-    conn.execute(
+    return _execute_returning(
+        conn,
         """
         UPDATE queue
         SET status = ?, error_message = ?, updated_at = now()
         WHERE function_id = ?
+        RETURNING 1
         """,
         [status, error_message, function_id],
     )
-    return True
 
 
 def queue_retry(
@@ -938,22 +1095,16 @@ def queue_retry(
     if reason not in VALID_QUEUE_REASONS:
         raise ValueError(f"Invalid reason: {reason}. Must be one of {VALID_QUEUE_REASONS}")
 
-    # Check if queue item exists
-    existing = conn.execute(
-        "SELECT 1 FROM queue WHERE function_id = ?", [function_id]
-    ).fetchone()
-    if existing is None:
-        return False
-
-    conn.execute(
+    return _execute_returning(
+        conn,
         """
         UPDATE queue
         SET status = 'PENDING', reason = ?, error_message = NULL, updated_at = now()
         WHERE function_id = ?
+        RETURNING 1
         """,
         [reason, function_id],
     )
-    return True
 
 
 def queue_prioritize(
@@ -971,22 +1122,16 @@ def queue_prioritize(
     Returns:
         True if item was found and updated.
     """
-    # Check if queue item exists first (DuckDB rowcount not reliable)
-    existing = conn.execute(
-        "SELECT 1 FROM queue WHERE function_id = ?", [function_id]
-    ).fetchone()
-    if existing is None:
-        return False
-
-    conn.execute(
+    return _execute_returning(
+        conn,
         """
         UPDATE queue
         SET priority = ?, updated_at = now()
         WHERE function_id = ?
+        RETURNING 1
         """,
         [priority, function_id],
     )
-    return True
 
 
 def queue_remove(
@@ -1002,14 +1147,9 @@ def queue_remove(
     Returns:
         True if item was found and removed.
     """
-    existing = conn.execute(
-        "SELECT 1 FROM queue WHERE function_id = ?", [function_id]
-    ).fetchone()
-    if existing is None:
-        return False
-
-    conn.execute("DELETE FROM queue WHERE function_id = ?", [function_id])
-    return True
+    return _execute_returning(
+        conn, "DELETE FROM queue WHERE function_id = ? RETURNING 1", [function_id]
+    )
 
 
 def queue_get(
@@ -1026,19 +1166,14 @@ def queue_get(
         QueueItem or None if not found.
     """
     result = conn.execute(
-        """
-        SELECT function_id, priority, status, reason, attempts, max_attempts,
-               error_message, created_at, updated_at
-        FROM queue
-        WHERE function_id = ?
-        """,
+        _QUEUE_SELECT_SQL + " WHERE function_id = ?",
         [function_id],
     ).fetchone()
 
     if result is None:
         return None
 
-    return QueueItem.from_row(result)
+    return QueueItem(*result)
 
 
 def queue_count(
@@ -1076,11 +1211,8 @@ def queue_clear_completed(
     Returns:
         Number of items removed.
     """
-    count = conn.execute(
-        "SELECT COUNT(*) FROM queue WHERE status = 'COMPLETED'"
-    ).fetchone()[0]
-
-    conn.execute("DELETE FROM queue WHERE status = 'COMPLETED'")
+    # DuckDB returns the number of deleted rows as the statement's result
+    (count,) = conn.execute("DELETE FROM queue WHERE status = 'COMPLETED'").fetchone()
     return count
 
 
@@ -1111,6 +1243,62 @@ def insert_dependency(
     )
 
 
+def _batch_columns(rows: list[tuple], width: int, what: str) -> list[list]:
+    """Transpose batch rows into per-column lists for unnest().
+
+    The trailing created_at column is optional: rows one short of width are
+    padded with None so the insert records the current time.
+
+    Raises:
+        ValueError: If a row has neither width - 1 nor width values.
+    """
+    padded = []
+    for row in rows:
+        if len(row) == width - 1:
+            row = (*row, None)
+        elif len(row) != width:
+            raise ValueError(f"Invalid {what} row: {row!r}. Expected {width - 1} or {width} values")
+        padded.append(row)
+    return [list(column) for column in zip(*padded)]
+
+
+def insert_dependencies(
+    conn: duckdb.DuckDBPyConnection,
+    dependencies: Iterable[tuple],
+) -> None:
+    """Insert many caller/callee dependency relationships in one statement.
+
+    Batch equivalent of insert_dependency(); pairs that already exist are
+    skipped.
+
+    Args:
+        conn: DuckDB connection.
+        dependencies: Rows of (caller_id, callee_id) or
+            (caller_id, callee_id, created_at). A missing or None created_at
+            records the current time.
+
+    Raises:
+        ValueError: If a row has the wrong number of values.
+    """
+    rows = list(dependencies)
+    if not rows:
+        return
+
+    conn.execute(
+        """
+        INSERT INTO dependencies (caller_id, callee_id, created_at)
+        SELECT caller_id, callee_id, COALESCE(created_at, now()) FROM (
+            SELECT
+                unnest(?::VARCHAR[]) AS caller_id,
+                unnest(?::VARCHAR[]) AS callee_id,
+                unnest(?::TIMESTAMP[]) AS created_at
+        )
+        ON CONFLICT DO NOTHING
+        """,
+        _batch_columns(rows, 3, "dependency"),
+    )
+
+
 def get_callers(
     conn: duckdb.DuckDBPyConnection,
     function_id: str,
@@ -1179,6 +1367,43 @@ def insert_reasoning_trace(
     )
 
 
+def insert_reasoning_traces(
+    conn: duckdb.DuckDBPyConnection,
+    traces: Iterable[tuple],
+) -> None:
+    """Insert many reasoning trace entries in one statement.
+
+    Batch equivalent of insert_reasoning_trace(); IDs are assigned in
+    input order.
+
+    Args:
+        conn: DuckDB connection.
+        traces: Rows of (function_id, agent, trace_json) or
+            (function_id, agent, trace_json, created_at). A missing or None
+            created_at records the current time.
+
+    Raises:
+        ValueError: If a row has the wrong number of values.
+    """
+    rows = list(traces)
+    if not rows:
+        return
+
+    conn.execute(
+        """
+        INSERT INTO reasoning_traces (function_id, agent, trace_json, created_at)
+        SELECT function_id, agent, trace_json, COALESCE(created_at, now()) FROM (
+            SELECT
+                unnest(?::VARCHAR[]) AS function_id,
+                unnest(?::VARCHAR[]) AS agent,
+                unnest(?::VARCHAR[]) AS trace_json,
+                unnest(?::TIMESTAMP[]) AS created_at
+        )
+        """,
+        _batch_columns(rows, 4, "reasoning trace"),
+    )
+
+
 def get_reasoning_traces(
     conn: duckdb.DuckDBPyConnection,
     function_id: str,
@@ -1194,29 +1419,47 @@ def get_reasoning_traces(
     Returns:
         List of trace dicts.
     """
+    query, params = _reasoning_traces_query(function_id, agent)
+    return [dict(zip(_TRACE_COLUMNS, row)) for row in conn.execute(query, params).fetchall()]
+
+
+def get_reasoning_traces_arrow(
+    conn: duckdb.DuckDBPyConnection,
+    function_id: str,
+    agent: Optional[str] = None,
+) -> Any:
+    """Get reasoning traces for a function as a columnar Arrow table.
+
+    Same rows and columns as get_reasoning_traces(), without building a
+    dict per trace, for dumps that write the traces straight out. Requires
+    the optional ``pyarrow`` package.
+
+    Args:
+        conn: DuckDB connection.
+        function_id: Function ID to get traces for.
+        agent: Optional agent name filter.
+
+    Returns:
+        pyarrow.Table with the get_reasoning_traces() columns.
+    """
+    query, params = _reasoning_traces_query(function_id, agent)
+    return conn.execute(query, params).fetch_arrow_table()
+
+
+# Dictionary keys for get_reasoning_traces() rows, in SELECT order
+_TRACE_COLUMNS = ("id", "function_id", "agent", "trace_json", "created_at")
+
+
+def _reasoning_traces_query(function_id: str, agent: Optional[str]) -> tuple[str, list[Any]]:
+    query = f"SELECT {', '.join(_TRACE_COLUMNS)} FROM reasoning_traces WHERE function_id = ?"
+    params: list[Any] = [function_id]
+
     if agent:
-        result = conn.execute(
-            """
-            SELECT id, function_id, agent, trace_json, created_at
-            FROM reasoning_traces
-            WHERE function_id = ? AND agent = ?
-            ORDER BY created_at DESC
-            """,
-            [function_id, agent],
-        ).fetchall()
-    else:
-        result = conn.execute(
-            """
-            SELECT id, function_id, agent, trace_json, created_at
-            FROM reasoning_traces
-            WHERE function_id = ?
-            ORDER BY created_at DESC
-            """,
-            [function_id],
-        ).fetchall()
+        query += " AND agent = ?"
+        params.append(agent)
 
-    columns = ["id", "function_id", "agent", "trace_json", "created_at"]
-    return [dict(zip(columns, row)) for row in result]
+    query += " ORDER BY created_at DESC"
+    return query, params
 
 
 # =============================================================================
@@ -1294,7 +1537,7 @@ def get_all_config(
 # =============================================================================
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class VisionFinding:
     """Represents a visual analysis finding from Vision Analyst.
 
@@ -1329,30 +1572,25 @@ class VisionFinding:
         """Create VisionFinding from database row.
 
         Args:
-            row: Database row tuple in column order.
+            row: Database row tuple in column order (the field order).
 
         Returns:
             VisionFinding instance.
         """
-        return cls(
-            id=row[0],
-            function_id=row[1],
-            finding_type=row[2],
-            significance=row[3],
-            description=row[4],
-            location=row[5],
-            invariant_implication=row[6],
-            status=row[7],
-            resolution_note=row[8],
-            plot_path=row[9],
-            created_at=row[10],
-        )
+        return cls(*row)
 
 
 # =============================================================================
 # Vision Finding Queries
 # =============================================================================
 
+# VisionFinding columns in field order, so rows unpack straight into VisionFinding
+_VISION_FINDING_SELECT_SQL = """
+    SELECT id, function_id, finding_type, significance, description,
+           location, invariant_implication, status, resolution_note,
+           plot_path, created_at
+    FROM vision_findings"""
+
 
 def insert_vision_finding(
     conn: duckdb.DuckDBPyConnection,
@@ -1388,19 +1626,17 @@ def insert_vision_finding(
     if significance not in VALID_FINDING_SIGNIFICANCE:
         raise ValueError(f"Invalid significance: {significance}. Must be one of {VALID_FINDING_SIGNIFICANCE}")
 
-    conn.execute(
+    (finding_id,) = conn.execute(
         """
         INSERT INTO vision_findings (
             function_id, finding_type, significance, description,
             location, invariant_implication, status, plot_path
         ) VALUES (?, ?, ?, ?, ?, ?, 'NEW', ?)
+        RETURNING id
         """,
         [function_id, finding_type, significance, description, location, invariant_implication, plot_path],
-    )
-
-    # Get the last inserted ID
-    result = conn.execute("SELECT MAX(id) FROM vision_findings WHERE function_id = ?", [function_id]).fetchone()
-    return result[0] if result else 0
+    ).fetchone()
+    return finding_id
 
 
 def get_vision_findings(
@@ -1420,13 +1656,7 @@ def get_vision_findings(
     Returns:
         List of VisionFinding objects.
     """
-    query = """
-        SELECT id, function_id, finding_type, significance, description,
-               location, invariant_implication, status, resolution_note,
-               plot_path, created_at
-        FROM vision_findings
-        WHERE function_id = ?
-    """
+    query = _VISION_FINDING_SELECT_SQL + " WHERE function_id = ?"
     params: list[Any] = [function_id]
 
     if status is not None:
@@ -1439,8 +1669,7 @@ def get_vision_findings(
 
     query += " ORDER BY created_at DESC"
 
-    result = conn.execute(query, params).fetchall()
-    return [VisionFinding.from_row(row) for row in result]
+    return [VisionFinding(*row) for row in conn.execute(query, params).fetchall()]
 
 
 def update_vision_finding_status(
@@ -1466,22 +1695,16 @@ def update_vision_finding_status(
     if status not in VALID_FINDING_STATUSES:
         raise ValueError(f"Invalid status: {status}. Must be one of {VALID_FINDING_STATUSES}")
 
-    # Check if finding exists
-    existing = conn.execute(
-        "SELECT 1 FROM vision_findings WHERE id = ?", [finding_id]
-    ).fetchone()
-    if existing is None:
-        return False
-
-    conn.execute(
+    return _execute_returning(
+        conn,
         """
         UPDATE vision_findings
         SET status = ?, resolution_note = ?
         WHERE id = ?
+        RETURNING 1
         """,
         [status, resolution_note, finding_id],
     )
-    return True
 
 
 def count_vision_findings(
@@ -1528,18 +1751,53 @@ def calculate_confidence_with_findings(
     Returns:
         Adjusted confidence score (0-100).
     """
-    penalty = 0
+    penalty = sum(
+        _FINDING_PENALTIES.get(finding.significance, 0)
+        for finding in findings
+        if finding.status == "NEW"
+    )
+    return max(0, base_confidence - penalty)
 
-    for finding in findings:
-        if finding.status == "NEW":
-            if finding.significance == "HIGH":
-                penalty += 15
-            elif finding.significance == "MEDIUM":
-                penalty += 8
-            elif finding.significance == "LOW":
-                penalty += 3
 
-    return max(0, base_confidence - penalty)
+# SQL mirror of _FINDING_PENALTIES, for aggregating penalties in the database
+_FINDING_PENALTY_SQL = (
+    "CASE significance "
+    + " ".join(f"WHEN '{level}' THEN {points}" for level, points in _FINDING_PENALTIES.items())
+    + " ELSE 0 END"
+)
+
+
+def get_vision_finding_penalties(
+    conn: duckdb.DuckDBPyConnection,
+    function_ids: list[str],
+) -> dict[str, tuple[int, int]]:
+    """Sum the confidence penalties of unresolved findings for many functions.
+
+    One aggregate query instead of fetching every finding per function; use
+    with calculate_confidence_with_findings()-style scoring:
+    ``max(0, base - penalty)``.
+
+    Args:
+        conn: DuckDB connection.
+        function_ids: Function IDs to look up.
+
+    Returns:
+        Dictionary of function_id -> (penalty, number of NEW findings).
+        Functions without NEW findings are omitted.
+    """
+    if not function_ids:
+        return {}
+
+    rows = conn.execute(
+        f"""
+        SELECT function_id, SUM({_FINDING_PENALTY_SQL}), COUNT(*)
+        FROM vision_findings
+        WHERE function_id = ANY(?::VARCHAR[]) AND status = 'NEW'
+        GROUP BY function_id
+        """,
+        [function_ids],
+    ).fetchall()
+    return {function_id: (int(penalty), count) for function_id, penalty, count in rows}
 
 
 def get_all_vision_findings(
@@ -1562,13 +1820,7 @@ def get_all_vision_findings(
     Raises:
         ValueError: If status or significance is invalid.
     """
-    query = """
-        SELECT id, function_id, finding_type, significance, description,
-               location, invariant_implication, status, resolution_note,
-               plot_path, created_at
-        FROM vision_findings
-        WHERE 1=1
-    """
+    query = _VISION_FINDING_SELECT_SQL + " WHERE 1=1"
     params: list[Any] = []
 
     if status is not None:
@@ -1586,5 +1838,4 @@ def get_all_vision_findings(
     query += " ORDER BY created_at DESC LIMIT ?"
     params.append(limit)
 
-    result = conn.execute(query, params).fetchall()
-    return [VisionFinding.from_row(row) for row in result]
+    return [VisionFinding(*row) for row in conn.execute(query, params).fetchall()]
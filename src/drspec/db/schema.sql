@@ -2,6 +2,15 @@
 -- Version: 1.0
 -- Strategy: Rebuild (no migrations)
 
+-- Enumerated status/category values (mirror the VALID_* sets in queries.py).
+-- ENUM columns are stored as small integer codes instead of strings.
+CREATE TYPE IF NOT EXISTS artifact_status AS ENUM ('PENDING', 'VERIFIED', 'NEEDS_REVIEW', 'STALE', 'BROKEN');
+CREATE TYPE IF NOT EXISTS queue_status AS ENUM ('PENDING', 'PROCESSING', 'COMPLETED', 'FAILED');
+CREATE TYPE IF NOT EXISTS queue_reason AS ENUM ('NEW', 'HASH_MISMATCH', 'DEPENDENCY_CHANGED', 'MANUAL_RETRY');
+CREATE TYPE IF NOT EXISTS finding_type AS ENUM ('outlier', 'discontinuity', 'boundary', 'correlation', 'missing_pattern');
+CREATE TYPE IF NOT EXISTS finding_significance AS ENUM ('HIGH', 'MEDIUM', 'LOW');
+CREATE TYPE IF NOT EXISTS finding_status AS ENUM ('NEW', 'ADDRESSED', 'IGNORED');
+
 -- artifacts: Stores scanned function information
 CREATE TABLE IF NOT EXISTS artifacts (
     function_id TEXT PRIMARY KEY,           -- format: filepath::function_name
@@ -14,7 +23,7 @@ CREATE TABLE IF NOT EXISTS artifacts (
     start_line INTEGER NOT NULL,            -- 1-indexed start line
     end_line INTEGER NOT NULL,              -- 1-indexed end line
     parent TEXT,                            -- parent class/namespace if applicable
-    status TEXT DEFAULT 'PENDING',          -- PENDING, VERIFIED, NEEDS_REVIEW, STALE, BROKEN
+    status artifact_status DEFAULT 'PENDING', -- PENDING, VERIFIED, NEEDS_REVIEW, STALE, BROKEN
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
@@ -33,8 +42,8 @@ CREATE TABLE IF NOT EXISTS contracts (
 CREATE TABLE IF NOT EXISTS queue (
     function_id TEXT PRIMARY KEY REFERENCES artifacts(function_id),
     priority INTEGER DEFAULT 100,           -- lower = higher priority
-    status TEXT DEFAULT 'PENDING',          -- PENDING, PROCESSING, COMPLETED, FAILED
-    reason TEXT DEFAULT 'NEW',              -- NEW, HASH_MISMATCH, DEPENDENCY_CHANGED, MANUAL_RETRY
+    status queue_status DEFAULT 'PENDING',  -- PENDING, PROCESSING, COMPLETED, FAILED
+    reason queue_reason DEFAULT 'NEW',      -- NEW, HASH_MISMATCH, DEPENDENCY_CHANGED, MANUAL_RETRY
     attempts INTEGER DEFAULT 0,             -- retry count to prevent infinite loops
     max_attempts INTEGER DEFAULT 3,         -- maximum retry attempts
     error_message TEXT,                     -- last error message if failed
@@ -76,23 +85,28 @@ CREATE SEQUENCE IF NOT EXISTS seq_vision_findings_id START 1;
 CREATE TABLE IF NOT EXISTS vision_findings (
     id INTEGER PRIMARY KEY DEFAULT nextval('seq_vision_findings_id'),
     function_id TEXT NOT NULL REFERENCES artifacts(function_id),
-    finding_type TEXT NOT NULL,             -- outlier, discontinuity, boundary, correlation, missing_pattern
-    significance TEXT NOT NULL,             -- HIGH, MEDIUM, LOW
+    finding_type finding_type NOT NULL,     -- outlier, discontinuity, boundary, correlation, missing_pattern
+    significance finding_significance NOT NULL, -- HIGH, MEDIUM, LOW
     description TEXT NOT NULL,              -- Description of the finding
     location TEXT,                          -- Where in the plot (x range, cluster, etc.)
     invariant_implication TEXT,             -- Suggested invariant change
-    status TEXT DEFAULT 'NEW',              -- NEW, ADDRESSED, IGNORED
+    status finding_status DEFAULT 'NEW',    -- NEW, ADDRESSED, IGNORED
     resolution_note TEXT,                   -- How it was addressed or why ignored
     plot_path TEXT,                         -- Path to the plot image
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
 
+-- v_artifact_status_counts: Artifact count per status (status dashboards)
+CREATE OR REPLACE VIEW v_artifact_status_counts AS
+    SELECT status, COUNT(*) AS cnt FROM artifacts GROUP BY status;
+
 -- Indexes for common queries
 CREATE INDEX IF NOT EXISTS idx_artifacts_status ON artifacts(status);
 CREATE INDEX IF NOT EXISTS idx_artifacts_file_path ON artifacts(file_path);
 CREATE INDEX IF NOT EXISTS idx_contracts_confidence ON contracts(confidence_score);
 CREATE INDEX IF NOT EXISTS idx_queue_priority ON queue(priority, created_at);
 CREATE INDEX IF NOT EXISTS idx_queue_status ON queue(status);
+CREATE INDEX IF NOT EXISTS idx_dependencies_caller ON dependencies(caller_id);
 CREATE INDEX IF NOT EXISTS idx_dependencies_callee ON dependencies(callee_id);
 CREATE INDEX IF NOT EXISTS idx_reasoning_traces_function ON reasoning_traces(function_id);
 CREATE INDEX IF NOT EXISTS idx_reasoning_traces_agent ON reasoning_traces(agent);
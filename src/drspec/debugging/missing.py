@@ -6,12 +6,13 @@ within a debugging workflow, enabling handoff to the Architect Council.
 
 from __future__ import annotations
 
+from collections import defaultdict
 from dataclasses import dataclass, field
-from typing import Any
+from typing import Any, Optional
 
 import duckdb
 
-from drspec.db import get_artifact, get_callees
+from drspec.db import get_artifact
 
 
 # =============================================================================
@@ -115,6 +116,52 @@ def _has_contract(conn: duckdb.DuckDBPyConnection, function_id: str) -> bool:
     return result is not None
 
 
+# Every edge the BFS could follow, in table order, with the callee's
+# contract and artifact details; walk covers functions < max_depth hops away
+_CALL_CHAIN_SQL = """
+    WITH RECURSIVE walk(function_id, depth) AS (
+        SELECT ?, 0
+        UNION
+        SELECT d.callee_id, w.depth + 1
+        FROM walk w
+        JOIN dependencies d ON d.caller_id = w.function_id
+        WHERE w.depth + 1 < ?
+    )
+    SELECT d.caller_id, d.callee_id, c.function_id IS NOT NULL, a.file_path, a.function_name
+    FROM dependencies d
+    LEFT JOIN contracts c ON c.function_id = d.callee_id
+    LEFT JOIN artifacts a ON a.function_id = d.callee_id
+    WHERE d.caller_id IN (SELECT function_id FROM walk)
+    ORDER BY d.rowid
+"""
+
+
+def _load_call_chain(
+    conn: duckdb.DuckDBPyConnection,
+    function_id: str,
+    max_depth: int,
+) -> dict[str, list[tuple[str, bool, Optional[str], Optional[str]]]]:
+    """Load the call chain below a function in one recursive query.
+
+    Args:
+        conn: DuckDB connection.
+        function_id: Function ID at the root of the chain.
+        max_depth: Maximum call chain depth.
+
+    Returns:
+        Mapping of caller ID to its callees, each as (callee_id,
+        has_contract, file_path, function_name) in get_callees() order.
+        file_path and function_name are None for callees without an artifact.
+    """
+    chain: dict[str, list[tuple[str, bool, Optional[str], Optional[str]]]] = defaultdict(list)
+    if max_depth <= 0:
+        return chain
+
+    for caller_id, *callee in conn.execute(_CALL_CHAIN_SQL, [function_id, max_depth]).fetchall():
+        chain[caller_id].append(tuple(callee))
+    return chain
+
+
 def detect_missing_contracts(
     conn: duckdb.DuckDBPyConnection,
     function_id: str,
@@ -154,44 +201,38 @@ def detect_missing_contracts(
             ))
             priority += 1
 
-    # BFS through call chain
+    # Breadth-first through the call chain, loaded up front in one query
+    callees = _load_call_chain(conn, function_id, max_depth)
     visited = {function_id}
-    queue: list[tuple[str, int]] = [(function_id, 0)]
-
-    while queue:
-        current_id, depth = queue.pop(0)
-
-        if depth >= max_depth:
-            continue
-
-        # Get callees of current function
-        callees = get_callees(conn, current_id)
-
-        for callee_id in callees:
-            if callee_id in visited:
-                continue
-            visited.add(callee_id)
-
-            # Check if callee has a contract
-            if not _has_contract(conn, callee_id):
-                artifact = get_artifact(conn, callee_id)
-                if artifact:
-                    relationship = "callee" if depth == 0 else "transitive"
-                    reason = _generate_reason(relationship, depth + 1, current_id)
-
-                    missing.append(MissingContract(
-                        function_id=callee_id,
-                        file_path=artifact.file_path,
-                        function_name=artifact.function_name,
-                        relationship=relationship,
-                        depth=depth + 1,
-                        priority=priority,
-                        reason=reason,
-                    ))
-                    priority += 1
-
-            # Add to queue for further exploration
-            queue.append((callee_id, depth + 1))
+    level = [function_id]
+
+    for depth in range(max_depth):
+        relationship = "callee" if depth == 0 else "transitive"
+        next_level: list[str] = []
+
+        for current_id in level:
+            for callee_id, has_contract, file_path, function_name in callees.get(current_id, ()):
+                if callee_id in visited:
+                    continue
+                visited.add(callee_id)
+                next_level.append(callee_id)
+
+                if has_contract or file_path is None:
+                    continue
+                missing.append(MissingContract(
+                    function_id=callee_id,
+                    file_path=file_path,
+                    function_name=function_name,
+                    relationship=relationship,
+                    depth=depth + 1,
+                    priority=priority,
+                    reason=_generate_reason(relationship, depth + 1, current_id),
+                ))
+                priority += 1
+
+        level = next_level
+        if not level:
+            break
 
     # Generate suggestion
     suggestion = _generate_suggestion(missing, function_id)
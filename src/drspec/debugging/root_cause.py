@@ -7,12 +7,25 @@ in source code based on invariant violations.
 from __future__ import annotations
 
 import hashlib
+import heapq
 import re
 from dataclasses import dataclass, field
 from typing import Any, Optional
 
 from drspec.debugging.violation import ViolationDetail
 
+# Identifiers in a violation's actual value
+_IDENTIFIER_PATTERN = re.compile(r"\b[a-z_][a-z0-9_]*\b")
+
+# Arithmetic operators, checked on every source line
+_ARITHMETIC_PATTERN = re.compile(r"[-+*/]")
+
+# Calls and operators that add to a collection
+_COLLECTION_ADD_PATTERN = re.compile(r"\.append\(|\.extend\(|\.add\(|\.insert\(|\.update\(|\+=")
+
+# Assignment to a result-like variable, matched against the lowercased line
+_RESULT_ASSIGNMENT_PATTERN = re.compile(r"(?:result|output|ret|response|data|value) ?=")
+
 
 # =============================================================================
 # Root Cause Models
@@ -107,6 +120,7 @@ def identify_root_cause(
     violation: ViolationDetail,
     start_line: int = 1,
     stored_hash: Optional[str] = None,
+    current_hash: Optional[str] = None,
 ) -> RootCauseReport:
     """Identify likely root cause lines for a violation.
 
@@ -120,27 +134,31 @@ def identify_root_cause(
         violation: The violation to analyze.
         start_line: Starting line number of the function in file.
         stored_hash: Hash of stored source (for freshness check).
+        current_hash: SHA-256 hex digest of source_code, if the caller has
+            it already (e.g. when analyzing several violations against the
+            same source). Computed when needed if omitted.
 
     Returns:
         RootCauseReport with candidate root cause lines.
     """
-    # Check source freshness
-    current_hash = hashlib.sha256(source_code.encode()).hexdigest()
-    source_is_current = stored_hash is None or current_hash == stored_hash
-
-    # Analyze for root cause candidates
+    # Check source freshness (only hash when there is something to compare)
+    source_is_current = True
+    if stored_hash is not None:
+        if current_hash is None:
+            current_hash = hashlib.sha256(source_code.encode()).hexdigest()
+        source_is_current = current_hash == stored_hash
+
+    # Analyze for the top 5 root cause candidates, by confidence
     candidates = _analyze_source_for_root_cause(
         source_code=source_code,
         violation=violation,
         start_line=start_line,
+        limit=5,
     )
 
-    # Sort by confidence
-    candidates = sorted(candidates, key=lambda c: c.confidence, reverse=True)
-
     # Separate primary and secondary
     primary = candidates[0] if candidates else None
-    secondary = candidates[1:5] if len(candidates) > 1 else []  # Top 4 secondary
+    secondary = candidates[1:]  # Top 4 secondary
 
     # Generate recommendation
     recommendation = _generate_recommendation(violation, primary)
@@ -160,6 +178,7 @@ def _analyze_source_for_root_cause(
     source_code: str,
     violation: ViolationDetail,
     start_line: int,
+    limit: int,
 ) -> list[RootCauseCandidate]:
     """Analyze source code to find potential root cause lines.
 
@@ -167,12 +186,17 @@ def _analyze_source_for_root_cause(
         source_code: Function source code.
         violation: Violation to analyze.
         start_line: Starting line number in file.
+        limit: Maximum number of candidates to return.
 
     Returns:
-        List of RootCauseCandidate objects.
+        Up to limit RootCauseCandidate objects, highest confidence first
+        (earlier lines first among equal confidence).
     """
-    candidates = []
+    # (confidence, line index, explanations) for lines above the threshold;
+    # candidates and their snippets are only built for the top ones
+    scored: list[tuple[float, int, list[str]]] = []
     lines = source_code.split("\n")
+    lowers = [line.lower() for line in lines]
 
     violation_lower = (violation.invariant_logic or "").lower()
     actual_lower = (violation.actual or "").lower()
@@ -182,9 +206,7 @@ def _analyze_source_for_root_cause(
     keywords = _extract_keywords(violation)
 
     # Pattern analysis
-    for i, line in enumerate(lines):
-        line_lower = line.lower()
-        line_number = start_line + i
+    for i, (line, line_lower) in enumerate(zip(lines, lowers)):
         confidence = 0.0
         explanations = []
 
@@ -197,7 +219,7 @@ def _analyze_source_for_root_cause(
         # Pattern 2: Duplicate-related violations
         if "duplicate" in name_lower or "duplicate" in violation_lower or "unique" in name_lower:
             if _is_collection_add(line):
-                if not _has_check_before(lines, i, ["not in", "if", "check"]):
+                if not _has_check_before(lowers, i, ["not in", "if", "check"]):
                     confidence += 0.4
                     explanations.append("Adds to collection without duplicate check")
 
@@ -236,16 +258,20 @@ def _analyze_source_for_root_cause(
 
         # Only add as candidate if confidence is above threshold
         if confidence >= 0.25 and explanations:
-            snippet = _extract_snippet(lines, i, context=2)
-            candidates.append(RootCauseCandidate(
-                line_number=line_number,
-                confidence=min(confidence, 1.0),
-                explanation="; ".join(explanations),
-                code_snippet=snippet,
-                highlighted_line=line.strip(),
-            ))
-
-    return candidates
+            scored.append((min(confidence, 1.0), i, explanations))
+
+    # Same order as a stable sort by confidence, descending
+    top = heapq.nlargest(limit, scored, key=lambda item: item[0])
+    return [
+        RootCauseCandidate(
+            line_number=start_line + i,
+            confidence=confidence,
+            explanation="; ".join(explanations),
+            code_snippet=_extract_snippet(lines, i, context=2),
+            highlighted_line=lines[i].strip(),
+        )
+        for confidence, i, explanations in top
+    ]
 
 
 def _extract_keywords(violation: ViolationDetail) -> list[str]:
@@ -267,7 +293,7 @@ def _extract_keywords(violation: ViolationDetail) -> list[str]:
     # From actual value
     if violation.actual:
         # Extract identifiers from actual
-        words = re.findall(r"\b[a-z_][a-z0-9_]*\b", violation.actual.lower())
+        words = _IDENTIFIER_PATTERN.findall(violation.actual.lower())
         for word in words:
             if len(word) >= 3:
                 keywords.add(word)
@@ -292,15 +318,13 @@ def _extract_keywords(violation: ViolationDetail) -> list[str]:
 
 def _is_collection_add(line: str) -> bool:
     """Check if line adds to a collection."""
-    patterns = [".append(", ".extend(", ".add(", ".insert(", ".update(", "+="]
-    return any(p in line for p in patterns)
+    return _COLLECTION_ADD_PATTERN.search(line) is not None
 
 
-def _has_check_before(lines: list[str], index: int, check_keywords: list[str]) -> bool:
-    """Check if there's a validation check before the given line."""
+def _has_check_before(lowers: list[str], index: int, check_keywords: list[str]) -> bool:
+    """Check if there's a validation check before the given (lowercased) line."""
     # Look at previous 3 lines
-    for i in range(max(0, index - 3), index):
-        line_lower = lines[i].lower()
+    for line_lower in lowers[max(0, index - 3):index]:
         if any(kw in line_lower for kw in check_keywords):
             return True
     return False
@@ -314,14 +338,12 @@ def _might_return_none(line: str) -> bool:
 
 def _is_arithmetic_operation(line: str) -> bool:
     """Check if line contains arithmetic that could produce negative values."""
-    return bool(re.search(r"[-+*/]", line) and "=" in line)
+    return bool(_ARITHMETIC_PATTERN.search(line) and "=" in line)
 
 
 def _is_result_assignment(line: str) -> bool:
     """Check if line assigns to a result-like variable."""
-    result_vars = ["result", "output", "ret", "response", "data", "value"]
-    line_lower = line.lower()
-    return any(f"{var} =" in line_lower or f"{var}=" in line_lower for var in result_vars)
+    return _RESULT_ASSIGNMENT_PATTERN.search(line.lower()) is not None
 
 
 def _has_else_following(lines: list[str], index: int) -> bool:
@@ -298,6 +298,13 @@ class TestQueryContracts:
 
         assert results == {}
 
+    def test_duplicate_ids_return_single_entry(self, db_with_contracts):
+        """Should tolerate repeated IDs in the input list."""
+        function_ids = ["src/math.py::calculate_sum"] * 3
+        results = query_contracts(db_with_contracts, function_ids)
+
+        assert list(results) == ["src/math.py::calculate_sum"]
+
     def test_batch_query_performance(self, db_with_contracts):
         """Should handle batch query efficiently."""
         function_ids = [
@@ -343,6 +350,29 @@ class TestSearchContracts:
         assert len(results) == 1
         assert results[0].function_name == "validate_input"
 
+    def test_name_prefix_ranks_before_id_substring(self, db_with_contracts):
+        """Should list name-prefix matches before function_id substring matches."""
+        insert_artifact(
+            db_with_contracts,
+            function_id="src/validate.py::check",
+            file_path="src/validate.py",
+            function_name="check",
+            signature="def check() -> bool",
+            body="def check() -> bool:\n    return True",
+            code_hash="hash_check",
+            language="python",
+            start_line=1,
+            end_line=2,
+        )
+        insert_contract(db_with_contracts, "src/validate.py::check", "{}", 0.5)
+
+        results = search_contracts(db_with_contracts, "validate")
+
+        assert [r.function_id for r in results] == [
+            "src/utils.py::validate_input",
+            "src/validate.py::check",
+        ]
+
     def test_respects_limit(self, db_with_contracts):
         """Should respect limit parameter."""
         results = search_contracts(db_with_contracts, "calculate", limit=1)
@@ -1,6 +1,7 @@
 """Tests for core resources module."""
 
 from pathlib import Path
+from unittest.mock import patch
 
 
 from drspec.core.resources import (
@@ -8,6 +9,7 @@ from drspec.core.resources import (
     get_schema_path,
     list_template_files,
     _get_base_path,
+    _resolve_schema_path,
 )
 
 
@@ -69,6 +71,17 @@ class TestGetSchemaPath:
         assert "CREATE TABLE" in content
         assert "artifacts" in content
 
+    def test_path_is_resolved_once(self):
+        """Repeated calls return the path resolved at import."""
+        assert get_schema_path() is get_schema_path()
+
+    def test_resolves_frozen_bundle_path(self):
+        """In PyInstaller frozen mode, schema lives under the bundle."""
+        with patch("sys.frozen", True, create=True):
+            with patch("sys._MEIPASS", "/tmp/meipass", create=True):
+                path = _resolve_schema_path()
+                assert path == Path("/tmp/meipass") / "drspec" / "db" / "schema.sql"
+
 
 class TestListTemplateFiles:
     """Tests for list_template_files function."""
@@ -93,3 +106,9 @@ class TestListTemplateFiles:
         required = ["librarian.md", "proposer.md", "critic.md", "judge.md", "debugger.md"]
         for template in required:
             assert template in files, f"Missing template: {template}"
+
+    def test_returns_fresh_list_each_call(self):
+        """Cached listing is not exposed to mutation by callers."""
+        files = list_template_files()
+        files.clear()
+        assert "librarian.md" in list_template_files()
@@ -80,6 +80,17 @@ class TestGetConnectionContext:
             with pytest.raises(Exception):
                 conn.execute("SELECT 1")
 
+    def test_releases_database_on_exit(self):
+        """Test the database file can be reopened read-only after exit."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "test.db"
+            with get_connection_context(db_path) as conn:
+                conn.execute("CREATE TABLE t (x INTEGER)")
+
+            reader = duckdb.connect(str(db_path), read_only=True)
+            assert reader.execute("SELECT COUNT(*) FROM t").fetchone()[0] == 0
+            reader.close()
+
 
 class TestInitSchema:
     """Tests for init_schema function."""
@@ -152,6 +163,71 @@ class TestInitSchema:
             conn.close()
 
 
+    def test_schema_file_read_once(self):
+        """Test schema.sql is read from disk only on first use."""
+        from drspec.db.connection import _read_schema_sql
+
+        _read_schema_sql.cache_clear()
+        conn = duckdb.connect(":memory:")
+        init_schema(conn)
+        init_schema(conn, rebuild=True)
+
+        assert _read_schema_sql.cache_info().misses == 1
+        conn.close()
+
+    def test_creates_traversal_indexes(self):
+        """Test schema indexes both sides of the dependencies table."""
+        conn = duckdb.connect(":memory:")
+        init_schema(conn)
+
+        index_names = {
+            r[0]
+            for r in conn.execute(
+                "SELECT index_name FROM duckdb_indexes() WHERE table_name = 'dependencies'"
+            ).fetchall()
+        }
+        assert {"idx_dependencies_caller", "idx_dependencies_callee"} <= index_names
+        conn.close()
+
+    def test_status_columns_are_enums(self):
+        """Test low-cardinality status columns use ENUM types."""
+        conn = duckdb.connect(":memory:")
+        init_schema(conn)
+
+        column_types = dict(
+            conn.execute(
+                "SELECT table_name || '.' || column_name, data_type FROM duckdb_columns() "
+                "WHERE column_name IN ('status', 'reason', 'finding_type', 'significance')"
+            ).fetchall()
+        )
+        assert all(data_type.startswith("ENUM") for data_type in column_types.values())
+        assert {
+            "artifacts.status",
+            "queue.status",
+            "queue.reason",
+            "vision_findings.finding_type",
+            "vision_findings.significance",
+            "vision_findings.status",
+        } <= set(column_types)
+
+        with pytest.raises(duckdb.ConversionException):
+            conn.execute(
+                "INSERT INTO artifacts (function_id, file_path, function_name, signature, body, code_hash, "
+                "language, start_line, end_line, status) "
+                "VALUES ('test::foo', 'test.py', 'foo', 'def foo():', 'pass', 'abc123', 'python', 1, 2, 'DONE')"
+            )
+        conn.close()
+
+    def test_rebuild_recreates_enum_types(self):
+        """Test rebuild=True drops and recreates the ENUM types."""
+        conn = duckdb.connect(":memory:")
+        init_schema(conn)
+        init_schema(conn, rebuild=True)
+
+        type_names = {r[0] for r in conn.execute("SELECT type_name FROM duckdb_types() WHERE logical_type = 'ENUM'").fetchall()}
+        assert "artifact_status" in type_names
+        conn.close()
+
 class TestEnsureDbDirectory:
     """Tests for ensure_db_directory function."""
 
@@ -347,6 +347,30 @@ class TestGetDependencyGraph:
         # No error should occur
 
 
+    def test_get_graph_edges_stop_at_depth(self, populated_db):
+        """Test that only edges leaving nodes above the depth limit are followed."""
+        graph = get_dependency_graph(populated_db, "src/app.py::main", depth=1, direction="callees")
+
+        assert {(e.caller_id, e.callee_id) for e in graph.edges} == {
+            ("src/app.py::main", "src/app.py::helper"),
+            ("src/app.py::main", "src/log.py::logger"),
+        }
+        assert {n.function_id for n in graph.nodes} == {
+            "src/app.py::main",
+            "src/app.py::helper",
+            "src/log.py::logger",
+        }
+
+    def test_get_nodes_info_batch(self, populated_db):
+        """Test batched node info lookup skips unknown functions."""
+        from drspec.db.graph import _get_nodes_info
+
+        info = _get_nodes_info(populated_db, {"src/app.py::main", "src/log.py::logger", "missing::x"})
+
+        assert set(info) == {"src/app.py::main", "src/log.py::logger"}
+        assert info["src/app.py::main"]["has_contract"] is True
+        assert info["src/log.py::logger"]["function_name"] == "logger"
+
 class TestGetCalleeGraph:
     """Tests for get_callee_graph convenience function."""
 
@@ -407,6 +431,25 @@ class TestCycleDetection:
         assert len(cyclic_edges) >= 1
 
 
+    def test_detect_cycles_deep_chain(self):
+        """Test that long call chains do not hit the recursion limit."""
+        import sys
+
+        from drspec.db.graph import _detect_cycles
+
+        length = sys.getrecursionlimit() + 100
+        edges = [(f"f{i}", f"f{i + 1}") for i in range(length)]
+        edges.append((f"f{length}", "f0"))
+
+        assert _detect_cycles(edges) == {(f"f{length}", "f0")}
+
+    def test_detect_cycles_self_loop_and_star(self):
+        """Test self-calls are cyclic while a fan-out with no back edges is not."""
+        from drspec.db.graph import _detect_cycles
+
+        assert _detect_cycles([("a", "b"), ("a", "c")]) == set()
+        assert _detect_cycles([("a", "a"), ("a", "b")]) == {("a", "a")}
+
 class TestGetGraphStatistics:
     """Tests for get_graph_statistics function."""
 
@@ -1,11 +1,14 @@
 """Tests for database query functions."""
 
+import dataclasses
 import tempfile
+from datetime import datetime
 from pathlib import Path
 
 import pytest
 import duckdb
 
+import drspec.db.queries as queries_module
 from drspec.db.connection import init_schema
 from drspec.db.queries import (
     Artifact,
@@ -14,15 +17,21 @@ from drspec.db.queries import (
     VALID_QUEUE_STATUSES,
     VALID_QUEUE_REASONS,
     insert_artifact,
+    insert_artifacts_bulk,
     get_artifact,
     list_artifacts,
+    list_artifact_names,
     count_artifacts,
+    prefix_filter,
     update_artifact_status,
     insert_contract,
     get_contract,
     list_contracts,
+    list_contracts_arrow,
+    get_contract_confidence_stats,
     queue_push,
     queue_pop,
+    queue_pop_many,
     queue_peek,
     queue_get,
     queue_complete,
@@ -32,10 +41,13 @@ from drspec.db.queries import (
     queue_count,
     queue_clear_completed,
     insert_dependency,
+    insert_dependencies,
     get_callers,
     get_callees,
     insert_reasoning_trace,
+    insert_reasoning_traces,
     get_reasoning_traces,
+    get_reasoning_traces_arrow,
 )
 
 
@@ -377,6 +389,24 @@ class TestArtifactQueries:
         result = update_artifact_status(db_conn, "nonexistent::foo", "VERIFIED")
         assert result is False
 
+    def test_update_artifact_status_same_value(self, db_conn):
+        """Test re-applying the current status still reports a match."""
+        insert_artifact(
+            db_conn,
+            function_id="test.py::foo",
+            file_path="test.py",
+            function_name="foo",
+            signature="def foo():",
+            body="pass",
+            code_hash="abc",
+            language="python",
+            start_line=1,
+            end_line=2,
+        )
+
+        assert update_artifact_status(db_conn, "test.py::foo", "PENDING") is True
+        assert count_artifacts(db_conn) == 1
+
     def test_update_artifact_status_invalid(self, db_conn):
         """Test updating with invalid status raises ValueError."""
         insert_artifact(
@@ -396,6 +426,108 @@ class TestArtifactQueries:
             update_artifact_status(db_conn, "test.py::foo", "INVALID")
 
 
+def _bulk_row(function_id, code_hash, parent=None):
+    """Build an insert_artifacts_bulk() row for a python function."""
+    return (function_id, "test.py", function_id.split("::")[-1], "def f():", "pass",
+            code_hash, "python", 1, 2, parent)
+
+
+class TestInsertArtifactsBulk:
+    """Tests for insert_artifacts_bulk function."""
+
+    def test_bulk_empty(self, db_conn):
+        """Test an empty batch writes nothing."""
+        assert insert_artifacts_bulk(db_conn, []) == []
+        assert count_artifacts(db_conn) == 0
+
+    def test_bulk_new_changed_unchanged(self, db_conn):
+        """Test per-row outcomes for new, changed and unchanged rows."""
+        insert_artifacts_bulk(db_conn, [_bulk_row("test.py::a", "h1"), _bulk_row("test.py::b", "h1")])
+
+        outcomes = insert_artifacts_bulk(db_conn, [
+            _bulk_row("test.py::a", "h1"),
+            _bulk_row("test.py::b", "h2", parent="Cls"),
+            _bulk_row("test.py::c", "h1"),
+        ])
+
+        assert outcomes == ["unchanged", "changed", "new"]
+        artifact = get_artifact(db_conn, "test.py::b")
+        assert artifact.code_hash == "h2"
+        assert artifact.parent == "Cls"
+        assert artifact.status == "PENDING"
+        assert get_artifact(db_conn, "test.py::c").start_line == 1
+        assert count_artifacts(db_conn) == 3
+
+    def test_bulk_status_transitions(self, db_conn):
+        """Test changed rows follow insert_artifact status rules."""
+        insert_artifacts_bulk(db_conn, [
+            _bulk_row("test.py::verified", "h1"),
+            _bulk_row("test.py::review", "h1"),
+            _bulk_row("test.py::broken", "h1"),
+            _bulk_row("test.py::stale", "h1"),
+        ])
+        update_artifact_status(db_conn, "test.py::verified", "VERIFIED")
+        update_artifact_status(db_conn, "test.py::review", "NEEDS_REVIEW")
+        update_artifact_status(db_conn, "test.py::broken", "BROKEN")
+        update_artifact_status(db_conn, "test.py::stale", "STALE")
+
+        insert_artifacts_bulk(db_conn, [
+            _bulk_row("test.py::verified", "h2"),
+            _bulk_row("test.py::review", "h2"),
+            _bulk_row("test.py::broken", "h2"),
+            _bulk_row("test.py::stale", "h2"),
+        ])
+
+        assert get_artifact(db_conn, "test.py::verified").status == "STALE"
+        assert get_artifact(db_conn, "test.py::review").status == "STALE"
+        assert get_artifact(db_conn, "test.py::broken").status == "BROKEN"
+        assert get_artifact(db_conn, "test.py::stale").status == "PENDING"
+
+    def test_bulk_rows_share_one_timestamp(self, db_conn):
+        """Test a batch stamps every row with the same updated_at."""
+        insert_artifacts_bulk(db_conn, [_bulk_row(f"test.py::f{i}", "h1") for i in range(50)])
+        insert_artifacts_bulk(db_conn, [_bulk_row(f"test.py::f{i}", "h2") for i in range(25)])
+
+        stamps = db_conn.execute(
+            "SELECT code_hash, COUNT(DISTINCT updated_at) FROM artifacts GROUP BY code_hash"
+        ).fetchall()
+        assert sorted(stamps) == [("h1", 1), ("h2", 1)]
+
+    def test_bulk_duplicate_ids_in_batch(self, db_conn):
+        """Test repeated IDs behave like consecutive insert_artifact calls."""
+        outcomes = insert_artifacts_bulk(db_conn, [
+            _bulk_row("test.py::a", "h1"),
+            _bulk_row("test.py::a", "h1"),
+            _bulk_row("test.py::a", "h2"),
+        ])
+
+        assert outcomes == ["new", "unchanged", "changed"]
+        assert get_artifact(db_conn, "test.py::a").code_hash == "h2"
+        assert count_artifacts(db_conn) == 1
+
+
+class TestPrefixFilter:
+    """Tests for prefix_filter helper."""
+
+    def test_prefix_filter_range(self):
+        """Test the upper bound bumps the last character."""
+        assert prefix_filter("file_path", "src/") == ("(file_path >= ? AND file_path < ?)", ["src/", "src0"])
+
+    def test_prefix_filter_max_code_point(self):
+        """Test trailing maximal code points are dropped from the bound."""
+        condition, params = prefix_filter("c", "a\U0010ffff")
+        assert params == ["a\U0010ffff", "b"]
+
+        condition, params = prefix_filter("c", "\U0010ffff")
+        assert condition == "starts_with(c, ?)"
+        assert params == ["\U0010ffff"]
+
+    def test_prefix_filter_skips_surrogates(self):
+        """Test the bound never lands on an unencodable surrogate."""
+        _, params = prefix_filter("c", "\ud7ff")
+        assert params[1] == "\ue000"
+
+
 class TestListArtifacts:
     """Tests for list_artifacts function."""
 
@@ -493,6 +625,18 @@ class TestListArtifacts:
         tests_artifacts = list_artifacts(db_conn, file_path="tests/")
         assert len(tests_artifacts) == 1
 
+    def test_list_artifacts_file_path_prefix_is_literal(self, db_conn):
+        """Test LIKE wildcards in the file path prefix match literally."""
+        insert_artifacts_bulk(db_conn, [
+            ("src/my_mod.py::f", "src/my_mod.py", "f", "def f():", "pass", "h", "python", 1, 2, None),
+            ("src/myXmod.py::g", "src/myXmod.py", "g", "def g():", "pass", "h", "python", 1, 2, None),
+            ("src/my%.py::h", "src/my%.py", "h", "def h():", "pass", "h", "python", 1, 2, None),
+        ])
+
+        assert [a.function_id for a in list_artifacts(db_conn, file_path="src/my_")] == ["src/my_mod.py::f"]
+        assert [a.function_id for a in list_artifacts(db_conn, file_path="src/my%")] == ["src/my%.py::h"]
+        assert len(list_artifacts(db_conn, file_path="")) == 3
+
     def test_list_artifacts_filter_by_language(self, db_conn):
         """Test filtering artifacts by language."""
         insert_artifact(
@@ -556,6 +700,29 @@ class TestListArtifacts:
         assert page1_ids.isdisjoint(page2_ids)
 
 
+    def test_list_artifact_names_matches_list_order(self, db_conn):
+        """Test name-only listing follows list_artifacts ordering and limit."""
+        for i in (2, 0, 1):
+            insert_artifact(
+                db_conn,
+                function_id=f"test{i}.py::foo",
+                file_path=f"test{i}.py",
+                function_name="foo",
+                signature="def foo():",
+                body="pass",
+                code_hash=f"hash{i}",
+                language="python",
+                start_line=1,
+                end_line=2,
+            )
+
+        names = list_artifact_names(db_conn, limit=2)
+
+        assert names == [
+            (a.function_id, a.function_name, a.file_path) for a in list_artifacts(db_conn, limit=2)
+        ]
+        assert names[0] == ("test0.py::foo", "foo", "test0.py")
+
 class TestCountArtifacts:
     """Tests for count_artifacts function."""
 
@@ -606,6 +773,25 @@ class TestCountArtifacts:
         assert count_artifacts(db_conn, status="STALE") == 1
 
 
+class TestRowColumnOrder:
+    """Tests that row SELECTs list columns in dataclass field order."""
+
+    @pytest.mark.parametrize(
+        "sql_name, model",
+        [
+            ("_ARTIFACT_SELECT_SQL", Artifact),
+            ("_CONTRACT_DETAILS_SQL", queries_module.ContractDetails),
+            ("_QUEUE_SELECT_SQL", QueueItem),
+            ("_VISION_FINDING_SELECT_SQL", queries_module.VisionFinding),
+        ],
+    )
+    def test_select_matches_fields(self, db_conn, sql_name, model):
+        """Test rows can be unpacked positionally into the model."""
+        description = db_conn.execute(getattr(queries_module, sql_name) + " LIMIT 0").description
+
+        assert [column[0] for column in description] == [f.name for f in dataclasses.fields(model)]
+
+
 class TestStatusConstants:
     """Tests for status constant values."""
 
@@ -720,6 +906,111 @@ class TestContractQueries:
         verified = list_contracts(db_conn, status="VERIFIED")
         assert len(verified) == 2
 
+    def test_list_contracts_arrow_matches_dicts(self, db_conn):
+        """Test the Arrow listing has the same rows as list_contracts."""
+        pytest.importorskip("pyarrow")
+        for i in range(3):
+            insert_artifact(
+                db_conn,
+                function_id=f"test{i}.py::foo",
+                file_path=f"test{i}.py",
+                function_name="foo",
+                signature="def foo():",
+                body="pass",
+                code_hash=f"hash{i}",
+                language="python",
+                start_line=1,
+                end_line=2,
+            )
+            insert_contract(db_conn, function_id=f"test{i}.py::foo", contract_json="{}", confidence_score=i / 10)
+
+        table = list_contracts_arrow(db_conn, limit=2)
+
+        assert table.to_pylist() == list_contracts(db_conn, limit=2)
+
+    def test_list_contracts_row_fields(self, db_conn):
+        """Test list_contracts maps each key to its own column."""
+        insert_artifact(
+            db_conn,
+            function_id="test.py::foo",
+            file_path="test.py",
+            function_name="foo",
+            signature="def foo():",
+            body="pass",
+            code_hash="hash",
+            language="python",
+            start_line=1,
+            end_line=2,
+        )
+        insert_contract(
+            db_conn,
+            function_id="test.py::foo",
+            contract_json="{}",
+            confidence_score=0.75,
+            verification_script="assert True",
+        )
+
+        (row,) = list_contracts(db_conn)
+
+        assert set(row) == {"function_id", "contract_json", "confidence_score", "created_at", "updated_at", "status"}
+        assert row["status"] == "PENDING"
+        assert isinstance(row["created_at"], datetime)
+        assert isinstance(row["updated_at"], datetime)
+
+
+class TestContractConfidenceStats:
+    """Tests for get_contract_confidence_stats."""
+
+    def _add(self, conn, name, score):
+        insert_artifact(
+            conn,
+            function_id=f"test.py::{name}",
+            file_path="test.py",
+            function_name=name,
+            signature=f"def {name}():",
+            body="pass",
+            code_hash=name,
+            language="python",
+            start_line=1,
+            end_line=2,
+        )
+        insert_contract(conn, function_id=f"test.py::{name}", contract_json="{}", confidence_score=score)
+
+    def test_stats_empty(self, db_conn):
+        """Test stats for a database without contracts."""
+        stats = get_contract_confidence_stats(db_conn)
+        assert stats["average"] == 0.0
+        assert stats["distribution"]["below_50"] == 0
+
+    def test_stats_follow_inserts_and_upserts(self, db_conn):
+        """Test stats are refreshed when contracts change."""
+        self._add(db_conn, "a", 0.4)
+        assert get_contract_confidence_stats(db_conn)["distribution"]["below_50"] == 1
+
+        self._add(db_conn, "b", 0.95)
+        stats = get_contract_confidence_stats(db_conn)
+        assert stats["distribution"] == {"below_50": 1, "50_to_70": 0, "70_to_90": 0, "above_90": 1}
+
+        insert_contract(db_conn, function_id="test.py::a", contract_json="{}", confidence_score=0.8)
+        stats = get_contract_confidence_stats(db_conn)
+        assert stats["distribution"] == {"below_50": 0, "50_to_70": 0, "70_to_90": 1, "above_90": 1}
+        assert stats["average"] == 87.5
+
+    def test_stats_follow_upserts_in_one_transaction(self, tmp_path):
+        """Test stats see an upsert made in the same transaction."""
+        conn = duckdb.connect(str(tmp_path / "stats.duckdb"))
+        init_schema(conn)
+        conn.execute("BEGIN")
+        self._add(conn, "a", 0.2)
+        assert get_contract_confidence_stats(conn)["average"] == 20.0
+
+        insert_contract(conn, function_id="test.py::a", contract_json="{}", confidence_score=0.95)
+        stats = get_contract_confidence_stats(conn)
+        assert stats["average"] == 95.0
+        assert stats["distribution"]["above_90"] == 1
+        conn.execute("COMMIT")
+        conn.close()
+
 
 class TestQueueItemModel:
     """Tests for the QueueItem dataclass."""
@@ -800,6 +1091,33 @@ class TestQueueQueries:
         item = queue_get(db_conn, "test.py::foo")
         assert item.reason == "HASH_MISMATCH"
 
+    def test_queue_push_repeat_only_rewrites_on_change(self, db_conn):
+        """Test an identical re-push leaves the row alone but changes still apply."""
+        insert_artifact(
+            db_conn,
+            function_id="test.py::foo",
+            file_path="test.py",
+            function_name="foo",
+            signature="def foo():",
+            body="pass",
+            code_hash="abc",
+            language="python",
+            start_line=1,
+            end_line=2,
+        )
+        queue_push(db_conn, "test.py::foo", priority=50)
+        original = queue_get(db_conn, "test.py::foo")
+
+        queue_push(db_conn, "test.py::foo", priority=50)
+        assert queue_get(db_conn, "test.py::foo") == original
+
+        queue_push(db_conn, "test.py::foo", priority=10)
+        assert queue_get(db_conn, "test.py::foo").priority == 10
+
+        queue_complete(db_conn, "test.py::foo")
+        queue_push(db_conn, "test.py::foo", priority=10)
+        assert queue_get(db_conn, "test.py::foo").status == "PENDING"
+
     def test_queue_push_invalid_reason(self, db_conn):
         """Test pushing with invalid reason raises ValueError."""
         insert_artifact(
@@ -849,6 +1167,52 @@ class TestQueueQueries:
         item = queue_pop(db_conn)
         assert item.attempts == 2
 
+    def test_queue_pop_returns_stored_row(self, db_conn):
+        """Test pop claims the highest-priority item and returns it as stored."""
+        for name, priority in (("low", 200), ("high", 10)):
+            insert_artifact(
+                db_conn,
+                function_id=f"test.py::{name}",
+                file_path="test.py",
+                function_name=name,
+                signature=f"def {name}():",
+                body="pass",
+                code_hash=name,
+                language="python",
+                start_line=1,
+                end_line=2,
+            )
+            queue_push(db_conn, f"test.py::{name}", priority=priority)
+
+        item = queue_pop(db_conn)
+        assert item == queue_get(db_conn, "test.py::high")
+        assert item.status == "PROCESSING"
+        assert queue_get(db_conn, "test.py::low").status == "PENDING"
+
+    def test_queue_pop_many(self, db_conn):
+        """Test batch pop claims the top items in priority order."""
+        for i, priority in enumerate([30, 10, 20, 40]):
+            insert_artifact(
+                db_conn,
+                function_id=f"test.py::func{i}",
+                file_path="test.py",
+                function_name=f"func{i}",
+                signature=f"def func{i}():",
+                body="pass",
+                code_hash=f"hash{i}",
+                language="python",
+                start_line=1,
+                end_line=2,
+            )
+            queue_push(db_conn, f"test.py::func{i}", priority=priority)
+
+        items = queue_pop_many(db_conn, 3)
+
+        assert [item.priority for item in items] == [10, 20, 30]
+        assert all(item.status == "PROCESSING" and item.attempts == 1 for item in items)
+        assert [item.function_id for item in queue_pop_many(db_conn, 3)] == ["test.py::func3"]
+        assert queue_pop_many(db_conn, 3) == []
+
     def test_queue_pop_respects_max_attempts(self, db_conn):
         """Test pop doesn't return items that exceeded max attempts."""
         insert_artifact(
@@ -1104,6 +1468,18 @@ class TestQueueQueries:
         result = queue_remove(db_conn, "nonexistent::foo")
         assert result is False
 
+    @pytest.mark.parametrize(
+        "update",
+        [
+            lambda conn: queue_complete(conn, "nonexistent::foo"),
+            lambda conn: queue_retry(conn, "nonexistent::foo"),
+            lambda conn: queue_prioritize(conn, "nonexistent::foo", priority=1),
+        ],
+    )
+    def test_queue_update_not_found(self, db_conn, update):
+        """Test updating a non-existent item returns False."""
+        assert update(db_conn) is False
+
     def test_queue_count(self, db_conn):
         """Test counting queue items."""
         for i in range(5):
@@ -1155,6 +1531,7 @@ class TestQueueQueries:
         removed = queue_clear_completed(db_conn)
         assert removed == 2
         assert queue_count(db_conn) == 1
+        assert queue_clear_completed(db_conn) == 0
 
 
 class TestQueueReasonConstants:
@@ -1202,6 +1579,71 @@ class TestDependencyQueries:
         assert len(callers) == 1
         assert callers[0] == "test.py::foo"
 
+    def test_insert_dependencies_bulk(self, db_conn):
+        """Test bulk insert keeps timestamps and skips existing pairs."""
+        for name in ["foo", "bar", "baz"]:
+            insert_artifact(
+                db_conn,
+                function_id=f"test.py::{name}",
+                file_path="test.py",
+                function_name=name,
+                signature=f"def {name}():",
+                body="pass",
+                code_hash=f"hash_{name}",
+                language="python",
+                start_line=1,
+                end_line=2,
+            )
+        insert_dependency(db_conn, "test.py::foo", "test.py::bar")
+        recorded = datetime(2024, 1, 2, 3, 4, 5)
+
+        insert_dependencies(
+            db_conn,
+            [
+                ("test.py::foo", "test.py::bar", None),
+                ("test.py::foo", "test.py::baz", recorded),
+                ("test.py::baz", "test.py::baz", None),
+                ("test.py::baz", "test.py::baz", None),
+            ],
+        )
+        insert_dependencies(db_conn, [])
+
+        assert sorted(get_callees(db_conn, "test.py::foo")) == ["test.py::bar", "test.py::baz"]
+        assert sorted(get_callers(db_conn, "test.py::baz")) == ["test.py::baz", "test.py::foo"]
+        (created_at,) = db_conn.execute(
+            "SELECT created_at FROM dependencies WHERE callee_id = 'test.py::baz' AND caller_id = 'test.py::foo'"
+        ).fetchone()
+        assert created_at == recorded
+
+    def test_insert_dependencies_pairs(self, db_conn):
+        """Test bulk insert accepts plain (caller_id, callee_id) pairs."""
+        for name in ["foo", "bar", "baz"]:
+            insert_artifact(
+                db_conn,
+                function_id=f"test.py::{name}",
+                file_path="test.py",
+                function_name=name,
+                signature=f"def {name}():",
+                body="pass",
+                code_hash=f"hash_{name}",
+                language="python",
+                start_line=1,
+                end_line=2,
+            )
+
+        insert_dependencies(db_conn, [("test.py::foo", "test.py::bar"), ("test.py::foo", "test.py::baz")])
+
+        assert sorted(get_callees(db_conn, "test.py::foo")) == ["test.py::bar", "test.py::baz"]
+        (missing,) = db_conn.execute(
+            "SELECT COUNT(*) FROM dependencies WHERE created_at IS NULL"
+        ).fetchone()
+        assert missing == 0
+
+    def test_insert_dependencies_invalid_row(self, db_conn):
+        """Test bulk insert rejects rows with the wrong number of values."""
+        with pytest.raises(ValueError, match="Invalid dependency row"):
+            insert_dependencies(db_conn, [("test.py::foo",)])
+
 
 class TestReasoningTraceQueries:
     """Tests for reasoning trace query functions."""
@@ -1240,3 +1682,67 @@ class TestReasoningTraceQueries:
         proposer_traces = get_reasoning_traces(db_conn, "test.py::foo", agent="proposer")
         assert len(proposer_traces) == 1
         assert proposer_traces[0]["agent"] == "proposer"
+
+    def test_insert_reasoning_traces_bulk(self, db_conn):
+        """Test bulk insert assigns IDs in input order and keeps timestamps."""
+        insert_artifact(
+            db_conn,
+            function_id="test.py::foo",
+            file_path="test.py",
+            function_name="foo",
+            signature="def foo():",
+            body="pass",
+            code_hash="abc",
+            language="python",
+            start_line=1,
+            end_line=2,
+        )
+        recorded = datetime(2024, 1, 2, 3, 4, 5)
+
+        insert_reasoning_traces(
+            db_conn,
+            [
+                ("test.py::foo", "proposer", '{"step": 1}', recorded),
+                ("test.py::foo", "critic", '{"step": 2}', None),
+                ("test.py::foo", "judge", '{"step": 3}'),
+            ],
+        )
+        insert_reasoning_traces(db_conn, [])
+
+        rows = db_conn.execute(
+            "SELECT agent, created_at FROM reasoning_traces ORDER BY id"
+        ).fetchall()
+        assert [agent for agent, _ in rows] == ["proposer", "critic", "judge"]
+        assert rows[0][1] == recorded
+        assert rows[1][1] is not None
+        assert rows[2][1] is not None
+
+        with pytest.raises(ValueError, match="Invalid reasoning trace row"):
+            insert_reasoning_traces(db_conn, [("test.py::foo", "proposer")])
+
+    def test_get_reasoning_traces_arrow_matches_dicts(self, db_conn):
+        """Test the Arrow traces have the same rows as get_reasoning_traces."""
+        pytest.importorskip("pyarrow")
+        insert_artifact(
+            db_conn,
+            function_id="test.py::foo",
+            file_path="test.py",
+            function_name="foo",
+            signature="def foo():",
+            body="pass",
+            code_hash="abc",
+            language="python",
+            start_line=1,
+            end_line=2,
+        )
+        insert_reasoning_traces(
+            db_conn,
+            [
+                ("test.py::foo", "proposer", '{"step": 1}', datetime(2024, 1, 1)),
+                ("test.py::foo", "critic", '{"step": 2}', datetime(2024, 1, 2)),
+            ],
+        )
+
+        table = get_reasoning_traces_arrow(db_conn, "test.py::foo", agent="critic")
+
+        assert table.to_pylist() == get_reasoning_traces(db_conn, "test.py::foo", agent="critic")
@@ -10,6 +10,7 @@ from drspec.core.ide import (
     GitHubCopilotSetup,
     CodexSetup,
     IDE_REGISTRY,
+    get_ide_setup_class,
 )
 from drspec.core.ide.base import BaseIdeSetup
 
@@ -25,16 +26,16 @@ class TestAgentMetadata:
         """Test that each agent has required fields."""
         required_fields = {"name", "file", "display_name", "persona", "description"}
         for agent in AGENT_METADATA:
-            assert set(agent.keys()) == required_fields
+            assert set(agent._fields) == required_fields
 
     def test_agent_names_are_unique(self):
         """Test that agent names are unique."""
-        names = [agent["name"] for agent in AGENT_METADATA]
+        names = [agent.name for agent in AGENT_METADATA]
         assert len(names) == len(set(names))
 
     def test_expected_agents_present(self):
         """Test that expected agents are present."""
-        names = {agent["name"] for agent in AGENT_METADATA}
+        names = {agent.name for agent in AGENT_METADATA}
         expected = {"librarian", "proposer", "critic", "judge", "debugger", "vision-analyst"}
         assert names == expected
 
@@ -52,6 +53,15 @@ class TestIDERegistry:
         for ide_name, setup_class in IDE_REGISTRY.items():
             assert issubclass(setup_class, BaseIdeSetup)
 
+    def test_get_ide_setup_class_matches_registry(self):
+        """Test lazy per-IDE lookup returns the registered class."""
+        for ide_name, setup_class in IDE_REGISTRY.items():
+            assert get_ide_setup_class(ide_name) is setup_class
+
+    def test_get_ide_setup_class_unknown(self):
+        """Test lazy lookup returns None for unknown IDEs."""
+        assert get_ide_setup_class("notepad") is None
+
 
 class TestCursorSetup:
     """Tests for Cursor launcher generator."""
@@ -92,7 +102,7 @@ class TestCursorSetup:
         assert output_dir.exists()
 
         for agent in AGENT_METADATA:
-            filename = f"{agent['name']}.mdc"
+            filename = f"{agent.name}.mdc"
             assert (output_dir / filename).exists()
 
 
@@ -132,7 +142,7 @@ class TestClaudeCodeSetup:
         assert output_dir.exists()
 
         for agent in AGENT_METADATA:
-            filename = f"{agent['name']}.md"
+            filename = f"{agent.name}.md"
             assert (output_dir / filename).exists()
 
 
@@ -178,7 +188,7 @@ class TestGitHubCopilotSetup:
         assert output_dir.exists()
 
         for agent in AGENT_METADATA:
-            filename = f"drspec-{agent['name']}.agent.md"
+            filename = f"drspec-{agent.name}.agent.md"
             assert (output_dir / filename).exists()
 
 
@@ -231,9 +241,20 @@ class TestCodexSetup:
         assert output_dir.exists()
 
         for agent in AGENT_METADATA:
-            filename = f"drspec-{agent['name']}.md"
+            filename = f"drspec-{agent.name}.md"
             assert (output_dir / filename).exists()
 
+        assert created[0] == str(Path(".codex") / "prompts" / "drspec-librarian.md")
+
+    def test_setup_global_returns_absolute_paths(self, tmp_path: Path, monkeypatch):
+        """Test global setup reports absolute paths outside the project."""
+        home = tmp_path / "home"
+        monkeypatch.setattr(Path, "home", lambda: home)
+        setup = CodexSetup(global_install=True)
+        created = setup.setup(tmp_path / "project")
+
+        assert created[0] == str(home / ".codex" / "prompts" / "drspec-librarian.md")
+
 
 class TestBaseIdeSetupCleanup:
     """Tests for BaseIdeSetup cleanup functionality."""
@@ -273,3 +294,19 @@ class TestBaseIdeSetupCleanup:
         # Cleanup
         setup.cleanup(tmp_path)
         assert other_file.exists()
+
+    def test_get_file_extension_override_is_used(self, tmp_path: Path):
+        """Test setup and cleanup honor a subclass's get_file_extension()."""
+
+        class TextCursorSetup(CursorSetup):
+            def get_file_extension(self) -> str:
+                return ".txt"
+
+        setup = TextCursorSetup()
+        setup.setup(tmp_path)
+        output_dir = setup.get_output_dir(tmp_path)
+        assert len(list(output_dir.glob("*.txt"))) == 6
+        assert list(output_dir.glob("*.mdc")) == []
+
+        assert setup.cleanup(tmp_path) == 6
+        assert list(output_dir.glob("*.txt")) == []
@@ -17,7 +17,7 @@ from drspec.cli.commands.init import (
     copy_agent_templates,
 )
 from drspec.cli.output import success_response, error_response
-from drspec.core.resources import get_templates_path
+from drspec.core.resources import _resolve_templates_path, get_templates_path
 
 
 runner = CliRunner()
@@ -174,7 +174,7 @@ class TestGetTemplatesPath:
         """Test template path in PyInstaller frozen mode."""
         with patch("sys.frozen", True, create=True):
             with patch("sys._MEIPASS", "/tmp/meipass", create=True):
-                path = get_templates_path()
+                path = _resolve_templates_path()
                 assert str(path) == "/tmp/meipass/agents"
 
 
@@ -471,3 +471,32 @@ class TestEdgeCases:
         # Should only find the direct function as missing
         assert len(report.missing_contracts) == 1
         assert report.missing_contracts[0].relationship == "direct"
+
+    def test_shared_callee_reported_once_via_first_caller(self, db_conn):
+        """Should report a callee reached by two paths once, via the first caller."""
+        for name in ("top", "left", "right", "shared"):
+            _insert_test_artifact(
+                db_conn,
+                function_id=f"m::{name}",
+                file_path="m.py",
+                function_name=name,
+                signature=f"def {name}()",
+                body="pass",
+                code_hash=name,
+            )
+        insert_contract(db_conn, "m::top", "{}", 0.9)
+
+        # Diamond: top -> left/right -> shared
+        insert_dependency(db_conn, "m::top", "m::left")
+        insert_dependency(db_conn, "m::top", "m::right")
+        insert_dependency(db_conn, "m::right", "m::shared")
+        insert_dependency(db_conn, "m::left", "m::shared")
+
+        report = detect_missing_contracts(db_conn, "m::top", max_depth=3)
+
+        assert [(m.function_id, m.depth, m.priority) for m in report.missing_contracts] == [
+            ("m::left", 1, 1),
+            ("m::right", 1, 2),
+            ("m::shared", 2, 3),
+        ]
+        assert "via left" in report.missing_contracts[2].reason
@@ -4,14 +4,25 @@ import tempfile
 from pathlib import Path
 from unittest.mock import patch
 
+import pytest
 
 from drspec.core.ide.prompts import (
+    clear_detection_caches,
+    detect_existing_ides,
     detect_project_root,
     prompt_project_root,
     PROJECT_ROOT_MARKERS,
 )
 
 
+@pytest.fixture(autouse=True)
+def _clear_detection_caches():
+    """Keep cached detection results from leaking between tests."""
+    clear_detection_caches()
+    yield
+    clear_detection_caches()
+
+
 class TestProjectRootMarkers:
     """Tests for project root markers constant."""
 
@@ -116,6 +127,52 @@ class TestDetectProjectRoot:
             assert detected == root
 
 
+    def test_result_is_cached_until_cleared(self):
+        """Test that detection is memoized per cwd until caches are cleared."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir).resolve()
+            (root / ".git").mkdir()
+            subdir = root / "src"
+            subdir.mkdir()
+            (subdir / "package.json").touch()
+
+            assert detect_project_root(subdir) == subdir
+
+            (subdir / "package.json").unlink()
+            assert detect_project_root(subdir) == subdir
+
+            clear_detection_caches()
+            assert detect_project_root(subdir) == root
+
+
+class TestDetectExistingIdes:
+    """Tests for detect_existing_ides function."""
+
+    def test_detects_config_folders(self, tmp_path, monkeypatch):
+        """Test detection of IDE config folders in the project."""
+        monkeypatch.setattr(Path, "home", lambda: tmp_path / "home")
+        (tmp_path / ".cursor").mkdir()
+        (tmp_path / ".github").mkdir()
+
+        assert detect_existing_ides(tmp_path) == ["cursor", "github-copilot"]
+
+    def test_detects_global_codex(self, tmp_path, monkeypatch):
+        """Test detection of a global ~/.codex folder."""
+        home = tmp_path / "home"
+        (home / ".codex").mkdir(parents=True)
+        monkeypatch.setattr(Path, "home", lambda: home)
+
+        assert detect_existing_ides(tmp_path / "project") == ["codex"]
+
+    def test_sees_folders_created_later(self, tmp_path, monkeypatch):
+        """Test detection reflects config folders created after a first call."""
+        monkeypatch.setattr(Path, "home", lambda: tmp_path / "home")
+        assert detect_existing_ides(tmp_path) == []
+
+        (tmp_path / ".claude").mkdir()
+        assert detect_existing_ides(tmp_path) == ["claude-code"]
+
+
 class TestPromptProjectRoot:
     """Tests for prompt_project_root function."""
 
@@ -353,6 +353,25 @@ class TestIdentifyRootCause:
         assert report_current.source_is_current is True
         assert report_stale.source_is_current is False
 
+    def test_uses_precomputed_current_hash(self):
+        """Should compare a caller-supplied source hash instead of rehashing."""
+        violation = ViolationDetail(
+            invariant_name="test",
+            invariant_logic="logic",
+            criticality="HIGH",
+        )
+
+        report = identify_root_cause(
+            function_id="test::func",
+            file_path="test.py",
+            source_code=SAMPLE_CODE_NULL,
+            violation=violation,
+            stored_hash="abc",
+            current_hash="abc",
+        )
+
+        assert report.source_is_current is True
+
     def test_generates_recommendation(self):
         """Should generate fix recommendation."""
         violation = ViolationDetail(
@@ -131,6 +131,25 @@ def helper():
                 assert response["data"]["files_scanned"] == 2
                 assert response["data"]["functions_found"] == 2
 
+    def test_scan_parallel_jobs(self):
+        """Test directory scanning with parallel parser processes."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with runner.isolated_filesystem(temp_dir=tmpdir):
+                # Initialize
+                runner.invoke(app, ["init"])
+
+                Path("src").mkdir()
+                Path("src/module.py").write_text('def foo(): pass')
+                Path("src/engine.py").write_text('def bar(): pass')
+
+                result = runner.invoke(app, ["scan", "--jobs", "2", "src"])
+
+                assert result.exit_code == 0
+                response = json.loads(result.output)
+                assert response["success"] is True
+                assert response["data"]["files_scanned"] == 2
+                assert response["data"]["functions_found"] == 2
+
     def test_scan_non_recursive(self):
         """Test non-recursive directory scanning."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -1,6 +1,8 @@
 """Tests for the unified function extraction engine."""
 
+import os
 import tempfile
+import types
 from pathlib import Path
 
 import pytest
@@ -122,12 +124,40 @@ class TestLanguageDetection:
         assert scanner.detect_language("data.json") is None
         assert scanner.detect_language("image.png") is None
 
+    def test_detect_uses_file_name_only(self, scanner):
+        """Test that only the final path component's suffix is used."""
+        assert scanner.detect_language("pkg.py/README") is None
+        assert scanner.detect_language(Path("src") / "Main.PY") == "python"
+        assert scanner.detect_language(".py") is None
+
     def test_is_supported(self, scanner):
         """Test is_supported method."""
         assert scanner.is_supported("main.py") is True
         assert scanner.is_supported("readme.md") is False
 
 
+class TestParserLoading:
+    """Tests for lazy parser creation."""
+
+    def test_parsers_created_on_first_use(self, scanner, temp_project):
+        """Test that only parsers for scanned languages are created."""
+        scanner.scan_file(temp_project / "main.py", relative_to=temp_project)
+        assert set(scanner._parsers) == {"python"}
+
+        scanner.scan_file(temp_project / "app.js", relative_to=temp_project)
+        assert set(scanner._parsers) == {"python", "javascript"}
+
+
+    def test_get_parser_switches_languages(self, scanner):
+        """Test that the last-parser cache returns the right parser per language."""
+        python_parser = scanner._get_parser("python")
+        assert scanner._get_parser("python") is python_parser
+
+        js_parser = scanner._get_parser("javascript")
+        assert js_parser is not python_parser
+        assert scanner._get_parser("python") is python_parser
+        assert scanner._get_parser("cobol") is None
+
 class TestIgnorePatterns:
     """Tests for ignore pattern handling."""
 
@@ -155,6 +185,28 @@ class TestIgnorePatterns:
         main_path = temp_project / "main.py"
         assert scanner.should_ignore(main_path, temp_project) is False
 
+    def test_added_pattern_applies_to_should_ignore(self, scanner, temp_project):
+        """Test that patterns added later are used for matching."""
+        log_path = temp_project / "logs" / "app.log"
+        assert scanner.should_ignore(log_path, temp_project) is False
+
+        scanner.add_ignore_pattern("*.log")
+        assert scanner.should_ignore(log_path, temp_project) is True
+
+    def test_empty_ignore_patterns_ignore_nothing(self, temp_project):
+        """Test that an empty pattern list ignores nothing."""
+        scanner = Scanner(ignore_patterns=[])
+        git_path = temp_project / ".git" / "config"
+        assert scanner.should_ignore(git_path, temp_project) is False
+
+    def test_literal_and_glob_patterns_mixed(self, tmp_path):
+        """Test literal names and glob patterns both match nested parents."""
+        scanner = Scanner(ignore_patterns=["vendor", "build-*"])
+        assert scanner.should_ignore(tmp_path / "a" / "vendor" / "x.py", tmp_path) is True
+        assert scanner.should_ignore(tmp_path / "build-debug" / "x.py", tmp_path) is True
+        assert scanner.should_ignore(tmp_path / "vendored" / "x.py", tmp_path) is False
+        assert scanner.should_ignore(tmp_path / "src" / "build.py", tmp_path) is False
+
     def test_custom_ignore_patterns(self):
         """Test custom ignore patterns."""
         scanner = Scanner(ignore_patterns=["*.test.py", "vendor"])
@@ -181,6 +233,14 @@ class TestScanFile:
         assert hello_func.function_id == "main.py::hello"
         assert hello_func.language == "python"
 
+    def test_scan_file_relative_paths(self, scanner, temp_project):
+        """Test relative paths for nested files and files outside the base."""
+        nested = scanner.scan_file(temp_project / "lib" / "helper.py", relative_to=temp_project)
+        assert nested.functions[0].file_path == str(Path("lib") / "helper.py")
+
+        outside = scanner.scan_file(temp_project / "main.py", relative_to=temp_project / "lib")
+        assert outside.functions[0].file_path == str((temp_project / "main.py").resolve())
+
     def test_scan_javascript_file(self, scanner, temp_project):
         """Test scanning a JavaScript file."""
         result = scanner.scan_file(temp_project / "app.js", relative_to=temp_project)
@@ -218,6 +278,15 @@ class TestScanFile:
         assert result.files_skipped == 1
         assert len(result.functions) == 0
 
+    def test_scan_path_uses_given_source(self, scanner, temp_project):
+        """Test that supplied source is parsed without opening the file."""
+        missing = str(temp_project / "missing.py")
+
+        result = scanner._scan_path(missing, "missing.py", "python", source="def given():\n    pass\n")
+
+        assert result.errors == []
+        assert [f.name for f in result.functions] == ["given"]
+
     def test_scan_nonexistent_file(self, scanner, temp_project):
         """Test scanning a file that doesn't exist."""
         result = scanner.scan_file(temp_project / "nonexistent.py", relative_to=temp_project)
@@ -259,6 +328,97 @@ class TestScanDirectory:
         assert not any("node_modules" in fid for fid in function_ids)
         assert not any(".git" in fid for fid in function_ids)
 
+    def test_scan_directory_reports_relative_paths(self, scanner, temp_project):
+        """Test that nested files are reported relative to the scan root."""
+        result = scanner.scan_directory(temp_project, recursive=True)
+
+        helper = next(f for f in result.functions if f.name == "helper_func")
+        assert helper.file_path == str(Path("lib") / "helper.py")
+        assert helper.function_id == f"{Path('lib') / 'helper.py'}::helper_func"
+
+    def test_scan_directory_parallel_matches_sequential(self, scanner, temp_project):
+        """Test that a process-pool scan returns the same results in order."""
+        sequential = scanner.scan_directory(temp_project, recursive=True)
+        parallel = scanner.scan_directory(temp_project, recursive=True, max_workers=2)
+
+        assert [f.function_id for f in parallel.functions] == [
+            f.function_id for f in sequential.functions
+        ]
+        assert parallel.files_scanned == sequential.files_scanned
+        assert parallel.errors == sequential.errors
+
+    def test_prefetched_scan_keeps_order_and_errors(self, scanner, tmp_path):
+        """Test that read-ahead scanning preserves file order and read errors."""
+        files = []
+        for i in range(40):
+            path = tmp_path / f"mod{i}.py"
+            path.write_text(f"def func{i}():\n    pass\n")
+            files.append((str(path), path.name, "python"))
+        files.insert(5, (str(tmp_path / "gone.py"), "gone.py", "python"))
+        latin = tmp_path / "latin.py"
+        latin.write_bytes(b"# caf\xe9\n")
+        files.insert(10, (str(latin), latin.name, "python"))
+
+        results = list(scanner._iter_prefetched_scan_results(files))
+
+        assert len(results) == 42
+        assert results[5].errors == [("gone.py", "File not found")]
+        assert results[10].errors[0][0] == "latin.py"
+        names = [r.functions[0].name for r in results if r.functions]
+        assert names == [f"func{i}" for i in range(40)]
+
+    def test_scan_directory_streaming(self, scanner, temp_project):
+        """Test that streaming hands every function to the sink without retaining it."""
+        streamed = []
+        result = scanner.scan_directory_streaming(temp_project, streamed.append)
+
+        expected = scanner.scan_directory(temp_project)
+        assert [f.function_id for f in streamed] == [f.function_id for f in expected.functions]
+        assert result.functions == []
+        assert result.files_scanned == expected.files_scanned
+
+    def test_scan_directory_prunes_nested_ignored_dirs(self, scanner, temp_project):
+        """Test that ignored directories below the root are not descended into."""
+        cache_dir = temp_project / "lib" / "__pycache__" / "deep"
+        cache_dir.mkdir(parents=True)
+        (cache_dir / "cached.py").write_text("def cached():\n    pass\n")
+
+        files = list(scanner._iter_files(temp_project, recursive=True))
+
+        assert temp_project / "lib" / "helper.py" in files
+        assert not any("__pycache__" in f.parts for f in files)
+
+    def test_iter_entries_supported_only(self, scanner, temp_project):
+        """Test that the supported-only walk drops other files but not directories."""
+        (temp_project / "README.md").write_text("# readme\n")
+        (temp_project / "lib" / "Upper.PY").write_text("def upper():\n    pass\n")
+
+        names = {entry.name for entry, _ in scanner._iter_entries(temp_project, True, supported_only=True)}
+
+        assert "README.md" not in names
+        assert {"main.py", "helper.py", "Upper.PY"} <= names
+
+    def test_scan_directory_does_not_follow_dir_symlinks(self, scanner, temp_project):
+        """Test that symlinked directories are not followed."""
+        try:
+            (temp_project / "lib_link").symlink_to(temp_project / "lib", target_is_directory=True)
+        except (OSError, NotImplementedError):
+            pytest.skip("symlinks not supported")
+
+        files = list(scanner._iter_files(temp_project, recursive=True))
+
+        assert not any("lib_link" in f.parts for f in files)
+
+    def test_scan_directory_lists_each_directory_once(self, scanner, temp_project, monkeypatch):
+        """Test that directories with an already seen (dev, inode) are skipped."""
+        # Every directory looks like the root, as in a bind-mount loop
+        monkeypatch.setattr(os, "stat", lambda path, *args, **kwargs: types.SimpleNamespace(st_dev=1, st_ino=1))
+
+        files = list(scanner._iter_files(temp_project, recursive=True))
+
+        assert temp_project / "main.py" in files
+        assert temp_project / "lib" / "helper.py" not in files
+
     def test_scan_directory_progress_callback(self, scanner, temp_project):
         """Test progress callback during scanning."""
         progress_updates = []
@@ -314,6 +474,27 @@ class TestScanFunctionModel:
         assert scanned.language == "python"
         assert scanned.is_method is True
         assert "staticmethod" in scanned.decorators
+        assert scanned.decorators is not extracted.decorators
+
+    def test_scanned_function_from_extracted_shares_decorators(self):
+        """Test that decorators can be handed over without a copy."""
+        from drspec.parsers.models import ExtractedFunction
+
+        extracted = ExtractedFunction(
+            name="test",
+            qualified_name="test",
+            signature="def test():",
+            body="def test():\n    pass",
+            start_line=1,
+            end_line=2,
+            decorators=["cache"],
+        )
+
+        scanned = ScannedFunction.from_extracted(
+            extracted, "module.py", "python", copy_decorators=False
+        )
+
+        assert scanned.decorators is extracted.decorators
 
 
 class TestConvenienceFunctions:
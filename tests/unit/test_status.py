@@ -22,7 +22,10 @@ from drspec.core.status import (
     mark_pending,
     get_file_status_summary,
     get_language_status_summary,
+    get_all_file_status_summaries,
+    get_all_language_status_summaries,
     bulk_update_status,
+    bulk_update_statuses,
     reset_stale_to_pending,
     reset_broken_to_pending,
 )
@@ -144,6 +147,28 @@ class TestGetStatusSummary:
         assert summary.broken == 0
 
 
+    def test_total_includes_unknown_statuses(self, db_conn):
+        """Test that total counts artifacts whatever their status value."""
+        create_artifact(db_conn, "verified1", status="VERIFIED")
+        create_artifact(db_conn, "odd1")
+        db_conn.execute("UPDATE artifacts SET status = NULL WHERE function_id = 'test.py::odd1'")
+
+        summary = get_status_summary(db_conn)
+
+        assert summary.total == 2
+        assert summary.verified == 1
+        assert summary.pending == 0
+
+    def test_database_without_status_view(self, db_conn):
+        """Test that databases created before the status view still work."""
+        create_artifact(db_conn, "verified1", status="VERIFIED")
+        db_conn.execute("DROP VIEW v_artifact_status_counts")
+
+        summary = get_status_summary(db_conn)
+
+        assert summary.total == 1
+        assert summary.verified == 1
+
 class TestGetArtifactsByStatus:
     """Tests for get_artifacts_by_status function."""
 
@@ -272,6 +297,20 @@ class TestFileSummary:
         assert summary.pending == 1
 
 
+    def test_file_summary_counts_beyond_list_limit(self, db_conn):
+        """Test that file summaries are not capped by list_artifacts' limit."""
+        db_conn.execute(
+            """INSERT INTO artifacts (function_id, file_path, function_name, signature,
+                                      body, code_hash, language, start_line, end_line)
+               SELECT 'big.py::f' || i, 'big.py', 'f' || i, 'def f():', 'pass', 'h', 'python', 1, 2
+               FROM range(10050) t(i)"""
+        )
+
+        summary = get_file_status_summary(db_conn, "big.py")
+
+        assert summary.total == 10050
+        assert summary.pending == 10050
+
 class TestLanguageSummary:
     """Tests for get_language_status_summary."""
 
@@ -288,6 +327,36 @@ class TestLanguageSummary:
         assert summary.pending == 1
 
 
+class TestAllStatusSummaries:
+    """Tests for get_all_file_status_summaries / get_all_language_status_summaries."""
+
+    def test_all_file_summaries(self, db_conn):
+        """Test per-file summaries match the single-file summary."""
+        create_artifact(db_conn, "foo", file_path="src/utils.py", status="VERIFIED")
+        create_artifact(db_conn, "bar", file_path="src/utils.py", status="PENDING")
+        create_artifact(db_conn, "baz", file_path="app.py", status="STALE")
+
+        summaries = get_all_file_status_summaries(db_conn)
+
+        assert list(summaries) == ["app.py", "src/utils.py"]
+        assert summaries["src/utils.py"] == get_file_status_summary(db_conn, "src/utils.py")
+        assert summaries["app.py"].stale == 1
+
+    def test_all_language_summaries(self, db_conn):
+        """Test per-language summaries."""
+        create_artifact(db_conn, "foo", language="python", status="VERIFIED")
+        create_artifact(db_conn, "bar", file_path="test.js", language="javascript")
+
+        summaries = get_all_language_status_summaries(db_conn)
+
+        assert summaries["python"].verified == 1
+        assert summaries["javascript"].pending == 1
+        assert summaries["javascript"].total == 1
+
+    def test_empty_database(self, db_conn):
+        """Test no artifacts gives no groups."""
+        assert get_all_file_status_summaries(db_conn) == {}
+
 class TestBulkUpdate:
     """Tests for bulk_update_status."""
 
@@ -307,12 +376,47 @@ class TestBulkUpdate:
         assert len(get_artifacts_by_status(db_conn, "VERIFIED")) == 2
         assert len(get_artifacts_by_status(db_conn, "PENDING")) == 1
 
+    def test_bulk_update_skips_unknown_ids(self, db_conn):
+        """Test that only existing artifacts are counted as updated."""
+        create_artifact(db_conn, "foo")
+
+        assert bulk_update_status(db_conn, ["test.py::foo", "test.py::missing"], "STALE") == 1
+        assert bulk_update_status(db_conn, [], "STALE") == 0
+        assert len(get_artifacts_by_status(db_conn, "STALE")) == 1
+
     def test_bulk_update_invalid_status(self, db_conn):
         """Test bulk update with invalid status raises ValueError."""
         with pytest.raises(ValueError, match="Invalid status"):
             bulk_update_status(db_conn, ["test.py::foo"], "INVALID")
 
 
+    def test_bulk_update_mixed_statuses(self, db_conn):
+        """Test per-artifact statuses are applied in one batch."""
+        create_artifact(db_conn, "foo")
+        create_artifact(db_conn, "bar")
+
+        updated = bulk_update_statuses(
+            db_conn,
+            [
+                ("test.py::foo", "VERIFIED"),
+                ("test.py::bar", "STALE"),
+                ("test.py::bar", "BROKEN"),
+                ("test.py::missing", "STALE"),
+            ],
+        )
+
+        assert updated == 2
+        assert [a.function_id for a in get_artifacts_by_status(db_conn, "VERIFIED")] == ["test.py::foo"]
+        assert [a.function_id for a in get_artifacts_by_status(db_conn, "BROKEN")] == ["test.py::bar"]
+
+    def test_bulk_update_mixed_invalid_status(self, db_conn):
+        """Test an invalid status anywhere in the batch raises before updating."""
+        create_artifact(db_conn, "foo")
+
+        with pytest.raises(ValueError, match="Invalid status"):
+            bulk_update_statuses(db_conn, [("test.py::foo", "BAD"), ("test.py::foo", "VERIFIED")])
+        assert len(get_artifacts_by_status(db_conn, "PENDING")) == 1
+
 class TestResetFunctions:
     """Tests for reset_* functions."""
 
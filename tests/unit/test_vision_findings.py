@@ -13,6 +13,7 @@ from drspec.db import (
     update_vision_finding_status,
     count_vision_findings,
     calculate_confidence_with_findings,
+    get_vision_finding_penalties,
     VisionFinding,
     VALID_FINDING_TYPES,
     VALID_FINDING_SIGNIFICANCE,
@@ -121,6 +122,25 @@ class TestInsertVisionFinding:
         assert findings[0].invariant_implication == "Add boundary check"
         assert findings[0].plot_path == "_drspec/plots/plot_abc123.png"
 
+    def test_returns_id_of_each_inserted_finding(self, db_with_artifact):
+        """Should return the stored ID of each new finding."""
+        finding_ids = [
+            insert_vision_finding(
+                db_with_artifact,
+                function_id="src/test.py::test_func",
+                finding_type="outlier",
+                significance="LOW",
+                description=f"Finding {i}",
+            )
+            for i in range(3)
+        ]
+
+        findings = get_vision_findings(db_with_artifact, "src/test.py::test_func")
+        assert len(set(finding_ids)) == 3
+        assert {f.id: f.description for f in findings} == {
+            finding_id: f"Finding {i}" for i, finding_id in enumerate(finding_ids)
+        }
+
     def test_default_status_is_new(self, db_with_artifact):
         """Should set default status to NEW."""
         insert_vision_finding(
@@ -525,3 +545,38 @@ class TestCalculateConfidenceWithFindings:
         confidence = calculate_confidence_with_findings(85, findings)
 
         assert confidence == 70  # Only penalize the NEW one: 85 - 15
+
+
+class TestGetVisionFindingPenalties:
+    """Tests for get_vision_finding_penalties function."""
+
+    def test_matches_per_function_calculation(self, db_with_artifact):
+        """Should agree with calculate_confidence_with_findings for NEW findings."""
+        for significance in ("HIGH", "MEDIUM", "LOW", "LOW"):
+            insert_vision_finding(
+                db_with_artifact,
+                function_id="src/test.py::test_func",
+                finding_type="outlier",
+                significance=significance,
+                description=f"{significance} finding",
+            )
+        ignored_id = insert_vision_finding(
+            db_with_artifact,
+            function_id="src/test.py::test_func",
+            finding_type="outlier",
+            significance="HIGH",
+            description="Ignored finding",
+        )
+        update_vision_finding_status(db_with_artifact, ignored_id, "IGNORED")
+
+        penalties = get_vision_finding_penalties(
+            db_with_artifact, ["src/test.py::test_func", "src/test.py::other"]
+        )
+        findings = get_vision_findings(db_with_artifact, "src/test.py::test_func")
+
+        assert penalties == {"src/test.py::test_func": (29, 4)}
+        assert calculate_confidence_with_findings(85, findings) == 85 - 29
+
+    def test_empty_function_ids(self, db_with_artifact):
+        """Should return an empty dict without querying."""
+        assert get_vision_finding_penalties(db_with_artifact, []) == {}